@@ -1,18 +1,20 @@
 from django.contrib import admin
-from .models import Content, Season, Episode
+from .models import Content, Season, Episode, TmdbTitle
 
 
 @admin.register(Content)
 class ContentAdmin(admin.ModelAdmin):
-    list_display = ('title', 'type', 'owner', 'status', 'created_at')
+    list_display = ('title', 'type', 'owner', 'status', 'watched_episodes', 'total_episodes', 'created_at')
     list_filter = ('type', 'status', 'platform', 'owner')
     search_fields = ('title', 'tmdb_id', 'overview', 'owner__username')
+    readonly_fields = ('watched_episodes', 'total_episodes')
     ordering = ('-created_at',)
 
 
 @admin.register(Season)
 class SeasonAdmin(admin.ModelAdmin):
-    list_display = ('content', 'season_number', 'episodes_count')
+    list_display = ('content', 'season_number', 'episodes_count', 'watched_episodes')
+    readonly_fields = ('watched_episodes',)
     list_filter = ('content',)
     ordering = ('content', 'season_number')
 
@@ -23,3 +25,11 @@ class EpisodeAdmin(admin.ModelAdmin):
     list_filter = ('season__content', 'season')
     search_fields = ('season__content__title',)
     ordering = ('season', 'episode_number')
+
+
+@admin.register(TmdbTitle)
+class TmdbTitleAdmin(admin.ModelAdmin):
+    list_display = ('title', 'media_type', 'tmdb_id', 'fetched_at')
+    list_filter = ('media_type',)
+    search_fields = ('title', 'tmdb_id')
+    ordering = ('-fetched_at',)
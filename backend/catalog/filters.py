@@ -0,0 +1,18 @@
+from rest_framework.filters import BaseFilterBackend
+
+from .services.library_search import search_contents
+
+
+class LibrarySearchFilter(BaseFilterBackend):
+    """
+    ?search=<words> full-text search over title and overview, best match
+    first (see services.library_search). Combines with the field filters,
+    e.g. ?search=dark&type=tv&status=watching.
+    """
+    search_param = "search"
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "").strip()
+        if not query:
+            return queryset
+        return search_contents(queryset, query)
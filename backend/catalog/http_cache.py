@@ -0,0 +1,71 @@
+"""
+HTTP caching helpers for catalog views.
+
+- Public TMDB proxy responses are shared-cacheable (browser + CDN) for the
+  TTL of the upstream cache tier they come from.
+- Per-user endpoints are validated with an ETag derived from the user's
+  library version, so an unchanged library answers 304 after a single
+  index-only query, with no page query or serialization.
+"""
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from catalog.services.library import library_version
+from catalog.services.tmdb_cache import class_ttl, is_error_payload
+
+
+def shared_cache(response, data, endpoint: str):
+    """
+    Cache-Control for a public proxy response. Error payloads (and 5xx)
+    must not be cached downstream.
+    """
+    if response.status_code == 200 and not _has_errors(data):
+        ttl = class_ttl(endpoint)
+        patch_cache_control(response, public=True, max_age=ttl, stale_while_revalidate=ttl)
+    else:
+        patch_cache_control(response, no_store=True)
+    return response
+
+
+def _has_errors(data) -> bool:
+    if is_error_payload(data):
+        return True
+    # aggregated payloads (home feed) degrade per section
+    return any("error" in section for section in data.get("sections", {}).values())
+
+
+def library_etag(user, version=None) -> str:
+    if version is None:
+        version = library_version(user.pk)
+    return f'W/"lib-{user.pk}-{version}"'
+
+
+def conditional_library_response(request, respond, version=None):
+    """
+    Serve a per-user GET through the library validator: 304 when the client
+    already holds the current version, otherwise respond() with the ETag.
+    Pass version when the caller has already read it.
+    """
+    etag = library_etag(request.user, version)
+
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match:
+        # weak comparison, as for GET/HEAD in RFC 9110
+        candidates = {e.removeprefix("W/") for e in parse_etags(if_none_match)}
+        if "*" in candidates or etag.removeprefix("W/") in candidates:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            return _private(response, etag)
+
+    response = respond()
+    if response.status_code == 200:
+        _private(response, etag)
+    return response
+
+
+def _private(response, etag):
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ("Authorization",))
+    return response
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from catalog.models import Content
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized episode progress counters on Content and Season."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="Only rebuild counters for this username")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted rows without writing",
+        )
+
+    def handle(self, *args, **options):
+        qs = Content.objects.filter(type="tv").order_by("pk")
+        if options["user"]:
+            qs = qs.filter(owner__username=options["user"])
+
+        checked = drifted = 0
+        for content in qs.iterator():
+            checked += 1
+            drift = content.progress_drift()
+            if not drift:
+                continue
+
+            drifted += 1
+            changes = ", ".join(f"{name} {stored} -> {live}" for name, (stored, live) in drift.items())
+            self.stdout.write(f"{content.pk}: {changes}")
+            if not options["dry_run"]:
+                content.recalculate_progress()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {checked} titles, {drifted} had drifted counters"
+        ))
@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from catalog.services.tmdb_warm import warm
+
+
+class Command(BaseCommand):
+    help = (
+        "Prefetch the TMDB list endpoints and the details of their top titles "
+        "into the cache / metadata store (e.g. right after a deploy)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=20, help="Detail pages to prefetch (default 20)")
+        parser.add_argument("--workers", type=int, default=8, help="Concurrent fetches (default 8)")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Refetch entries that are still fresh",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            help="Keep running, refreshing everything every INTERVAL seconds",
+        )
+
+    def handle(self, *args, **options):
+        force = options["force"]
+        while True:
+            self.run_once(options["top"], options["workers"], force, options["verbosity"])
+            if not options["interval"]:
+                return
+
+            # later rounds must replace entries before they expire
+            force = True
+            close_old_connections()
+            time.sleep(options["interval"])
+
+    def run_once(self, top_n, workers, force, verbosity=1):
+        start = time.perf_counter()
+        reports = warm(top_n=top_n, workers=workers, force=force)
+        elapsed = time.perf_counter() - start
+
+        verbose = verbosity > 1
+        for r in reports:
+            if verbose or not r["ok"]:
+                state = "ok" if r["ok"] else "FAILED"
+                self.stdout.write(f"  {r['name']:<28} {state:<6} {r['ms']:>8.1f} ms {r['bytes']:>9} B")
+
+        ok = [r for r in reports if r["ok"]]
+        style = self.style.SUCCESS if len(ok) == len(reports) else self.style.WARNING
+        self.stdout.write(style(
+            f"Warmed {len(ok)}/{len(reports)} TMDB entries "
+            f"({sum(r['bytes'] for r in ok) / 1024:.1f} KiB) in {elapsed:.2f}s"
+        ))
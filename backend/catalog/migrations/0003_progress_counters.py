@@ -0,0 +1,53 @@
+# Generated by Django 6.0 on 2026-10-18 16:33
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_counters(apps, schema_editor):
+    Content = apps.get_model('catalog', 'Content')
+    Season = apps.get_model('catalog', 'Season')
+
+    for content in Content.objects.filter(type='tv').iterator():
+        seasons = list(
+            Season.objects.filter(content=content).annotate(
+                live_watched=Count('episodes', filter=Q(episodes__watched=True))
+            )
+        )
+        for s in seasons:
+            Season.objects.filter(pk=s.pk).update(watched_episodes=s.live_watched)
+
+        if not seasons or any(s.episodes_count is None for s in seasons):
+            total = None
+        else:
+            total = sum(s.episodes_count for s in seasons)
+        Content.objects.filter(pk=content.pk).update(
+            watched_episodes=sum(s.live_watched for s in seasons),
+            total_episodes=total,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0002_wishlist'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='total_episodes',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='watched_episodes',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='season',
+            name='watched_episodes',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
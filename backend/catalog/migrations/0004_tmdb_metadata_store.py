@@ -0,0 +1,44 @@
+# Generated by Django 6.0 on 2026-10-18 16:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0003_progress_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TmdbTitle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('media_type', models.CharField(choices=[('movie', 'Movie'), ('tv', 'TV Show')], max_length=5)),
+                ('tmdb_id', models.PositiveIntegerField()),
+                ('title', models.CharField(blank=True, max_length=512)),
+                ('overview', models.TextField(blank=True)),
+                ('poster_path', models.CharField(blank=True, max_length=255)),
+                ('data', models.JSONField(default=dict)),
+                ('fetched_at', models.DateTimeField()),
+            ],
+            options={
+                'unique_together': {('media_type', 'tmdb_id')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TmdbSeason',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season_number', models.PositiveIntegerField()),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('episode_count', models.PositiveIntegerField(default=0)),
+                ('title', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seasons', to='catalog.tmdbtitle')),
+            ],
+            options={
+                'ordering': ['season_number'],
+                'unique_together': {('title', 'season_number')},
+            },
+        ),
+    ]
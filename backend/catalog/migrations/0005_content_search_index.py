@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 17:05
+
+from django.db import migrations
+
+from catalog.services.library_search import install_search_index, remove_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_tmdb_metadata_store'),
+    ]
+
+    operations = [
+        # PostgreSQL: GIN index on a weighted tsvector of title + overview.
+        # SQLite: FTS5 table synced by triggers. No-op elsewhere.
+        migrations.RunPython(install_search_index, remove_search_index),
+    ]
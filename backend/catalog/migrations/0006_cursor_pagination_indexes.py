@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-18 15:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0005_content_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['owner', '-created_at', '-id'], name='content_owner_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wishlist',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='wishlist_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-18 15:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0006_cursor_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['owner', 'tmdb_id'], name='content_owner_tmdb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='episode',
+            index=models.Index(fields=['season', 'watched'], name='episode_season_watched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='episode',
+            index=models.Index(condition=models.Q(('watched', True)), fields=['season'], name='episode_watched_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 6.0 on 2026-10-18 16:05
+
+from django.db import migrations
+from django.db.models import Count, Q
+
+# furthest along wins when duplicates disagree
+STATUS_RANK = {'wishlist': 0, 'watching': 1, 'completed': 2}
+
+
+def merge_duplicates(apps, schema_editor):
+    """
+    Fold every group of same-owner, same-tmdb_id contents into its oldest
+    row, so the (owner, tmdb_id) unique constraint can be added: seasons
+    and episodes the keeper lacks are moved over, watched flags are OR-ed,
+    and empty fields are filled from the duplicates.
+    """
+    Content = apps.get_model('catalog', 'Content')
+    Season = apps.get_model('catalog', 'Season')
+    Episode = apps.get_model('catalog', 'Episode')
+
+    groups = (
+        Content.objects.exclude(tmdb_id__isnull=True).exclude(tmdb_id='')
+        .values('owner_id', 'tmdb_id')
+        .annotate(n=Count('id'))
+        .filter(n__gt=1)
+    )
+    for group in list(groups):
+        keeper, *duplicates = Content.objects.filter(
+            owner_id=group['owner_id'], tmdb_id=group['tmdb_id'],
+        ).order_by('created_at', 'id')
+
+        for dup in duplicates:
+            for season in Season.objects.filter(content=dup):
+                target = Season.objects.filter(content=keeper, season_number=season.season_number).first()
+                if target is None:
+                    Season.objects.filter(pk=season.pk).update(content=keeper)
+                    continue
+                if target.episodes_count is None:
+                    Season.objects.filter(pk=target.pk).update(episodes_count=season.episodes_count)
+                for episode in Episode.objects.filter(season=season):
+                    mine = Episode.objects.filter(season=target, episode_number=episode.episode_number)
+                    if not mine.exists():
+                        Episode.objects.filter(pk=episode.pk).update(season=target)
+                    elif episode.watched:
+                        mine.update(watched=True)
+
+            if STATUS_RANK.get(dup.status, 0) > STATUS_RANK.get(keeper.status, 0):
+                keeper.status = dup.status
+            for field in ('rating', 'review', 'platform', 'overview', 'poster_path'):
+                if not getattr(keeper, field) and getattr(dup, field):
+                    setattr(keeper, field, getattr(dup, field))
+            dup.delete()
+
+        keeper.save(update_fields=['status', 'rating', 'review', 'platform', 'overview', 'poster_path'])
+
+        # progress counters, as in 0003
+        seasons = list(
+            Season.objects.filter(content=keeper).annotate(
+                live_watched=Count('episodes', filter=Q(episodes__watched=True))
+            )
+        )
+        for s in seasons:
+            Season.objects.filter(pk=s.pk).update(watched_episodes=s.live_watched)
+        if not seasons:
+            total = keeper.total_episodes
+        elif any(s.episodes_count is None for s in seasons):
+            total = None
+        else:
+            total = sum(s.episodes_count for s in seasons)
+        Content.objects.filter(pk=keeper.pk).update(
+            watched_episodes=sum(s.live_watched for s in seasons),
+            total_episodes=total,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0007_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+    ]
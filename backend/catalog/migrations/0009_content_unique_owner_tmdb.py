@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-18 16:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0008_merge_duplicate_contents'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='content',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='content',
+            constraint=models.UniqueConstraint(condition=models.Q(('tmdb_id__isnull', False), models.Q(('tmdb_id', ''), _negated=True)), fields=('owner', 'tmdb_id'), name='content_unique_owner_tmdb'),
+        ),
+    ]
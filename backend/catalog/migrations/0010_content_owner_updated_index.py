@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-18 18:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0009_content_unique_owner_tmdb'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['owner', 'updated_at'], name='content_owner_updated_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Greatest
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 
@@ -19,55 +21,124 @@ class Content(models.Model):
     overview = models.TextField(blank=True)
     platform = models.CharField(max_length=128, blank=True)  # e.g., Netflix
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default='wishlist')
-    rating = models.PositiveSmallIntegerField(null=True, blank=True, validators=[MinValueValidator(1), MaxValueValidator(10)])
+    rating = models.PositiveSmallIntegerField(
+        null=True, blank=True, validators=[MinValueValidator(1), MaxValueValidator(10)]
+    )
     review = models.TextField(blank=True)
 
+    # Denormalized progress counters, maintained by Episode.toggle_watched,
+    # Season.mark_all_watched and the TMDB import (see recalculate_progress).
+    watched_episodes = models.PositiveIntegerField(default=0)
+    total_episodes = models.PositiveIntegerField(null=True, blank=True)  # null = unknown
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
-        unique_together = ('owner', 'tmdb_id', 'title')  # tmdb_id may be null - title+owner helps avoid duplicates
+        constraints = [
+            # one library entry per TMDB title; manual entries (no tmdb_id) are free
+            models.UniqueConstraint(
+                fields=['owner', 'tmdb_id'],
+                condition=models.Q(tmdb_id__isnull=False) & ~models.Q(tmdb_id=''),
+                name='content_unique_owner_tmdb',
+            ),
+        ]
+        indexes = [
+            # cursor pagination: one range scan per page of a user's library
+            models.Index(fields=['owner', '-created_at', '-id'], name='content_owner_created_idx'),
+            # import_tmdb / fetch_tmdb_show_and_create / bulk_import duplicate checks
+            models.Index(fields=['owner', 'tmdb_id'], name='content_owner_tmdb_idx'),
+            # library_version(): count + max(updated_at) from the index alone
+            models.Index(fields=['owner', 'updated_at'], name='content_owner_updated_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.get_type_display()})"
 
     # --- Convenience / aggregate methods ---
 
-    def total_episodes(self):
-        """
-        Returns total episodes across all seasons if season.episodes_count available,
-        otherwise returns None when counts are unknown.
-        """
-        seasons = self.seasons.all()
-        if not seasons.exists():
-            return None
-        total = 0
-        known = False
-        for s in seasons:
-            if s.episodes_count is None:
-                return None  # if any season count unknown, return None (we prefer explicit counts)
-            total += s.episodes_count
-            known = True
-        return total if known else None
-
     def watched_episodes_count(self):
         """
-        Count of episodes marked watched (Episode.watched=True).
+        Live count of episodes marked watched (Episode.watched=True).
+        Prefer the persisted `watched_episodes` counter for reads.
         """
         return Episode.objects.filter(season__content=self, watched=True).count()
 
     def progress_percent(self):
         """
         Returns integer percentage of episodes watched across show (0-100) or None if total unknown or not a TV show.
+        Reads the persisted counters only (no queries).
         """
         if self.type != 'tv':
             return None
-        total = self.total_episodes()
+        total = self.total_episodes
         if not total:
             return None
-        watched = self.watched_episodes_count()
-        return min(100, int((watched / total) * 100)) if total > 0 else None
+        return min(100, int((self.watched_episodes / total) * 100))
+
+    def recalculate_progress(self):
+        """
+        Rebuild the persisted progress counters of this content and its seasons
+        from the Episode table. Use after creating/removing seasons or when the
+        counters may have drifted.
+        """
+        with transaction.atomic():
+            seasons, self.watched_episodes, self.total_episodes = self._live_progress()
+            for s in seasons:
+                if s.watched_episodes != s.live_watched:
+                    Season.objects.filter(pk=s.pk).update(watched_episodes=s.live_watched)
+
+            Content.objects.filter(pk=self.pk).update(
+                watched_episodes=self.watched_episodes,
+                total_episodes=self.total_episodes,
+                updated_at=timezone.now(),  # changes the library version
+            )
+
+    def _live_progress(self):
+        """
+        (seasons annotated with live_watched, watched, total) computed from the
+        Episode table, i.e. the counters recalculate_progress stores.
+        """
+        seasons = list(
+            self.seasons.annotate(
+                live_watched=models.Count('episodes', filter=models.Q(episodes__watched=True))
+            ).order_by('season_number')
+        )
+        watched = sum(s.live_watched for s in seasons)
+        # total is unknown (None) when there are no seasons or any season count is unknown
+        if not seasons or any(s.episodes_count is None for s in seasons):
+            total = None
+        else:
+            total = sum(s.episodes_count for s in seasons)
+        return seasons, watched, total
+
+    def progress_drift(self):
+        """
+        The persisted counters that differ from their live values, as
+        {counter: (stored, live)}; empty when recalculate_progress would
+        change nothing.
+        """
+        seasons, watched, total = self._live_progress()
+        drift = {}
+        if self.watched_episodes != watched:
+            drift['watched'] = (self.watched_episodes, watched)
+        if self.total_episodes != total:
+            drift['total'] = (self.total_episodes, total)
+        for s in seasons:
+            if s.watched_episodes != s.live_watched:
+                drift[f'season {s.season_number} watched'] = (s.watched_episodes, s.live_watched)
+        return drift
+
+    def _add_watched(self, delta):
+        """
+        Atomically shift the watched counter by delta and refresh it in memory.
+        """
+        Content.objects.filter(pk=self.pk).update(
+            watched_episodes=Greatest(models.F('watched_episodes') + delta, 0),
+            updated_at=timezone.now(),  # changes the library version
+        )
+        self.refresh_from_db(fields=['watched_episodes', 'total_episodes'])
 
     def update_status_if_needed(self):
         """
@@ -78,8 +149,8 @@ class Content(models.Model):
         """
         if self.type != 'tv':
             return
-        total = self.total_episodes()
-        watched = self.watched_episodes_count()
+        total = self.total_episodes
+        watched = self.watched_episodes
         if total is None:
             # If total unknown, only change wishlist->watching when watched > 0
             if watched > 0 and self.status == 'wishlist':
@@ -104,6 +175,7 @@ class Season(models.Model):
     content = models.ForeignKey(Content, on_delete=models.CASCADE, related_name='seasons')
     season_number = models.PositiveIntegerField(validators=[MinValueValidator(1)])
     episodes_count = models.PositiveIntegerField(null=True, blank=True)  # optional
+    watched_episodes = models.PositiveIntegerField(default=0)  # denormalized counter
 
     class Meta:
         unique_together = ('content', 'season_number')
@@ -118,18 +190,25 @@ class Season(models.Model):
     def mark_all_watched(self):
         """
         Mark all episodes in this season as watched. Create Episode rows if episodes_count set and episodes missing.
+        Runs in one transaction: one bulk INSERT for missing episodes, one UPDATE,
+        then a single status propagation.
         """
-        # If episodes_count is known, ensure Episode rows exist
-        if self.episodes_count:
-            existing = self.episodes.count()
-            if existing < self.episodes_count:
-                # create missing episodes
-                for i in range(existing + 1, self.episodes_count + 1):
-                    Episode.objects.get_or_create(season=self, episode_number=i)
-        # mark all existing episodes watched
-        self.episodes.update(watched=True)
-        # propagate to parent content
-        self.content.update_status_if_needed()
+        with transaction.atomic():
+            # If episodes_count is known, ensure Episode rows exist (gaps included)
+            if self.episodes_count:
+                Episode.objects.bulk_create(
+                    [Episode(season=self, episode_number=i) for i in range(1, self.episodes_count + 1)],
+                    ignore_conflicts=True,
+                )
+            # mark all existing episodes watched
+            newly_watched = self.episodes.filter(watched=False).update(watched=True)
+            if newly_watched:
+                Season.objects.filter(pk=self.pk).update(
+                    watched_episodes=models.F('watched_episodes') + newly_watched
+                )
+                self.content._add_watched(newly_watched)
+            # propagate to parent content
+            self.content.update_status_if_needed()
 
 
 class Episode(models.Model):
@@ -144,6 +223,16 @@ class Episode(models.Model):
 
     class Meta:
         unique_together = ('season', 'episode_number')
+        indexes = [
+            # watched / unwatched counts and bulk updates per season
+            models.Index(fields=['season', 'watched'], name='episode_season_watched_idx'),
+            # only the watched minority, where partial indexes are supported
+            models.Index(
+                fields=['season'],
+                condition=models.Q(watched=True),
+                name='episode_watched_partial_idx',
+            ),
+        ]
         ordering = ['episode_number']
 
     def __str__(self):
@@ -152,12 +241,23 @@ class Episode(models.Model):
 
     def toggle_watched(self):
         """
-        Toggle watched flag and update parent content status per rules.
+        Toggle watched flag, keep the progress counters in sync and update
+        parent content status per rules.
         """
-        self.watched = not self.watched
-        self.save(update_fields=['watched'])
-        # propagate to parent content
-        self.season.content.update_status_if_needed()
+        with transaction.atomic():
+            # re-read under a row lock so concurrent toggles can't double count
+            current = Episode.objects.select_for_update().values_list('watched', flat=True).get(pk=self.pk)
+            self.watched = not current
+            self.save(update_fields=['watched'])
+
+            delta = 1 if self.watched else -1
+            Season.objects.filter(pk=self.season_id).update(
+                watched_episodes=Greatest(models.F('watched_episodes') + delta, 0)
+            )
+            content = self.season.content
+            content._add_watched(delta)
+            # propagate to parent content
+            content.update_status_if_needed()
         return self.watched
 
 
@@ -177,6 +277,51 @@ class Wishlist(models.Model):
 
     class Meta:
         unique_together = ("user", "tmdb_id", "media_type")
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-id"], name="wishlist_user_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} → {self.title}"
+
+
+class TmdbTitle(models.Model):
+    """
+    Shared (not user-owned) copy of TMDB title metadata, keyed by (media_type, tmdb_id).
+    Imports and the details proxy read from here first; `data` keeps the full
+    details payload and is refreshed once older than TMDB_METADATA_MAX_AGE.
+    """
+    TYPE_CHOICES = Content.TYPE_CHOICES
+
+    media_type = models.CharField(max_length=5, choices=TYPE_CHOICES)
+    tmdb_id = models.PositiveIntegerField()
+    title = models.CharField(max_length=512, blank=True)
+    overview = models.TextField(blank=True)
+    poster_path = models.CharField(max_length=255, blank=True)  # raw TMDB path, e.g. /abc.jpg
+    data = models.JSONField(default=dict)
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ('media_type', 'tmdb_id')
+
+    def __str__(self):
+        return f"{self.title} ({self.media_type}:{self.tmdb_id})"
+
+    def is_stale(self, now=None):
+        max_age = getattr(settings, 'TMDB_METADATA_MAX_AGE', {}).get(self.media_type, 60 * 60 * 24)
+        now = now or timezone.now()
+        return (now - self.fetched_at).total_seconds() > max_age
+
+
+class TmdbSeason(models.Model):
+    title = models.ForeignKey(TmdbTitle, on_delete=models.CASCADE, related_name='seasons')
+    season_number = models.PositiveIntegerField()
+    name = models.CharField(max_length=255, blank=True)
+    episode_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('title', 'season_number')
+        ordering = ['season_number']
 
     def __str__(self):
-        return f"{self.user} → {self.title}"
\ No newline at end of file
+        return f"{self.title.title} - S{self.season_number}"
@@ -0,0 +1,35 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class LibraryCursorPagination(CursorPagination):
+    """
+    Keyset pagination on (created_at, id), newest first: every page is one
+    indexed range scan, however deep, and rows added meanwhile never shift
+    a page. Pass `?count=true` for the (extra COUNT query) total; `?limit=`
+    sets the page size.
+
+    Response: {"next", "previous", "results"} (+ "count").
+    """
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "limit"
+    max_page_size = 100
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        if request.query_params.get(self.count_query_param, "").lower() in ("1", "true", "yes"):
+            self.count = queryset.count()
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        body = {"next": self.get_next_link(), "previous": self.get_previous_link()}
+        if self.count is not None:
+            body["count"] = self.count
+        body["results"] = data
+        return Response(body)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"] = {"type": "integer", "example": 123}
+        return response_schema
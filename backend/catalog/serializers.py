@@ -14,7 +14,11 @@ class SeasonSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Season
-        fields = ['id', 'season_number', 'episodes_count', 'episodes']
+        fields = ['id', 'season_number', 'episodes_count', 'watched_episodes', 'episodes']
+        read_only_fields = ['watched_episodes']
+
+
+DUPLICATE_TMDB_ID = 'This title is already in your library.'
 
 
 class ContentSerializer(serializers.ModelSerializer):
@@ -40,6 +44,8 @@ class ContentSerializer(serializers.ModelSerializer):
             'review',
             'seasons',
             'progress_percent',
+            'watched_episodes',
+            'total_episodes',
             'created_at',
             'updated_at',
         ]
@@ -49,6 +55,8 @@ class ContentSerializer(serializers.ModelSerializer):
             'owner',
             'seasons',
             'progress_percent',
+            'watched_episodes',
+            'total_episodes',
             'created_at',
             'updated_at',
         ]
@@ -59,6 +67,92 @@ class ContentSerializer(serializers.ModelSerializer):
         except Exception:
             return None
 
+    def validate(self, attrs):
+        """
+        One library entry per TMDB title (see content_unique_owner_tmdb).
+        """
+        tmdb_id = attrs.get('tmdb_id', getattr(self.instance, 'tmdb_id', None))
+        request = self.context.get('request')
+        if tmdb_id and request is not None:
+            owner = self.instance.owner if self.instance else request.user
+            clash = Content.objects.filter(owner=owner, tmdb_id=tmdb_id)
+            if self.instance is not None:
+                clash = clash.exclude(pk=self.instance.pk)
+            if clash.exists():
+                raise serializers.ValidationError({'tmdb_id': DUPLICATE_TMDB_ID})
+        return attrs
+
+
+class ContentSummarySerializer(serializers.ModelSerializer):
+    """
+    Poster-card view of a Content (`?view=summary` on list): no seasons,
+    episodes or long text, progress from the persisted counters only.
+    """
+    content_id = serializers.IntegerField(source="id", read_only=True)
+    progress_percent = serializers.SerializerMethodField()
+
+    # model fields the summary reads; everything else stays deferred
+    load_fields = [
+        'id', 'tmdb_id', 'title', 'type', 'poster_path', 'platform', 'status',
+        'rating', 'watched_episodes', 'total_episodes', 'created_at',
+    ]
+
+    class Meta:
+        model = Content
+        fields = [
+            'id',
+            'content_id',
+            'tmdb_id',
+            'title',
+            'type',
+            'poster_path',
+            'platform',
+            'status',
+            'rating',
+            'progress_percent',
+            'watched_episodes',
+            'total_episodes',
+            'created_at',
+        ]
+        read_only_fields = fields
+
+    def get_progress_percent(self, obj):
+        return obj.progress_percent()
+
+
+class EpisodeOperationSerializer(serializers.Serializer):
+    season_number = serializers.IntegerField(min_value=1)
+    episode_number = serializers.IntegerField(min_value=1)
+    watched = serializers.BooleanField(default=True)
+
+
+class EpisodeOperationsSerializer(serializers.Serializer):
+    operations = EpisodeOperationSerializer(many=True, allow_empty=False, max_length=2000)
+
+
+class TypedTmdbIdSerializer(serializers.Serializer):
+    tmdb_id = serializers.IntegerField(min_value=1)
+    media_type = serializers.ChoiceField(choices=['movie', 'tv'])
+
+
+class BulkImportSerializer(serializers.Serializer):
+    items = TypedTmdbIdSerializer(many=True, required=False, default=list)
+    tmdb_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, default=list)
+    queries = serializers.ListField(
+        child=serializers.CharField(max_length=200, trim_whitespace=True),
+        required=False,
+        default=list,
+    )
+
+    def validate(self, attrs):
+        total = len(attrs["items"]) + len(attrs["tmdb_ids"]) + len(attrs["queries"])
+        if not total:
+            raise serializers.ValidationError("items, tmdb_ids or queries required")
+        if total > 500:
+            raise serializers.ValidationError("At most 500 titles per request")
+        return attrs
+
+
 class WishlistSerializer(serializers.ModelSerializer):
     class Meta:
         model = Wishlist
@@ -0,0 +1,114 @@
+import hashlib
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Avg, Count, Max, OuterRef, Q, Subquery, Sum
+
+from catalog.models import Content, Wishlist
+
+
+# -------------------------------------------------------------------
+# PER-USER LIBRARY VERSION
+# -------------------------------------------------------------------
+
+def _per_user(model, user_field, aggregate):
+    """
+    Correlated subquery: aggregate over the user's rows of model.
+    """
+    return Subquery(
+        model.objects.filter(**{user_field: OuterRef("pk")})
+        .order_by()
+        .values(user_field)
+        .annotate(value=aggregate)
+        .values("value")
+    )
+
+
+def library_version(user_id) -> str:
+    """
+    Opaque token that changes whenever the user's library (contents,
+    seasons, episodes, wishlist) changes. Used as HTTP validator and to
+    invalidate per-user cached aggregates.
+
+    Read from the database in one index-only query, (count, latest
+    updated_at) of the contents and (count, latest id) of the wishlist, so
+    every worker process agrees on it whatever the cache backend. Season
+    and episode writes touch Content.updated_at (see Content._add_watched
+    and recalculate_progress).
+    """
+    row = (
+        get_user_model().objects.filter(pk=user_id)
+        .annotate(
+            content_count=_per_user(Content, "owner", Count("id")),
+            content_updated=_per_user(Content, "owner", Max("updated_at")),
+            wishlist_count=_per_user(Wishlist, "user", Count("id")),
+            wishlist_last=_per_user(Wishlist, "user", Max("id")),
+        )
+        .values_list("content_count", "content_updated", "wishlist_count", "wishlist_last")
+        .first()
+    )
+    return hashlib.sha1(repr(row).encode()).hexdigest()[:16]
+
+
+# -------------------------------------------------------------------
+# LIBRARY STATISTICS
+# -------------------------------------------------------------------
+
+STATS_TTL = 24 * 60 * 60  # entries of old versions just age out
+
+
+def compute_library_stats(user_id) -> dict:
+    """
+    Dashboard numbers for one library in two aggregate queries: conditional
+    counts / sums / average over the user's contents, plus a GROUP BY
+    platform. Episode totals come from the denormalized progress counters
+    on Content, so no Season/Episode rows are scanned.
+    """
+    contents = Content.objects.filter(owner_id=user_id).order_by()
+    statuses = [value for value, _ in Content.STATUS_CHOICES]
+    types = [value for value, _ in Content.TYPE_CHOICES]
+
+    totals = contents.aggregate(
+        total=Count("id"),
+        **{f"status_{s}": Count("id", filter=Q(status=s)) for s in statuses},
+        **{f"type_{t}": Count("id", filter=Q(type=t)) for t in types},
+        episodes_watched=Sum("watched_episodes"),
+        episodes_total=Sum("total_episodes", filter=Q(type="tv")),
+        rated=Count("rating"),
+        average_rating=Avg("rating"),
+    )
+    platforms = (
+        contents.exclude(platform="")
+        .values("platform")
+        .annotate(n=Count("id"))
+        .order_by("-n", "platform")
+    )
+
+    average = totals["average_rating"]
+    return {
+        "total": totals["total"],
+        "by_status": {s: totals[f"status_{s}"] for s in statuses},
+        "by_type": {t: totals[f"type_{t}"] for t in types},
+        "by_platform": {p["platform"]: p["n"] for p in platforms},
+        "episodes": {
+            "watched": totals["episodes_watched"] or 0,
+            "total": totals["episodes_total"] or 0,
+        },
+        "rated": totals["rated"],
+        "average_rating": round(average, 2) if average is not None else None,
+    }
+
+
+def library_stats(user_id, version=None) -> dict:
+    """
+    compute_library_stats, cached under the current library version: any
+    write changes the version, so a cached entry is never stale.
+    """
+    if version is None:
+        version = library_version(user_id)
+    key = f"library_stats:{user_id}:{version}"
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_library_stats(user_id)
+        cache.set(key, stats, STATS_TTL)
+    return stats
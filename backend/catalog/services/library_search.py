@@ -0,0 +1,155 @@
+"""
+Full-text search over a user's library (Content.title / Content.overview).
+
+- PostgreSQL: weighted tsvector expression with a GIN index on it.
+- SQLite: FTS5 external-content table kept in sync by triggers.
+- Anything else (or SQLite without FTS5): icontains fallback.
+
+Every search term is a prefix match ("bre ba" finds "Breaking Bad"); title
+hits rank above overview hits.
+"""
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "catalog_content_fts"
+PG_INDEX = "catalog_content_search_gin"
+
+# must stay identical to the indexed expression for the GIN index to be used
+PG_VECTOR = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(catalog_content.title, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(catalog_content.overview, '')), 'B')"
+)
+PG_INDEX_VECTOR = PG_VECTOR.replace("catalog_content.", "")
+
+
+def terms(query: str) -> list:
+    """
+    Word tokens of a user query; operators and quotes are dropped so user
+    input can never break the FTS query syntax.
+    """
+    return re.findall(r"\w+", query.lower())[:10]
+
+
+# -------------------------------------------------------------------
+# INDEX INSTALLATION (used by migrations)
+# -------------------------------------------------------------------
+
+SQLITE_INSTALL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, overview, content='catalog_content', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON catalog_content BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, overview) VALUES (new.id, new.title, new.overview);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON catalog_content BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, overview)
+        VALUES ('delete', old.id, old.title, old.overview);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, overview ON catalog_content BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, overview)
+        VALUES ('delete', old.id, old.title, old.overview);
+        INSERT INTO {FTS_TABLE}(rowid, title, overview) VALUES (new.id, new.title, new.overview);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_REMOVE = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def _sqlite_has_fts5(cursor) -> bool:
+    cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+    if cursor.fetchone()[0]:
+        return True
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+        cursor.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except Exception:
+        return False
+
+
+def install_search_index(apps, schema_editor):
+    """
+    Create the search index for the current database. Idempotent: also run
+    after migrations that rebuild catalog_content on SQLite (which drops
+    its triggers).
+    """
+    vendor = schema_editor.connection.vendor
+    with schema_editor.connection.cursor() as cursor:
+        if vendor == "postgresql":
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {PG_INDEX} ON catalog_content USING GIN (({PG_INDEX_VECTOR}))"
+            )
+        elif vendor == "sqlite" and _sqlite_has_fts5(cursor):
+            for sql in SQLITE_REMOVE[:3] + SQLITE_INSTALL:
+                cursor.execute(sql)
+
+
+def remove_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    with schema_editor.connection.cursor() as cursor:
+        if vendor == "postgresql":
+            cursor.execute(f"DROP INDEX IF EXISTS {PG_INDEX}")
+        elif vendor == "sqlite":
+            for sql in SQLITE_REMOVE:
+                cursor.execute(sql)
+
+
+# -------------------------------------------------------------------
+# QUERYING
+# -------------------------------------------------------------------
+
+_fts_available = None
+
+
+def _has_fts_table() -> bool:
+    global _fts_available
+    if _fts_available is None:
+        _fts_available = FTS_TABLE in connection.introspection.table_names()
+    return _fts_available
+
+
+def search_contents(qs, query: str):
+    """
+    Filter a Content queryset to the rows matching query, best match first
+    (annotated as `search_rank`, higher is better).
+    """
+    words = terms(query)
+    if not words:
+        return qs.none()
+
+    if connection.vendor == "postgresql":
+        tsquery = " & ".join(f"{w}:*" for w in words)
+        return qs.filter(
+            RawSQL(f"({PG_VECTOR}) @@ to_tsquery('simple', %s)", [tsquery], output_field=BooleanField())
+        ).annotate(
+            search_rank=RawSQL(f"ts_rank({PG_VECTOR}, to_tsquery('simple', %s))", [tsquery], output_field=FloatField())
+        ).order_by("-search_rank", "-created_at")
+
+    if connection.vendor == "sqlite" and _has_fts_table():
+        match = " AND ".join(f'"{w}"*' for w in words)
+        return qs.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+        ).annotate(
+            # bm25() is lower-is-better; title matches weigh 10x overview matches
+            search_rank=RawSQL(
+                f"(SELECT -bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND rowid = catalog_content.id)",
+                [match],
+                output_field=FloatField(),
+            )
+        ).order_by("-search_rank", "-created_at")
+
+    condition = Q()
+    for w in words:
+        condition &= Q(title__icontains=w) | Q(overview__icontains=w)
+    return qs.filter(condition)
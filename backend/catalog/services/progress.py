@@ -0,0 +1,54 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from catalog.models import Content, Season, Episode
+
+
+def apply_episode_operations(content: Content, operations) -> Content:
+    """
+    Apply many (season_number, episode_number, watched) operations to a show
+    in one transaction using bulk writes:
+      - missing seasons / episodes are created with bulk_create
+      - one UPDATE per target state (watched / unwatched)
+      - counters and status are recomputed once at the end
+    When the same episode appears more than once, the last operation wins.
+    """
+    final = {}
+    for op in operations:
+        final[(op["season_number"], op["episode_number"])] = op["watched"]
+
+    by_state = {True: defaultdict(list), False: defaultdict(list)}
+    for (season_number, episode_number), watched in final.items():
+        by_state[watched][season_number].append(episode_number)
+
+    with transaction.atomic():
+        season_numbers = {season_number for season_number, _ in final}
+        Season.objects.bulk_create(
+            [Season(content=content, season_number=n) for n in season_numbers],
+            ignore_conflicts=True,
+        )
+        seasons = {
+            s.season_number: s
+            for s in content.seasons.filter(season_number__in=season_numbers)
+        }
+
+        Episode.objects.bulk_create(
+            [
+                Episode(season=seasons[season_number], episode_number=episode_number)
+                for season_number, episode_number in final
+            ],
+            ignore_conflicts=True,
+        )
+
+        for watched, targets in by_state.items():
+            for season_number, episode_numbers in targets.items():
+                Episode.objects.filter(
+                    season=seasons[season_number],
+                    episode_number__in=episode_numbers,
+                ).exclude(watched=watched).update(watched=watched)
+
+        content.recalculate_progress()
+        content.update_status_if_needed()
+
+    return content
@@ -1,44 +1,35 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
 from django.conf import settings
+from django.db import transaction
 from django.utils.text import Truncator
 from django.core.cache import cache
 
 from catalog.models import Content, Season
+from catalog.services.tmdb_cache import coalesce, make_key, not_found_key, not_found_ttl, record
+from catalog.services.tmdb_fields import trim
+from catalog.services.tmdb_http import (
+    TMDBNotFound,
+    TMDBUnavailable,
+    background_priority,
+    breaker,
+    check_breaker,
+    get_session,
+    limiter,
+    record_status,
+    submit_in_context,
+)
+from catalog.services import tmdb_store
 
 logger = logging.getLogger(__name__)
 
-TMDB_BASE = "https://api.themoviedb.org/3"
+TMDB_BASE = getattr(settings, "TMDB_API_BASE", "https://api.themoviedb.org/3")
 TMDB_IMAGE_BASE = "https://image.tmdb.org/t/p/w500"
 
-
-# -------------------------------------------------------------------
-# HTTP SESSION WITH RETRIES
-# -------------------------------------------------------------------
-
-def _requests_session_with_retries(
-    retries: int = 3,
-    backoff_factor: float = 0.3,
-    status_forcelist: tuple = (500, 502, 503, 504),
-) -> requests.Session:
-    session = requests.Session()
-    retry = Retry(
-        total=retries,
-        read=retries,
-        connect=retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=status_forcelist,
-        allowed_methods=frozenset(["GET"])
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-    return session
+MEDIA_TYPES = ("movie", "tv")
+MEDIA_TYPE_CACHE_TTL = 60 * 60 * 24 * 30
 
 
 # -------------------------------------------------------------------
@@ -46,7 +37,15 @@ def _requests_session_with_retries(
 # -------------------------------------------------------------------
 
 def _get(path: str, params: Optional[dict] = None) -> dict:
+    """
+    GET a TMDB path. Identical concurrent requests share one HTTP call.
+    """
     params = params or {}
+    return coalesce("get:" + make_key(path, params), lambda: _fetch(path, params))
+
+
+def _fetch(path: str, params: dict) -> dict:
+    params = dict(params)
 
     api_key = getattr(settings, "TMDB_API_KEY", None)
     if not api_key:
@@ -54,21 +53,30 @@ def _get(path: str, params: Optional[dict] = None) -> dict:
 
     params["api_key"] = api_key
 
-    session = _requests_session_with_retries()
     url = f"{TMDB_BASE}{path}"
 
+    if cache.get(not_found_key(path)):
+        raise TMDBNotFound(f"TMDB resource not found: {path}")
+    check_breaker()
+    limiter.acquire()
+
+    try:
+        resp = get_session().get(url, params=params, timeout=10)
+    except TMDBUnavailable:
+        raise  # a retry gave up waiting for the rate limiter
+    except Exception as e:
+        breaker.record_failure()
+        logger.exception("TMDB request failed")
+        raise RuntimeError(f"TMDB request failed: {e}") from e
+
+    record_status(resp.status_code)
+    if resp.status_code == 404:
+        cache.set(not_found_key(path), True, not_found_ttl())
+        raise TMDBNotFound(f"TMDB resource not found: {path}")
+
     try:
-        resp = session.get(
-            url,
-            params=params,
-            headers={
-                "User-Agent": "MovieMate/1.0",
-                "Accept": "application/json",
-            },
-            timeout=10,
-        )
         resp.raise_for_status()
-        return resp.json()
+        return trim(path, resp.json())
     except Exception as e:
         logger.exception("TMDB request failed")
         raise RuntimeError(f"TMDB request failed: {e}") from e
@@ -79,15 +87,19 @@ def _get(path: str, params: Optional[dict] = None) -> dict:
 # -------------------------------------------------------------------
 
 def search_tmdb_by_query(query, max_results=10, cache_ttl=3600):
-    cache_key = f"tmdb_search:{query.lower().strip()}"
+    cache_key = make_key("tmdb_search", {"query": query})
     cached = cache.get(cache_key)
     if cached:
-        return cached
+        record("hits")
+        return cached[:max_results]
+    record("misses")
 
     data = _get("/search/multi", {"query": query})
 
+    # cache every movie/tv hit so callers asking for fewer results
+    # (e.g. import by query) don't shrink the cached list for everyone
     results = []
-    for r in data.get("results", [])[:max_results]:
+    for r in data.get("results", []):
         if r.get("media_type") not in ("movie", "tv"):
             continue
 
@@ -104,7 +116,51 @@ def search_tmdb_by_query(query, max_results=10, cache_ttl=3600):
         })
 
     cache.set(cache_key, results, cache_ttl)
-    return results
+    remember_media_types((r["id"], r["media_type"]) for r in results)
+    return results[:max_results]
+
+
+# -------------------------------------------------------------------
+# TMDB ID -> MEDIA TYPE MAP
+# -------------------------------------------------------------------
+
+def _media_type_key(tmdb_id) -> str:
+    return f"tmdb_media_type:{tmdb_id}"
+
+
+# cached for ids seen as both a movie and a TV show: their type can't be guessed
+AMBIGUOUS_MEDIA_TYPE = ""
+
+
+def remember_media_types(pairs):
+    """
+    Record (tmdb_id, media_type) pairs TMDB search results reported so
+    later untyped imports can go straight to the right endpoint. Movie and
+    TV ids overlap, so an id seen with both types is remembered as
+    ambiguous instead.
+    """
+    seen = {}
+    for tmdb_id, media_type in pairs:
+        seen.setdefault(int(tmdb_id), set()).add(media_type)
+    if not seen:
+        return
+
+    known = cache.get_many([_media_type_key(i) for i in seen])
+    for tmdb_id, types in seen.items():
+        hint = known.get(_media_type_key(tmdb_id))
+        if hint is not None:
+            types.add(hint)
+    cache.set_many(
+        {
+            _media_type_key(i): types.pop() if len(types) == 1 else AMBIGUOUS_MEDIA_TYPE
+            for i, types in seen.items()
+        },
+        MEDIA_TYPE_CACHE_TTL,
+    )
+
+
+def known_media_type(tmdb_id) -> Optional[str]:
+    return cache.get(_media_type_key(tmdb_id)) or None
 
 
 # -------------------------------------------------------------------
@@ -119,6 +175,128 @@ def fetch_tv_details(tmdb_id: int) -> dict:
     return _get(f"/tv/{tmdb_id}")
 
 
+# -------------------------------------------------------------------
+# DETAILS -> MODEL HELPERS
+# -------------------------------------------------------------------
+
+def _fetch_details(tmdb_id, media_type: Optional[str] = None) -> tuple:
+    """
+    Returns (media_type, details) for a TMDB id.
+
+    With an explicit media_type, or one TMDB search results reported for
+    the id, this is a single call to the right endpoint. Otherwise both
+    endpoints are asked: movie and TV ids overlap, so an id TMDB knows as
+    both raises ValueError instead of being guessed. Other errors are
+    raised as-is.
+    """
+    media_type = media_type or known_media_type(tmdb_id)
+    if media_type == "movie":
+        return "movie", fetch_movie_details(tmdb_id)
+    if media_type == "tv":
+        return "tv", fetch_tv_details(tmdb_id)
+
+    found = {}
+    for media_type, fetch in (("tv", fetch_tv_details), ("movie", fetch_movie_details)):
+        try:
+            found[media_type] = fetch(tmdb_id)
+        except TMDBNotFound:
+            pass
+    if not found:
+        raise TMDBNotFound(f"TMDB title not found: {tmdb_id}")
+    if len(found) > 1:
+        raise ValueError(f"TMDB id {tmdb_id} is both a movie and a TV show; media_type required")
+    return found.popitem()
+
+
+def _load_details(tmdb_id, media_type: Optional[str] = None) -> tuple:
+    """
+    Like _fetch_details, but reads the shared metadata store first and
+    stores whatever had to be fetched from TMDB.
+    """
+    media_type = media_type or known_media_type(tmdb_id)
+    if media_type in MEDIA_TYPES:
+        fetcher = fetch_movie_details if media_type == "movie" else fetch_tv_details
+        return media_type, tmdb_store.get_details(media_type, tmdb_id, lambda: fetcher(tmdb_id))
+
+    media_type, details = _fetch_details(tmdb_id)
+    tmdb_store.save_details(media_type, tmdb_id, details)
+    return media_type, details
+
+
+def _content_from_details(owner, tmdb_id, media_type: str, details: dict) -> Content:
+    """
+    Build an unsaved Content from a TMDB details payload.
+    """
+    total_episodes = None
+    if media_type == "movie":
+        title = details.get("title") or details.get("original_title") or ""
+    else:
+        title = details.get("name") or details.get("original_name") or ""
+        seasons = _seasons_from_details(details)
+        total_episodes = sum(seasons.values()) if seasons else None
+
+    return Content(
+        owner=owner,
+        tmdb_id=str(tmdb_id),
+        type=media_type,
+        title=title,
+        overview=details.get("overview") or "",
+        poster_path=(
+            TMDB_IMAGE_BASE + details["poster_path"]
+            if details.get("poster_path")
+            else ""
+        ),
+        status="wishlist",
+        total_episodes=total_episodes,
+    )
+
+
+def _seasons_from_details(details: dict) -> dict:
+    """
+    {season_number: episodes_count} for a TV details payload (NO episodes yet).
+    """
+    seasons = {}
+    for s in details.get("seasons", []):
+        season_number = s.get("season_number")
+
+        # ❌ Skip specials
+        if season_number in (None, 0):
+            continue
+
+        seasons.setdefault(season_number, s.get("episode_count") or 0)
+    return seasons
+
+
+def _upsert_contents(owner, contents, seasons_by_tmdb_id) -> dict:
+    """
+    Insert contents (+ their seasons) in one transaction with
+    INSERT ... ON CONFLICT DO NOTHING on the (owner, tmdb_id) unique
+    constraint: concurrent imports of a title (two tabs, a retried request)
+    end with one library row instead of a duplicate or an IntegrityError.
+
+    ignore_conflicts leaves pks unset, so the rows are re-selected.
+    Returns {tmdb_id: Content} (rows inserted here or by the winning import).
+    """
+    with transaction.atomic():
+        Content.objects.bulk_create(contents, ignore_conflicts=True)
+        saved = {
+            c.tmdb_id: c
+            for c in Content.objects.filter(
+                owner=owner,
+                tmdb_id__in=[c.tmdb_id for c in contents],
+            )
+        }
+        Season.objects.bulk_create(
+            [
+                Season(content=content, season_number=n, episodes_count=count)
+                for tmdb_id, content in saved.items()
+                for n, count in seasons_by_tmdb_id.get(tmdb_id, {}).items()
+            ],
+            ignore_conflicts=True,
+        )
+    return saved
+
+
 # -------------------------------------------------------------------
 # MAIN IMPORT FUNCTION (FIXED)
 # -------------------------------------------------------------------
@@ -127,27 +305,28 @@ def fetch_tmdb_show_and_create(
     owner,
     tmdb_id: Optional[int] = None,
     query: Optional[str] = None,
+    media_type: Optional[str] = None,
 ) -> Content:
     """
     SAFE, IDEMPOTENT IMPORT
     - Never crashes on duplicates
-    - Correctly handles movie vs TV
+    - Correctly handles movie vs TV (pass media_type to skip detection)
     """
+    if media_type is not None and media_type not in MEDIA_TYPES:
+        raise ValueError("media_type must be 'movie' or 'tv'")
 
     # -------------------------------------------------
     # Resolve tmdb_id from query
     # -------------------------------------------------
     if query and not tmdb_id:
-        results = search_tmdb_by_query(query, max_results=1)
-        if not results:
-            raise ValueError("No TMDB results found")
-        tmdb_id = results[0]["id"]
+        tmdb_id, media_type = _resolve_query(query)
 
     if not tmdb_id:
         raise ValueError("tmdb_id is required")
 
     # -------------------------------------------------
     # Return existing content if already imported
+    # (fast path; _upsert_contents is what makes it race-free)
     # -------------------------------------------------
     existing = Content.objects.filter(
         owner=owner,
@@ -160,63 +339,129 @@ def fetch_tmdb_show_and_create(
     # -------------------------------------------------
     # Detect MEDIA TYPE PROPERLY
     # -------------------------------------------------
-    try:
-        details = fetch_movie_details(tmdb_id)
-        media_type = "movie"
-    except Exception:
-        details = fetch_tv_details(tmdb_id)
-        media_type = "tv"
+    media_type, details = _load_details(tmdb_id, media_type)
 
     # -------------------------------------------------
-    # CREATE CONTENT
+    # CREATE CONTENT (+ seasons for TV)
     # -------------------------------------------------
-    if media_type == "movie":
-        content = Content.objects.create(
-            owner=owner,
-            tmdb_id=str(tmdb_id),
-            type="movie",
-            title=details.get("title") or details.get("original_title") or "",
-            overview=details.get("overview") or "",
-            poster_path=(
-                TMDB_IMAGE_BASE + details["poster_path"]
-                if details.get("poster_path")
-                else ""
-            ),
-            status="wishlist",
-        )
-        return content
+    content = _content_from_details(owner, tmdb_id, media_type, details)
+    seasons = _seasons_from_details(details) if media_type == "tv" else {}
+    return _upsert_contents(owner, [content], {content.tmdb_id: seasons})[content.tmdb_id]
 
-    # -------------------------------------------------
-    # TV SHOW
-    # -------------------------------------------------
-    content = Content.objects.create(
-        owner=owner,
-        tmdb_id=str(tmdb_id),
-        type="tv",
-        title=details.get("name") or details.get("original_name") or "",
-        overview=details.get("overview") or "",
-        poster_path=(
-            TMDB_IMAGE_BASE + details["poster_path"]
-            if details.get("poster_path")
-            else ""
-        ),
-        status="wishlist",
-    )
 
-    # Create seasons (NO episodes yet)
-    for s in details.get("seasons", []):
-        season_number = s.get("season_number")
+# -------------------------------------------------------------------
+# BULK IMPORT
+# -------------------------------------------------------------------
 
-        # ❌ Skip specials
-        if season_number in (None, 0):
-            continue
+def _resolve_query(query: str) -> tuple:
+    """
+    (tmdb_id, media_type) of the best TMDB match for a query.
+    """
+    results = search_tmdb_by_query(query, max_results=1)
+    if not results:
+        raise ValueError("No TMDB results found")
+    return results[0]["id"], results[0]["media_type"]
 
-        Season.objects.get_or_create(
-            content=content,
-            season_number=season_number,
-            defaults={
-                "episodes_count": s.get("episode_count") or 0
-            },
+
+@background_priority()  # leave rate-limit headroom for interactive requests
+def bulk_import(owner, tmdb_ids=(), queries=(), items=(), max_workers: Optional[int] = None) -> list:
+    """
+    Import many titles for one owner. `items` are typed
+    {"tmdb_id", "media_type"} pairs; `tmdb_ids` are untyped.
+
+    - queries are resolved to tmdb ids concurrently
+    - ids already in the owner's library (or repeated in the request) are skipped
+    - details come from the shared metadata store when fresh; the rest are
+      fetched concurrently with a bounded thread pool (workers do HTTP and
+      cache reads/writes, never ORM queries; their DB connections, used by
+      a db:// cache, are closed per task) and stored from this thread
+    - Content and Season rows are upserted in bulk in one transaction (see
+      _upsert_contents)
+
+    Returns one result dict per requested item, in request order:
+      {"tmdb_id", "query"?, "status": created|exists|duplicate|error, "content_id"?, "detail"?}
+    """
+    max_workers = max_workers or getattr(settings, "TMDB_IMPORT_WORKERS", 8)
+    results = [
+        {"tmdb_id": str(i["tmdb_id"]), "media_type": i["media_type"]}
+        for i in items
+    ]
+    results += [{"tmdb_id": str(i), "media_type": None} for i in tmdb_ids]
+    results += [{"tmdb_id": None, "media_type": None, "query": q} for q in queries]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # 1) resolve queries
+        resolving = {
+            submit_in_context(pool, _resolve_query, r["query"]): r
+            for r in results if r["tmdb_id"] is None
+        }
+        for future, r in resolving.items():
+            try:
+                tmdb_id, r["media_type"] = future.result()
+                r["tmdb_id"] = str(tmdb_id)
+            except Exception as e:
+                r.update(status="error", detail=str(e))
+
+        # 2) dedupe against the library and within the request
+        wanted = [r for r in results if "status" not in r]
+        existing = dict(
+            Content.objects.filter(
+                owner=owner,
+                tmdb_id__in={r["tmdb_id"] for r in wanted},
+            ).values_list("tmdb_id", "id")
+        )
+        to_fetch = {}
+        for r in wanted:
+            if r["tmdb_id"] in existing:
+                r.update(status="exists", content_id=existing[r["tmdb_id"]])
+            elif r["tmdb_id"] in to_fetch:
+                r["status"] = "duplicate"
+            else:
+                to_fetch[r["tmdb_id"]] = r
+
+        # 3) serve what we can from the shared metadata store
+        for tmdb_id, r in to_fetch.items():
+            r["media_type"] = r["media_type"] or known_media_type(tmdb_id)
+        stored = tmdb_store.lookup_many(
+            (r["media_type"], tmdb_id) for tmdb_id, r in to_fetch.items() if r["media_type"]
+        )
+        fetched = {}
+        for tmdb_id, r in to_fetch.items():
+            title = stored.get((r["media_type"], int(tmdb_id)))
+            if title is not None:
+                fetched[tmdb_id] = (title.media_type, title.data)
+
+        # 4) fetch the rest concurrently
+        fetching = {
+            submit_in_context(pool, _fetch_details, tmdb_id, r["media_type"]): tmdb_id
+            for tmdb_id, r in to_fetch.items()
+            if tmdb_id not in fetched
+        }
+        new_details = []
+        for future, tmdb_id in fetching.items():
+            try:
+                fetched[tmdb_id] = future.result()
+                new_details.append((fetched[tmdb_id][0], tmdb_id, fetched[tmdb_id][1]))
+            except Exception as e:
+                to_fetch[tmdb_id].update(status="error", detail=str(e))
+
+    tmdb_store.save_many(new_details)
+
+    # 5) write everything in bulk
+    contents = []
+    seasons_by_tmdb_id = {}
+    for tmdb_id, (media_type, details) in fetched.items():
+        contents.append(_content_from_details(owner, tmdb_id, media_type, details))
+        if media_type == "tv":
+            seasons_by_tmdb_id[tmdb_id] = _seasons_from_details(details)
+
+    saved = _upsert_contents(owner, contents, seasons_by_tmdb_id)
+
+    for content in saved.values():
+        to_fetch[content.tmdb_id].update(
+            status="created",
+            content_id=content.id,
+            media_type=content.type,
         )
 
-    return content
+    return results
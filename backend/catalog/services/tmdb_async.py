@@ -0,0 +1,227 @@
+import asyncio
+import contextvars
+import logging
+import weakref
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from catalog.services import tmdb_proxy, tmdb_store
+from catalog.services.tmdb_fields import trim
+from catalog.services.tmdb_cache import (
+    build_entry,
+    is_error_payload,
+    is_fresh,
+    make_key,
+    not_found_key,
+    not_found_ttl,
+    record,
+)
+from catalog.services.tmdb_http import (
+    BACKGROUND,
+    DEFAULT_HEADERS,
+    TMDBNotFound,
+    breaker,
+    check_breaker,
+    limiter,
+    record_status,
+    retry_after_seconds,
+    tmdb_priority,
+)
+
+logger = logging.getLogger(__name__)
+
+TMDB_BASE = getattr(settings, "TMDB_API_BASE", "https://api.themoviedb.org/3")
+
+RETRIES = 3
+BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+ERROR_PAYLOAD = {"results": [], "error": "TMDB service unavailable"}
+
+
+# -------------------------------------------------------------------
+# POOLED ASYNC CLIENT (one per event loop)
+# -------------------------------------------------------------------
+
+_clients = weakref.WeakKeyDictionary()
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    httpx clients are bound to the event loop they were created on, so keep
+    one pooled client per running loop (a single one under uvicorn).
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        size = getattr(settings, "TMDB_HTTP_POOL_SIZE", 10)
+        client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=10,
+            limits=httpx.Limits(
+                max_connections=getattr(settings, "TMDB_ASYNC_MAX_CONNECTIONS", size * 10),
+                max_keepalive_connections=size,
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=RETRIES),  # connect errors
+        )
+        _clients[loop] = client
+    return client
+
+
+async def _fetch(path: str, params: dict) -> dict:
+    """
+    Same contract as tmdb_proxy._fetch: TMDBNotFound / TMDBUnavailable are
+    raised, any other failure becomes an error payload.
+    """
+    if await cache.aget(not_found_key(path)):
+        raise TMDBNotFound(f"TMDB resource not found: {path}")
+    check_breaker()
+    await limiter.aacquire()
+
+    url = f"{TMDB_BASE}{path}"
+    params = {**params, "api_key": settings.TMDB_API_KEY}
+
+    for attempt in range(RETRIES + 1):
+        try:
+            response = await get_client().get(url, params=params)
+        except httpx.HTTPError:
+            breaker.record_failure()
+            logger.warning("Async TMDB request failed: %s", path)
+            return dict(ERROR_PAYLOAD)
+
+        if response.status_code in RETRY_STATUSES and attempt < RETRIES:
+            delay = BACKOFF_FACTOR * (2 ** attempt)
+            if response.status_code == 429:
+                delay = retry_after_seconds(response.headers.get("Retry-After"), delay)
+                await limiter.apause(delay)
+            await asyncio.sleep(delay)
+            continue
+
+        record_status(response.status_code)
+        if response.status_code == 404:
+            await cache.aset(not_found_key(path), True, not_found_ttl())
+            raise TMDBNotFound(f"TMDB resource not found: {path}")
+        if response.is_error:
+            logger.warning("Async TMDB request failed: %s (%s)", path, response.status_code)
+            return dict(ERROR_PAYLOAD)
+        return trim(path, response.json())
+    return dict(ERROR_PAYLOAD)
+
+
+# -------------------------------------------------------------------
+# CACHED GET (same keys/entries as tmdb_proxy.tmdb_get)
+# -------------------------------------------------------------------
+
+_inflight = {}
+
+
+async def _store(key: str, path: str, params: dict) -> dict:
+    data = await _fetch(path, params)
+    if not is_error_payload(data):
+        entry, timeout = build_entry(path, data)
+        await cache.aset(key, entry, timeout)
+    return data
+
+
+def _coalesce(key: str, path: str, params: dict, background: bool = False) -> asyncio.Future:
+    """
+    Single-flight per key within the running loop. A background fetch runs
+    with background TMDB priority (see tmdb_http.RateLimiter).
+    """
+    task = _inflight.get(key)
+    loop = asyncio.get_running_loop()
+    if task is None or task.get_loop() is not loop:
+        context = contextvars.copy_context()
+        if background:
+            context.run(tmdb_priority.set, BACKGROUND)
+        task = loop.create_task(_store(key, path, params), context=context)
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _done(key, t))
+    return task
+
+
+def _done(key: str, task: asyncio.Future):
+    if _inflight.get(key) is task:
+        _inflight.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        # background refreshes have no awaiter; keep the loop quiet
+        logger.info("TMDB fetch failed for %s: %s", key, task.exception())
+
+
+async def tmdb_aget(path, params=None) -> dict:
+    """
+    Async counterpart of tmdb_proxy.tmdb_get. Shares its cache entries, so
+    sync and async workers warm the same cache.
+    """
+    params = dict(params or {})
+    params["language"] = "en-US"
+
+    key = make_key(path, params)
+    entry = await cache.aget(key)
+    if entry is not None:
+        if is_fresh(entry):
+            record("hits")
+        else:
+            record("stale_hits")
+            _coalesce(key, path, params, background=True)  # refresh in the background
+        return entry["data"]
+
+    record("misses")
+    # shield: a cancelled request must not cancel the fetch other waiters share
+    return await asyncio.shield(_coalesce(key, path, params))
+
+
+# -------------------------------------------------------------------
+# PUBLIC HELPERS (mirror tmdb_proxy)
+# -------------------------------------------------------------------
+
+LIST_PATHS = tmdb_proxy.LIST_PATHS
+
+
+async def details(media_type: str, tmdb_id) -> dict:
+    """
+    Title details, shared metadata store first (see tmdb_store.get_details).
+    """
+    stored = await sync_to_async(tmdb_store.lookup)(media_type, tmdb_id)
+    if stored is not None and not stored.is_stale():
+        return stored.data
+
+    try:
+        data = await tmdb_aget(f"/{media_type}/{tmdb_id}")
+    except Exception:
+        if stored is None:
+            raise
+        logger.warning("TMDB refresh failed, serving stored %s:%s", media_type, tmdb_id)
+        return stored.data
+
+    if is_error_payload(data):
+        return stored.data if stored is not None else data
+
+    await sync_to_async(tmdb_store.save_details)(media_type, tmdb_id, data)
+    return data
+
+
+async def search_multi(query: str) -> dict:
+    return await tmdb_aget("/search/multi", params={"query": query})
+
+
+async def home_feed() -> dict:
+    """
+    Async counterpart of tmdb_proxy.home_feed.
+    """
+    names = list(tmdb_proxy.HOME_SECTIONS)
+    results = await asyncio.gather(
+        *(tmdb_aget(tmdb_proxy.HOME_SECTIONS[name][1]) for name in names),
+        return_exceptions=True,
+    )
+
+    sections = {}
+    for name, data in zip(names, results):
+        if isinstance(data, Exception):
+            sections[name] = {"results": [], "error": "TMDB service unavailable"}
+        else:
+            sections[name] = tmdb_proxy.compact_section(data, tmdb_proxy.HOME_SECTIONS[name][0])
+    return {"sections": sections}
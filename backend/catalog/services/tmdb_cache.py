@@ -0,0 +1,253 @@
+import hashlib
+import logging
+import threading
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from catalog.services.tmdb_http import background_priority
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "tmdb"
+
+# TTL (seconds) per endpoint class. Override any entry with
+# settings.TMDB_CACHE_TTLS = {"details": 600, ...}
+DEFAULT_TTLS = {
+    "genres": 60 * 60 * 24 * 7,   # genre lists almost never change
+    "trending": 60 * 60 * 3,
+    "lists": 60 * 60,             # popular / top rated / now playing
+    "details": 60 * 30,
+    "search": 60 * 10,
+    "default": 60 * 15,
+}
+
+
+def endpoint_class(path: str) -> str:
+    """
+    Map a TMDB path to one of the DEFAULT_TTLS classes.
+    """
+    if path.startswith("/genre/"):
+        return "genres"
+    if path.startswith("/trending/"):
+        return "trending"
+    if path.startswith("/search/"):
+        return "search"
+    if path.endswith(("/popular", "/top_rated", "/now_playing")):
+        return "lists"
+    if path.startswith(("/movie/", "/tv/")):
+        return "details"
+    return "default"
+
+
+def class_ttl(name: str) -> int:
+    ttls = {**DEFAULT_TTLS, **getattr(settings, "TMDB_CACHE_TTLS", {})}
+    return ttls[name]
+
+
+def ttl_for(path: str) -> int:
+    return class_ttl(endpoint_class(path))
+
+
+def make_key(path: str, params=None) -> str:
+    """
+    Build a cache key from the path plus normalized params.
+    The api_key is never part of the key, and param order / whitespace /
+    search-query casing do not produce distinct entries.
+    """
+    normalized = []
+    for k, v in sorted((params or {}).items()):
+        if k == "api_key" or v is None:
+            continue
+        v = str(v).strip()
+        if k == "query":
+            v = v.lower()
+        normalized.append((k, v))
+
+    digest = hashlib.sha1(urlencode(normalized).encode("utf-8")).hexdigest()
+    return f"{CACHE_PREFIX}:{path}:{digest}"
+
+
+def is_error_payload(data) -> bool:
+    return not isinstance(data, dict) or "error" in data
+
+
+# -------------------------------------------------------------------
+# NEGATIVE CACHE (TMDB 404s)
+# -------------------------------------------------------------------
+
+def not_found_key(path: str) -> str:
+    return f"{CACHE_PREFIX}:404:{path}"
+
+
+def not_found_ttl() -> int:
+    """
+    How long a 404 is remembered: short, ids can appear on TMDB later.
+    """
+    return getattr(settings, "TMDB_NOT_FOUND_TTL", 60 * 10)
+
+
+# -------------------------------------------------------------------
+# HIT-RATE METRIC
+# -------------------------------------------------------------------
+
+_stats = {"hits": 0, "stale_hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def record(outcome: str):
+    """
+    Count one TMDB cache lookup: "hits", "stale_hits" or "misses".
+    """
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def cache_stats() -> dict:
+    """
+    Lookup counters of this process since start, plus the backend in use.
+    Stale hits are served from cache, so they count towards hit_rate.
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = sum(stats.values())
+    stats["lookups"] = lookups
+    stats["hit_rate"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 4) if lookups else None
+    stats["backend"] = settings.CACHES["default"]["BACKEND"].rsplit(".", 1)[-1]
+    return stats
+
+
+# -------------------------------------------------------------------
+# SINGLE-FLIGHT
+# -------------------------------------------------------------------
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def coalesce(key: str, fn):
+    """
+    Run fn() at most once per key at a time within this process.
+    Concurrent callers for the same key wait for the in-flight call and
+    receive its result (or its exception).
+    """
+    with _inflight_lock:
+        call = _inflight.get(key)
+        leader = call is None
+        if leader:
+            call = _inflight[key] = _Call()
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        call.result = fn()
+        return call.result
+    except Exception as e:
+        call.error = e
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        call.done.set()
+
+
+def _is_inflight(key: str) -> bool:
+    with _inflight_lock:
+        return key in _inflight
+
+
+def _spawn(fn):
+    def run():
+        try:
+            with background_priority():
+                fn()
+        except Exception:
+            logger.exception("Background TMDB refresh failed")
+        finally:
+            # the thread owns its own DB connections
+            connections.close_all()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+# -------------------------------------------------------------------
+# CACHED FETCH (TTL + STALE-WHILE-REVALIDATE)
+# -------------------------------------------------------------------
+
+def _stale_ttl(ttl: int) -> int:
+    """
+    How long an entry is kept (and may be served stale) past its TTL.
+    Defaults to one extra TTL; 0 disables stale-while-revalidate.
+    """
+    if not getattr(settings, "TMDB_CACHE_STALE_WHILE_REVALIDATE", True):
+        return 0
+    return getattr(settings, "TMDB_CACHE_STALE_TTL", ttl)
+
+
+def build_entry(path: str, data) -> tuple:
+    """
+    (entry, timeout) to store for a payload: the entry is fresh for the
+    endpoint's TTL and kept for the extra stale window after that.
+    """
+    ttl = ttl_for(path)
+    return {"data": data, "fresh_until": time.time() + ttl}, ttl + _stale_ttl(ttl)
+
+
+def is_fresh(entry) -> bool:
+    return time.time() < entry["fresh_until"]
+
+
+def _store(key: str, path: str, fetch):
+    data = fetch()
+    if not is_error_payload(data):
+        entry, timeout = build_entry(path, data)
+        cache.set(key, entry, timeout)
+    return data
+
+
+def cached_fetch(path: str, params, fetch):
+    """
+    Return the cached payload for (path, params) or call fetch() and cache
+    its result for the endpoint's TTL. Error payloads are never cached.
+
+    Concurrent misses for the same key share one fetch. Past the TTL the
+    stale payload is returned immediately while a single background
+    refresh runs.
+    """
+    key = make_key(path, params)
+    entry = cache.get(key)
+
+    if entry is not None:
+        if is_fresh(entry):
+            record("hits")
+            return entry["data"]
+        record("stale_hits")
+        if not _is_inflight(key):
+            _spawn(lambda: coalesce(key, lambda: _store(key, path, fetch)))
+        return entry["data"]
+
+    record("misses")
+    return coalesce(key, lambda: _store(key, path, fetch))
+
+
+def refresh(path: str, params, fetch):
+    """
+    Call fetch() and store its result now, even over a fresh entry
+    (cache warming). Still coalesced with concurrent fetches of the key.
+    """
+    key = make_key(path, params)
+    return coalesce(key, lambda: _store(key, path, fetch))
@@ -0,0 +1,94 @@
+"""
+Field projection for TMDB payloads.
+
+Raw TMDB responses carry far more than the app uses (credits, networks,
+production companies, ...). Every payload is trimmed to a per-endpoint
+default schema as soon as it is fetched, so the cache, the metadata store
+and the JSON encoder only ever see the slim shape. Clients can trim further
+with ?fields=a,b,c.
+"""
+
+# Pagination / status keys kept on every list payload
+LIST_KEYS = ("page", "total_pages", "total_results", "results", "error")
+
+LIST_ITEM_FIELDS = (
+    "id", "media_type", "title", "name", "original_title", "original_name",
+    "overview", "poster_path", "backdrop_path", "profile_path",
+    "vote_average", "vote_count", "release_date", "first_air_date", "genre_ids",
+)
+
+SEASON_FIELDS = ("id", "season_number", "name", "episode_count", "air_date", "poster_path")
+
+DETAIL_FIELDS = {
+    "movie": (
+        "id", "imdb_id", "title", "original_title", "overview", "tagline",
+        "poster_path", "backdrop_path", "release_date", "runtime", "status",
+        "genres", "vote_average", "vote_count",
+    ),
+    "tv": (
+        "id", "name", "original_name", "overview", "tagline",
+        "poster_path", "backdrop_path", "first_air_date", "last_air_date",
+        "status", "in_production", "number_of_seasons", "number_of_episodes",
+        "episode_run_time", "genres", "vote_average", "vote_count", "seasons",
+    ),
+}
+
+
+def _pick(item: dict, fields) -> dict:
+    return {k: item[k] for k in fields if k in item}
+
+
+def parse_fields(raw):
+    """
+    "a, b,c" -> {"a", "b", "c"}; empty / missing -> None (no projection).
+    """
+    if not raw:
+        return None
+    fields = {f.strip() for f in raw.split(",") if f.strip()}
+    return fields or None
+
+
+def trim(path: str, data):
+    """
+    Apply the default schema for a TMDB path. Unknown endpoints (genres,
+    ...) and error payloads are returned unchanged.
+    """
+    if not isinstance(data, dict) or "error" in data:
+        return data
+
+    if isinstance(data.get("results"), list):
+        slim = _pick(data, LIST_KEYS)
+        slim["results"] = [
+            _pick(item, LIST_ITEM_FIELDS) if isinstance(item, dict) else item
+            for item in data["results"]
+        ]
+        return slim
+
+    parts = path.strip("/").split("/")
+    if len(parts) == 2 and parts[0] in DETAIL_FIELDS and parts[1].isdigit():
+        slim = _pick(data, DETAIL_FIELDS[parts[0]])
+        if "seasons" in slim:
+            slim["seasons"] = [_pick(s, SEASON_FIELDS) for s in slim["seasons"] or []]
+        return slim
+
+    return data
+
+
+def project(data, fields):
+    """
+    Keep only the requested fields: per item for list payloads (pagination
+    keys are kept), top-level otherwise. "id" and "error" always survive.
+    """
+    if not fields or not isinstance(data, dict):
+        return data
+
+    keep = set(fields) | {"id", "error"}
+    if isinstance(data.get("results"), list):
+        return {
+            **{k: v for k, v in data.items() if k != "results"},
+            "results": [
+                _pick(item, keep) if isinstance(item, dict) else item
+                for item in data["results"]
+            ],
+        }
+    return {k: v for k, v in data.items() if k in keep}
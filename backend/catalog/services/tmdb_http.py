@@ -0,0 +1,522 @@
+import asyncio
+import contextvars
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+DEFAULT_HEADERS = {
+    "User-Agent": "MovieMate/1.0 (contact: dev@example.com)",
+    "Accept": "application/json",
+}
+
+
+class TMDBNotFound(RuntimeError):
+    """TMDB answered 404 for the requested resource."""
+
+
+class TMDBUnavailable(RuntimeError):
+    """TMDB calls are short-circuited because the breaker is open."""
+
+
+# -------------------------------------------------------------------
+# CIRCUIT BREAKER (shared by the sync and async TMDB clients)
+# -------------------------------------------------------------------
+
+class CircuitBreaker:
+    """
+    Closed: calls go through and their outcomes are tracked over a rolling
+    window. Once at least min_requests calls were seen in the window and
+    the failure share reaches error_rate, the breaker opens.
+
+    Open: calls fail immediately (callers serve cached data or a fast 503)
+    for reset_timeout seconds.
+
+    Half-open: a single probe call is let through; success closes the
+    breaker, failure opens it again.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, error_rate=0.5, min_requests=10, window=30, reset_timeout=30, clock=time.monotonic):
+        self.error_rate = error_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._outcomes = deque()  # (timestamp, ok)
+            self._opened_at = None
+            self._probe_started = None
+
+    def _prune(self, now):
+        while self._outcomes and self._outcomes[0][0] < now - self.window:
+            self._outcomes.popleft()
+
+    def _refresh(self, now):
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_started = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh(self.clock())
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = self.clock()
+            self._refresh(now)
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN:
+                # one probe at a time; a probe that never reported expires
+                if self._probe_started is None or now - self._probe_started >= self.reset_timeout:
+                    self._probe_started = now
+                    return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            now = self.clock()
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+            self._outcomes.append((now, True))
+            self._prune(now)
+
+    def record_failure(self):
+        with self._lock:
+            now = self.clock()
+            if self._state == self.HALF_OPEN:
+                self._open(now)
+                return
+            self._outcomes.append((now, False))
+            self._prune(now)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            total = len(self._outcomes)
+            if self._state == self.CLOSED and total >= self.min_requests \
+                    and failures / total >= self.error_rate:
+                self._open(now)
+
+    def _open(self, now):
+        self._state = self.OPEN
+        self._opened_at = now
+        self._probe_started = None
+        self._outcomes.clear()
+
+    def retry_after(self) -> int:
+        """Seconds until the next probe may run (0 unless open)."""
+        with self._lock:
+            now = self.clock()
+            self._refresh(now)
+            if self._state != self.OPEN:
+                return 0
+            return max(1, int(self._opened_at + self.reset_timeout - now + 0.999))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            now = self.clock()
+            self._refresh(now)
+            self._prune(now)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            return {
+                "state": self._state,
+                "window_requests": len(self._outcomes),
+                "window_failures": failures,
+                "error_rate_threshold": self.error_rate,
+                "min_requests": self.min_requests,
+                "reset_timeout": self.reset_timeout,
+            }
+
+
+breaker = CircuitBreaker(
+    error_rate=getattr(settings, "TMDB_BREAKER_ERROR_RATE", 0.5),
+    min_requests=getattr(settings, "TMDB_BREAKER_MIN_REQUESTS", 10),
+    window=getattr(settings, "TMDB_BREAKER_WINDOW", 30),
+    reset_timeout=getattr(settings, "TMDB_BREAKER_RESET_TIMEOUT", 30),
+)
+
+
+def check_breaker():
+    """
+    Raise TMDBUnavailable instead of calling TMDB while the breaker is open.
+    """
+    if not breaker.allow():
+        raise TMDBUnavailable("TMDB temporarily unavailable (circuit open)")
+
+
+def record_status(status_code: int):
+    """
+    Feed an upstream HTTP status into the breaker. Only server errors count
+    as failures; 4xx answers (404 included) mean TMDB is healthy.
+    """
+    if status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+# -------------------------------------------------------------------
+# OUTBOUND RATE LIMIT (token bucket, interactive before background)
+# -------------------------------------------------------------------
+
+INTERACTIVE, BACKGROUND = "interactive", "background"
+
+# Priority of the TMDB calls made in the current context. Thread pools
+# must run their tasks in a copy of the caller's context to inherit it
+# (see submit_in_context).
+tmdb_priority = contextvars.ContextVar("tmdb_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def background_priority():
+    """
+    Run TMDB calls as background work (bulk import, cache warming, stale
+    refreshes): they never use the tokens reserved for interactive calls.
+    """
+    token = tmdb_priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        tmdb_priority.reset(token)
+
+
+def _in_worker(fn, *args):
+    try:
+        return fn(*args)
+    finally:
+        # the cache (db:// backend) and the metadata store open DB
+        # connections in the worker thread, which nobody else closes
+        connections.close_all()
+
+
+def submit_in_context(pool, fn, *args):
+    """
+    pool.submit() that carries the caller's contextvars (TMDB priority)
+    into the worker thread, and closes the DB connections the task opened
+    there.
+    """
+    return pool.submit(contextvars.copy_context().run, _in_worker, fn, *args)
+
+
+PAUSE_KEY = "tmdb:ratelimit:pause"
+
+
+class RateLimiter:
+    """
+    Token bucket for outbound TMDB calls: `rate` tokens per second, up to
+    `burst` saved up. Background calls leave `reserve` tokens in the bucket
+    so interactive calls (search, details) keep flowing while a bulk import
+    or cache warmer is saturating the limit.
+
+    With shared=True the budget is counted in the cache backend (one
+    counter per second) so it holds across all worker processes.
+
+    pause() stops every caller for a while, e.g. after a 429 Retry-After.
+    """
+
+    def __init__(self, rate=40, burst=40, reserve=10, shared=False, clock=time.time):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.reserve = min(reserve, self.burst - 1)
+        self.shared = shared
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def _floor(self, priority) -> int:
+        return self.reserve if priority == BACKGROUND else 0
+
+    # --- local bucket ---
+
+    def _take_local(self, priority, now) -> float:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            floor = self._floor(priority)
+            if self._tokens - 1 >= floor:
+                self._tokens -= 1
+                return 0.0
+            return (floor + 1 - self._tokens) / self.rate
+
+    # --- cross-process fixed windows ---
+
+    def _take_shared(self, priority, now) -> float:
+        window = int(now)
+        key = f"tmdb:ratelimit:{window}"
+        cache.add(key, 0, 5)
+        try:
+            used = cache.incr(key)
+        except ValueError:  # expired between add and incr
+            return 0.0
+        if used <= self.rate - self._floor(priority):
+            return 0.0
+        try:
+            cache.decr(key)  # denied: give the slot back
+        except ValueError:
+            pass
+        return window + 1 - now
+
+    async def _atake_shared(self, priority, now) -> float:
+        # same as _take_shared through the async cache API, which never
+        # blocks the loop (and works with the DB cache under ASGI)
+        window = int(now)
+        key = f"tmdb:ratelimit:{window}"
+        await cache.aadd(key, 0, 5)
+        try:
+            used = await cache.aincr(key)
+        except ValueError:
+            return 0.0
+        if used <= self.rate - self._floor(priority):
+            return 0.0
+        try:
+            await cache.adecr(key)
+        except ValueError:
+            pass
+        return window + 1 - now
+
+    def _paused(self, now) -> float:
+        until = self._paused_until
+        if self.shared:
+            until = max(until, cache.get(PAUSE_KEY) or 0)
+        return max(0.0, until - now)
+
+    async def _apaused(self, now) -> float:
+        until = self._paused_until
+        if self.shared:
+            until = max(until, await cache.aget(PAUSE_KEY) or 0)
+        return max(0.0, until - now)
+
+    def try_acquire(self, priority=None) -> float:
+        """
+        Take a token: returns 0 on success, else the seconds to wait before
+        trying again.
+        """
+        priority = priority or tmdb_priority.get()
+        now = self.clock()
+        wait = self._paused(now)
+        if wait:
+            return wait
+        if self.shared:
+            return self._take_shared(priority, now)
+        return self._take_local(priority, now)
+
+    def acquire(self, priority=None, timeout=None):
+        """
+        Block until a token is available. Raises TMDBUnavailable when that
+        would take longer than timeout (default: TMDB_RATE_LIMIT_MAX_WAIT
+        for interactive calls, unbounded for background ones).
+        """
+        priority = priority or tmdb_priority.get()
+        deadline = self._deadline(priority, timeout)
+        while True:
+            wait = self.try_acquire(priority)
+            if not wait:
+                return
+            if deadline is not None and self.clock() + wait > deadline:
+                raise TMDBUnavailable("TMDB rate limit reached")
+            time.sleep(wait)
+
+    async def atry_acquire(self, priority=None) -> float:
+        priority = priority or tmdb_priority.get()
+        now = self.clock()
+        wait = await self._apaused(now)
+        if wait:
+            return wait
+        if self.shared:
+            return await self._atake_shared(priority, now)
+        return self._take_local(priority, now)
+
+    async def aacquire(self, priority=None, timeout=None):
+        priority = priority or tmdb_priority.get()
+        deadline = self._deadline(priority, timeout)
+        while True:
+            wait = await self.atry_acquire(priority)
+            if not wait:
+                return
+            if deadline is not None and self.clock() + wait > deadline:
+                raise TMDBUnavailable("TMDB rate limit reached")
+            await asyncio.sleep(wait)
+
+    def _deadline(self, priority, timeout):
+        if timeout is None and priority == INTERACTIVE:
+            timeout = getattr(settings, "TMDB_RATE_LIMIT_MAX_WAIT", 5)
+        return None if timeout is None else self.clock() + timeout
+
+    def _pause_locally(self, seconds: float) -> float:
+        until = self.clock() + seconds
+        with self._lock:
+            self._paused_until = max(self._paused_until, until)
+        return until
+
+    def pause(self, seconds: float):
+        until = self._pause_locally(seconds)
+        if self.shared:
+            cache.set(PAUSE_KEY, until, int(seconds) + 1)
+
+    async def apause(self, seconds: float):
+        until = self._pause_locally(seconds)
+        if self.shared:
+            await cache.aset(PAUSE_KEY, until, int(seconds) + 1)
+
+    def snapshot(self) -> dict:
+        now = self.clock()
+        with self._lock:
+            tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "reserve": self.reserve,
+            "shared": self.shared,
+            "tokens": None if self.shared else round(tokens, 2),
+            "paused_for": round(self._paused(now), 2),
+        }
+
+
+limiter = RateLimiter(
+    rate=getattr(settings, "TMDB_RATE_LIMIT", 40),
+    burst=getattr(settings, "TMDB_RATE_LIMIT_BURST", 40),
+    reserve=getattr(settings, "TMDB_RATE_LIMIT_RESERVE", 10),
+    shared=getattr(settings, "TMDB_RATE_LIMIT_SHARED", False),
+)
+
+
+def retry_after_seconds(value, default: float = 1.0) -> float:
+    """
+    Parse a Retry-After header (delta seconds; HTTP dates fall back to the
+    default).
+    """
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+# -------------------------------------------------------------------
+# POOLED SESSION WITH RETRIES
+# -------------------------------------------------------------------
+
+class _PooledAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that enables TCP keep-alive on pooled sockets so idle
+    connections to TMDB survive between requests.
+    """
+
+    def __init__(self, *args, keepalive: bool = True, **kwargs):
+        self.keepalive = keepalive
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keepalive:
+            kwargs["socket_options"] = [
+                (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+class _LimiterRetry(Retry):
+    """
+    Every retry is another outbound request, so it takes a limiter token
+    just like the first attempt. A 429 pauses the (shared) limiter for its
+    Retry-After so other callers back off too; the retry then waits out the
+    pause in acquire() rather than in urllib3's own Retry-After sleep.
+    """
+
+    def increment(self, method=None, url=None, response=None, *args, **kwargs):
+        if response is not None and response.status == 429:
+            limiter.pause(retry_after_seconds(response.headers.get("Retry-After")))
+        retry = super().increment(method, url, response, *args, **kwargs)
+        limiter.acquire()
+        return retry
+
+
+def _requests_session_with_retries(
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: tuple = (429, 500, 502, 503, 504),
+    pool_size: int = 10,
+    keepalive: bool = True,
+) -> requests.Session:
+    session = requests.Session()
+    retry = _LimiterRetry(
+        total=retries,
+        read=retries,
+        connect=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=False,  # _LimiterRetry waits it out in the limiter
+    )
+    adapter = _PooledAdapter(
+        max_retries=retry,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        keepalive=keepalive,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    if not keepalive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Process-wide TMDB session. Built once, then shared by every thread so
+    TCP/TLS connections to api.themoviedb.org are reused from the pool.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _requests_session_with_retries(
+                    pool_size=getattr(settings, "TMDB_HTTP_POOL_SIZE", 10),
+                    keepalive=getattr(settings, "TMDB_HTTP_KEEPALIVE", True),
+                )
+    return _session
+
+
+def connection_stats() -> dict:
+    """
+    Requests sent vs. connections opened by the shared pool. Every request
+    beyond the number of opened connections reused a kept-alive socket
+    (i.e. skipped a TCP+TLS handshake).
+    """
+    adapter = get_session().get_adapter("https://")
+    pools = adapter.poolmanager.pools
+    opened = sent = 0
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool is None:
+            continue
+        opened += pool.num_connections
+        sent += pool.num_requests
+    return {
+        "requests": sent,
+        "connections_opened": opened,
+        "connections_reused": max(0, sent - opened),
+    }
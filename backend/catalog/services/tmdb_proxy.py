@@ -1,34 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from django.conf import settings
+from django.core.cache import cache
+
+from catalog.services import tmdb_store
+from catalog.services.tmdb_fields import trim
+from catalog.services.tmdb_cache import cached_fetch, not_found_key, not_found_ttl, refresh
+from catalog.services.tmdb_http import (
+    TMDBNotFound,
+    breaker,
+    check_breaker,
+    get_session,
+    limiter,
+    record_status,
+    submit_in_context,
+)
 
-TMDB_BASE = "https://api.themoviedb.org/3"
+TMDB_BASE = getattr(settings, "TMDB_API_BASE", "https://api.themoviedb.org/3")
 
-# Use a persistent session with headers for performance
-SESSION = requests.Session()
-SESSION.headers.update({
-    "User-Agent": "MovieMate/1.0 (contact: dev@example.com)",
-    "Accept": "application/json",
-})
+# Shared pooled session (same connection pool as catalog.services.tmdb)
+SESSION = get_session()
 
 
-def tmdb_get(path, params=None):
+def tmdb_get(path, params=None, force=False):
     """
     Helper function to make a GET request to the TMDB API.
     Handles API key, language, status checks, and graceful failure.
+    Successful responses are cached per path + params (see tmdb_cache);
+    force=True refetches and re-caches even if the entry is still fresh.
     """
-    params = params or {}
-    params["api_key"] = settings.TMDB_API_KEY
+    params = dict(params or {})
     params["language"] = "en-US"
 
+    if force:
+        return refresh(path, params, lambda: _fetch(path, params))
+    return cached_fetch(path, params, lambda: _fetch(path, params))
+
+
+def _fetch(path, params):
+    """
+    Raises TMDBNotFound for (negative-cached) 404s and TMDBUnavailable while
+    the circuit breaker is open; any other failure becomes an error payload.
+    """
+    if cache.get(not_found_key(path)):
+        raise TMDBNotFound(f"TMDB resource not found: {path}")
+    check_breaker()
+    limiter.acquire()
+
+    params = {**params, "api_key": settings.TMDB_API_KEY}
     url = f"{TMDB_BASE}{path}"
 
     try:
         # Use the persistent SESSION object
         response = SESSION.get(url, params=params, timeout=10)
+    except requests.exceptions.RequestException:
+        breaker.record_failure()
+        return {
+            "results": [],
+            "error": "TMDB service unavailable"
+        }
+
+    record_status(response.status_code)
+    if response.status_code == 404:
+        cache.set(not_found_key(path), True, not_found_ttl())
+        raise TMDBNotFound(f"TMDB resource not found: {path}")
+
+    try:
         response.raise_for_status()
-        return response.json()
+        return trim(path, response.json())
 
-    except requests.exceptions.RequestException as e:
+    except requests.exceptions.RequestException:
         # 🔒 NEVER crash the app on API failure.
         # Log the error (not shown here, but recommended in a real app)
         # and return a safe, predictable, empty result structure.
@@ -40,6 +82,20 @@ def tmdb_get(path, params=None):
 
 # -------- Public (read-only) helpers --------
 
+# list helper name -> TMDB path
+LIST_PATHS = {
+    "trending_movies": "/trending/movie/week",
+    "trending_tv": "/trending/tv/week",
+    "popular_movies": "/movie/popular",
+    "popular_tv": "/tv/popular",
+    "top_rated_movies": "/movie/top_rated",
+    "top_rated_tv": "/tv/top_rated",
+    "now_playing_movies": "/movie/now_playing",
+    "movie_genres": "/genre/movie/list",
+    "tv_genres": "/genre/tv/list",
+}
+
+
 def trending_movies():
     """Fetches movies trending this week."""
     return tmdb_get("/trending/movie/week")
@@ -86,14 +142,69 @@ def tv_genres():
 
 
 def movie_details(movie_id):
-    """Fetches full details for a specific movie ID."""
-    return tmdb_get(f"/movie/{movie_id}")
+    """Fetches full details for a specific movie ID (shared metadata store first)."""
+    return tmdb_store.get_details("movie", movie_id, lambda: tmdb_get(f"/movie/{movie_id}"))
 
 
 def tv_details(tv_id):
-    """Fetches full details for a specific TV show ID."""
-    return tmdb_get(f"/tv/{tv_id}")
+    """Fetches full details for a specific TV show ID (shared metadata store first)."""
+    return tmdb_store.get_details("tv", tv_id, lambda: tmdb_get(f"/tv/{tv_id}"))
+
 
 def search_multi(query):
     """Performs a multi-target search (movies, TV, people) based on a query string."""
-    return tmdb_get("/search/multi", params={"query": query})
\ No newline at end of file
+    return tmdb_get("/search/multi", params={"query": query})
+
+
+# -------- Aggregated Home feed --------
+
+# section name -> (media type of its items, TMDB path); only the sections
+# the Home page renders
+HOME_SECTIONS = {
+    "trending_movies": ("movie", "/trending/movie/week"),
+    "trending_tv": ("tv", "/trending/tv/week"),
+    "popular_movies": ("movie", "/movie/popular"),
+    "top_rated_movies": ("movie", "/movie/top_rated"),
+    "now_playing": ("movie", "/movie/now_playing"),
+}
+
+
+def card(item, media_type):
+    """Compact representation of a list item: only what a poster card renders."""
+    return {
+        "id": item.get("id"),
+        "media_type": item.get("media_type") or media_type,
+        "title": item.get("title") or item.get("name"),
+        "poster_path": item.get("poster_path"),
+        "vote_average": item.get("vote_average"),
+        "release_date": item.get("release_date") or item.get("first_air_date"),
+    }
+
+
+def compact_section(data, media_type):
+    section = {"results": [card(item, media_type) for item in data.get("results", [])]}
+    if "error" in data:
+        section["error"] = data["error"]
+    return section
+
+
+def home_feed():
+    """
+    Fetches every Home page section concurrently (each one cached as usual)
+    and returns {"sections": {name: {"results": [cards], "error"?}}}.
+    A failing section degrades to an empty list with an error.
+    """
+    with ThreadPoolExecutor(max_workers=len(HOME_SECTIONS)) as pool:
+        futures = {
+            name: submit_in_context(pool, tmdb_get, path)
+            for name, (_, path) in HOME_SECTIONS.items()
+        }
+
+    sections = {}
+    for name, future in futures.items():
+        media_type = HOME_SECTIONS[name][0]
+        try:
+            sections[name] = compact_section(future.result(), media_type)
+        except Exception:
+            sections[name] = {"results": [], "error": "TMDB service unavailable"}
+    return {"sections": sections}
@@ -0,0 +1,115 @@
+import logging
+from typing import Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from catalog.models import TmdbTitle, TmdbSeason
+from catalog.services.tmdb_cache import is_error_payload
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------
+# READS
+# -------------------------------------------------------------------
+
+def lookup(media_type: str, tmdb_id) -> Optional[TmdbTitle]:
+    return TmdbTitle.objects.filter(media_type=media_type, tmdb_id=int(tmdb_id)).first()
+
+
+def lookup_many(keys) -> dict:
+    """
+    {(media_type, tmdb_id): TmdbTitle} for the fresh (non-stale) stored titles
+    among keys, in one query.
+    """
+    keys = {(media_type, int(tmdb_id)) for media_type, tmdb_id in keys}
+    if not keys:
+        return {}
+    now = timezone.now()
+    rows = TmdbTitle.objects.filter(tmdb_id__in={tmdb_id for _, tmdb_id in keys})
+    return {
+        (t.media_type, t.tmdb_id): t
+        for t in rows
+        if (t.media_type, t.tmdb_id) in keys and not t.is_stale(now)
+    }
+
+
+def get_details(media_type: str, tmdb_id, fetch) -> dict:
+    """
+    Details payload for a title, served from the shared store while fresh.
+    Otherwise fetch() is called and its result stored. If the refresh fails
+    the stale stored copy is returned instead of the error.
+    """
+    stored = lookup(media_type, tmdb_id)
+    if stored is not None and not stored.is_stale():
+        return stored.data
+
+    try:
+        data = fetch()
+    except Exception:
+        if stored is None:
+            raise
+        logger.warning("TMDB refresh failed, serving stored %s:%s", media_type, tmdb_id)
+        return stored.data
+
+    if is_error_payload(data):
+        return stored.data if stored is not None else data
+
+    save_details(media_type, tmdb_id, data)
+    return data
+
+
+# -------------------------------------------------------------------
+# WRITES
+# -------------------------------------------------------------------
+
+def _seasons(data: dict) -> list:
+    return [
+        s for s in data.get("seasons") or []
+        if s.get("season_number") is not None
+    ]
+
+
+def save_details(media_type: str, tmdb_id, data: dict) -> TmdbTitle:
+    """
+    Insert or refresh one title (and its seasons for TV).
+    """
+    return save_many([(media_type, tmdb_id, data)])[0]
+
+
+def save_many(entries) -> list:
+    """
+    Upsert [(media_type, tmdb_id, data), ...] into the store in one transaction.
+    """
+    now = timezone.now()
+    saved = []
+    with transaction.atomic():
+        for media_type, tmdb_id, data in entries:
+            title, _ = TmdbTitle.objects.update_or_create(
+                media_type=media_type,
+                tmdb_id=int(tmdb_id),
+                defaults={
+                    "title": (
+                        data.get("title") or data.get("name")
+                        or data.get("original_title") or data.get("original_name") or ""
+                    ),
+                    "overview": data.get("overview") or "",
+                    "poster_path": data.get("poster_path") or "",
+                    "data": data,
+                    "fetched_at": now,
+                },
+            )
+            if media_type == "tv":
+                title.seasons.all().delete()
+                TmdbSeason.objects.bulk_create([
+                    TmdbSeason(
+                        title=title,
+                        season_number=s["season_number"],
+                        name=s.get("name") or "",
+                        episode_count=s.get("episode_count") or 0,
+                    )
+                    for s in _seasons(data)
+                ], ignore_conflicts=True)
+            saved.append(title)
+    return saved
@@ -0,0 +1,117 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from catalog.services import tmdb_proxy, tmdb_store
+from catalog.services.tmdb_cache import is_error_payload
+from catalog.services.tmdb_http import background_priority, submit_in_context
+
+# list endpoints whose items get their details prefetched
+DETAIL_SOURCES = {
+    "trending_movies": "movie",
+    "trending_tv": "tv",
+    "popular_movies": "movie",
+    "popular_tv": "tv",
+    "top_rated_movies": "movie",
+    "top_rated_tv": "tv",
+    "now_playing_movies": "movie",
+}
+
+
+def _timed(name, fn):
+    """
+    Run one warm-up fetch and describe it: {"name", "ms", "bytes", "ok", "data"}.
+    """
+    start = time.perf_counter()
+    try:
+        data = fn()
+        ok = not is_error_payload(data)
+    except Exception as e:
+        data, ok = {"error": str(e)}, False
+    return {
+        "name": name,
+        "ms": round((time.perf_counter() - start) * 1000, 1),
+        "bytes": len(json.dumps(data)) if ok else 0,
+        "ok": ok,
+        "data": data,
+    }
+
+
+def top_titles(lists: dict, top_n: int) -> list:
+    """
+    Up to top_n distinct (media_type, tmdb_id), taking the lists' items
+    round-robin so every list contributes its first titles.
+    """
+    queues = [
+        [(DETAIL_SOURCES[name], item["id"]) for item in data.get("results", []) if item.get("id")]
+        for name, data in lists.items()
+        if name in DETAIL_SOURCES and not is_error_payload(data)
+    ]
+    picked = []
+    seen = set()
+    rank = 0
+    while len(picked) < top_n and any(rank < len(q) for q in queues):
+        for q in queues:
+            if rank < len(q) and q[rank] not in seen and len(picked) < top_n:
+                seen.add(q[rank])
+                picked.append(q[rank])
+        rank += 1
+    return picked
+
+
+@background_priority()
+def warm(top_n: int = 20, workers: int = 8, force: bool = False) -> list:
+    """
+    Prefetch every tmdb_proxy list endpoint, then the details of the top_n
+    titles they contain, concurrently and as background TMDB traffic (so
+    the rate limiter keeps headroom for real users).
+
+    Details are fetched concurrently but stored in one transaction from
+    the calling thread. force=True refetches entries that are still fresh.
+    Returns one report per title / endpoint (see _timed), without payloads.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list_futures = [
+            submit_in_context(
+                pool, _timed, name,
+                lambda path=path: tmdb_proxy.tmdb_get(path, force=force),
+            )
+            for name, path in tmdb_proxy.LIST_PATHS.items()
+        ]
+        reports = [f.result() for f in list_futures]
+
+        titles = top_titles({r["name"]: r["data"] for r in reports if r["ok"]}, top_n)
+
+        # titles still fresh in the metadata store need no TMDB call
+        stored = {} if force else tmdb_store.lookup_many(titles)
+        todo = [t for t in titles if t not in stored]
+        detail_futures = [
+            submit_in_context(
+                pool, _timed, f"{media_type}/{tmdb_id}",
+                lambda path=f"/{media_type}/{tmdb_id}": tmdb_proxy.tmdb_get(path, force=force),
+            )
+            for media_type, tmdb_id in todo
+        ]
+        details = [f.result() for f in detail_futures]
+
+    # stored from this thread only: one transaction, no concurrent writers
+    tmdb_store.save_many([
+        (media_type, tmdb_id, r["data"])
+        for (media_type, tmdb_id), r in zip(todo, details)
+        if r["ok"]
+    ])
+    reports += details
+    reports += [
+        {
+            "name": f"{media_type}/{tmdb_id}",
+            "ms": 0.0,
+            "bytes": len(json.dumps(title.data)),
+            "ok": True,
+            "data": None,
+        }
+        for (media_type, tmdb_id), title in stored.items()
+    ]
+
+    for r in reports:
+        del r["data"]
+    return reports
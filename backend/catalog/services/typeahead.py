@@ -0,0 +1,283 @@
+"""
+Typeahead over TMDB titles, answered locally whenever possible.
+
+An in-process prefix index (sorted array + bisect) is built from the shared
+metadata store (TmdbTitle) and extended with the titles of recent TMDB
+searches. TMDB is only asked when the index has fewer than
+TMDB_TYPEAHEAD_MIN_LOCAL hits, and every answer is cached per normalized
+prefix, so fast typists and repeated prefixes cost no outbound calls.
+"""
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from catalog.models import TmdbTitle
+from catalog.services import tmdb_proxy
+from catalog.services.tmdb_cache import CACHE_PREFIX, class_ttl, is_error_payload
+
+logger = logging.getLogger(__name__)
+
+MIN_QUERY_LENGTH = 2
+MAX_SCAN = 2000  # prefix keys inspected per lookup
+
+
+def normalize(text: str) -> str:
+    """
+    Lowercase, accents stripped, punctuation collapsed: "Amélie!" -> "amelie".
+    """
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+
+class PrefixIndex:
+    """
+    Sorted list of (key, word_position, entry_key). Every word suffix of a
+    title is a key ("the dark knight", "dark knight", "knight"), so a
+    prefix matches the start of any word; earlier-word matches rank first.
+
+    Readers never lock: add_many() builds a new key list and swaps it in,
+    so a search always sees one complete, sorted list.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys = []
+        self._entries = {}  # (media_type, id) -> (card, weight)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _keys_for(card, entry_key):
+        words = normalize(card.get("title") or "").split()
+        return [(" ".join(words[i:]), i, entry_key) for i in range(len(words))]
+
+    @classmethod
+    def build(cls, cards):
+        """
+        Bulk build from (card, weight) pairs: one sort instead of n inserts.
+        """
+        index = cls()
+        for card, weight in cards:
+            entry_key = (card["media_type"], card["id"])
+            if entry_key in index._entries:
+                continue
+            index._entries[entry_key] = (card, weight)
+            index._keys.extend(cls._keys_for(card, entry_key))
+        index._keys.sort()
+        return index
+
+    def add_many(self, cards):
+        """
+        Insert (card, weight) pairs, skipping titles already indexed.
+        """
+        with self._lock:
+            keys = list(self._keys)
+            for card, weight in cards:
+                entry_key = (card["media_type"], card["id"])
+                if entry_key in self._entries:
+                    continue
+                # entries first: a published key always has its entry
+                self._entries[entry_key] = (card, weight)
+                for key in self._keys_for(card, entry_key):
+                    insort(keys, key)
+            self._keys = keys
+
+    def add(self, card, weight=0):
+        self.add_many([(card, weight)])
+
+    def search(self, query: str, limit: int = 10) -> list:
+        prefix = normalize(query)
+        if not prefix:
+            return []
+
+        keys = self._keys
+        best = {}
+        i = bisect_left(keys, (prefix,))
+        end = min(len(keys), i + MAX_SCAN)
+        while i < end and keys[i][0].startswith(prefix):
+            _, position, entry_key = keys[i]
+            if position < best.get(entry_key, position + 1):
+                best[entry_key] = position
+            i += 1
+
+        ranked = sorted(best, key=lambda k: (best[k], -self._entries[k][1]))
+        return [self._entries[k][0] for k in ranked[:limit]]
+
+
+# -------------------------------------------------------------------
+# PROCESS-WIDE INDEX
+# -------------------------------------------------------------------
+
+_index = None
+_built_at = 0.0
+_rebuilding = False
+_build_lock = threading.Lock()
+
+_stats = {"cached": 0, "local": 0, "tmdb": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(outcome):
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def typeahead_stats() -> dict:
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["indexed_titles"] = len(_index) if _index is not None else 0
+    return stats
+
+
+# only the fields a card renders, extracted from the JSON in the database
+STORE_FIELDS = (
+    "media_type", "tmdb_id", "title", "poster_path", "data__poster_path",
+    "data__vote_count", "data__vote_average", "data__release_date", "data__first_air_date",
+)
+
+
+def _cards_from_store(limit: int):
+    rows = (
+        TmdbTitle.objects.exclude(title="")
+        .order_by("-fetched_at")
+        .values_list(*STORE_FIELDS)[:limit]
+    )
+    for media_type, tmdb_id, title, poster, data_poster, votes, vote_average, release, first_air in rows.iterator():
+        card = tmdb_proxy.card(
+            {
+                "id": tmdb_id,
+                "title": title,
+                "poster_path": poster or data_poster,
+                "vote_average": vote_average,
+                "release_date": release,
+                "first_air_date": first_air,
+            },
+            media_type,
+        )
+        yield card, votes or 0
+
+
+def _build():
+    """
+    A fresh index from TmdbTitle, keeping titles learned from recent TMDB
+    searches, swapped in once complete.
+    """
+    global _index, _built_at
+    limit = getattr(settings, "TMDB_TYPEAHEAD_MAX_TITLES", 100_000)
+    fresh = PrefixIndex.build(_cards_from_store(limit))
+    if _index is not None:
+        learned = []
+        for card, weight in list(_index._entries.values()):
+            if len(fresh) + len(learned) >= limit:
+                break
+            learned.append((card, weight))
+        fresh.add_many(learned)
+    _index, _built_at = fresh, time.monotonic()
+
+
+def _rebuild_in_background():
+    global _rebuilding
+    try:
+        _build()
+    except Exception:
+        logger.exception("Typeahead index rebuild failed")
+    finally:
+        _rebuilding = False
+        connections.close_all()
+
+
+def get_index() -> PrefixIndex:
+    """
+    The index, rebuilt from TmdbTitle every TMDB_TYPEAHEAD_REBUILD seconds
+    so titles stored by other processes show up too. Only the first build
+    runs in the request; later rebuilds run in a background thread while
+    the current index keeps serving.
+    """
+    global _rebuilding
+    max_age = getattr(settings, "TMDB_TYPEAHEAD_REBUILD", 600)
+    if _index is not None and time.monotonic() - _built_at < max_age:
+        return _index
+
+    with _build_lock:
+        if _index is None:
+            _build()
+        elif not _rebuilding and time.monotonic() - _built_at >= max_age:
+            _rebuilding = True
+            threading.Thread(target=_rebuild_in_background, daemon=True).start()
+    return _index
+
+
+def reset_index():
+    global _index, _built_at
+    with _build_lock:
+        _index, _built_at = None, 0.0
+
+
+# -------------------------------------------------------------------
+# LOOKUP
+# -------------------------------------------------------------------
+
+def _cache_key(prefix: str) -> str:
+    return f"{CACHE_PREFIX}:typeahead:{hashlib.sha1(prefix.encode('utf-8')).hexdigest()}"
+
+
+def _search_tmdb(query: str) -> list:
+    data = tmdb_proxy.search_multi(query)
+    if is_error_payload(data):
+        raise RuntimeError(data.get("error") if isinstance(data, dict) else "TMDB search failed")
+    return [
+        (tmdb_proxy.card(item, item["media_type"]), item.get("vote_count") or 0)
+        for item in data.get("results", [])
+        if item.get("media_type") in ("movie", "tv") and item.get("id")
+    ]
+
+
+def suggest(query: str, limit: int = 10) -> dict:
+    """
+    {"results": [cards], "source": "cache" | "local" | "tmdb"}
+    """
+    prefix = normalize(query)
+    if len(prefix) < MIN_QUERY_LENGTH:
+        return {"results": [], "source": "local"}
+
+    key = _cache_key(f"{prefix}:{limit}")
+    cached = cache.get(key)
+    if cached is not None:
+        _count("cached")
+        return {"results": cached, "source": "cache"}
+
+    index = get_index()
+    results = index.search(prefix, limit)
+    source = "local"
+
+    failed = False
+    if len(results) < getattr(settings, "TMDB_TYPEAHEAD_MIN_LOCAL", 5):
+        try:
+            remote = _search_tmdb(prefix)
+        except Exception as e:
+            # suggestions degrade to local hits, never to an error
+            logger.info("Typeahead TMDB search failed: %s", e)
+            remote, failed = [], True
+        if remote:
+            source = "tmdb"
+            index.add_many(remote)
+            seen = {(c["media_type"], c["id"]) for c in results}
+            results += [
+                card for card, _ in remote
+                if (card["media_type"], card["id"]) not in seen
+            ][:limit - len(results)]
+
+    _count(source)
+    if not failed:
+        cache.set(key, results, class_ttl("search"))
+    return {"results": results, "source": source}
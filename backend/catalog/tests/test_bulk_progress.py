@@ -0,0 +1,108 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from catalog.models import Content, Season, Episode
+
+User = get_user_model()
+
+
+class MarkSeasonWatchedTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.content = Content.objects.create(owner=self.user, title='Show', type='tv')
+
+    def _mark(self, season_number):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(
+                f'/api/catalog/contents/{self.content.id}/mark_season_watched/',
+                {'season_number': season_number},
+                format='json',
+            )
+        self.assertEqual(resp.status_code, 200)
+        return len(ctx)
+
+    def test_round_trips_do_not_grow_with_episode_count(self):
+        Season.objects.create(content=self.content, season_number=1, episodes_count=3)
+        Season.objects.create(content=self.content, season_number=2, episodes_count=24)
+        self.content.recalculate_progress()
+
+        small = self._mark(1)
+        large = self._mark(2)
+
+        self.assertEqual(small, large)
+        self.assertEqual(Episode.objects.filter(season__content=self.content, watched=True).count(), 27)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.watched_episodes, 27)
+        self.assertEqual(self.content.status, 'completed')
+
+    def test_fills_gaps_between_existing_episodes(self):
+        season = Season.objects.create(content=self.content, season_number=1, episodes_count=5)
+        Episode.objects.create(season=season, episode_number=2)
+        Episode.objects.create(season=season, episode_number=5)
+        self.content.recalculate_progress()
+
+        self._mark(1)
+
+        self.assertEqual(
+            list(season.episodes.values_list('episode_number', flat=True)), [1, 2, 3, 4, 5]
+        )
+        self.assertTrue(all(season.episodes.values_list('watched', flat=True)))
+
+
+class BatchProgressTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.content = Content.objects.create(owner=self.user, title='Show', type='tv')
+        Season.objects.create(content=self.content, season_number=1, episodes_count=8)
+        Season.objects.create(content=self.content, season_number=2, episodes_count=8)
+        self.content.recalculate_progress()
+
+    def _post(self, operations):
+        return self.client.post(
+            f'/api/catalog/contents/{self.content.id}/progress/',
+            {'operations': operations},
+            format='json',
+        )
+
+    def test_range_is_applied_in_one_request(self):
+        ops = [{'season_number': 2, 'episode_number': n, 'watched': True} for n in range(1, 9)]
+
+        resp = self._post(ops)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data['watched_episodes'], 8)
+        self.assertEqual(resp.data['total_episodes'], 16)
+        self.assertEqual(resp.data['progress_percent'], 50)
+        self.assertEqual(resp.data['status'], 'watching')
+
+    def test_query_count_does_not_grow_with_operations(self):
+        Content.objects.filter(pk=self.content.pk).update(status='watching')
+
+        def count(n):
+            ops = [{'season_number': 1, 'episode_number': e} for e in range(1, n + 1)]
+            with CaptureQueriesContext(connection) as ctx:
+                self._post(ops)
+            return len(ctx)
+
+        self.assertEqual(count(2), count(8))
+
+    def test_last_operation_wins_and_unwatch(self):
+        self._post([{'season_number': 1, 'episode_number': 1}])
+        resp = self._post([
+            {'season_number': 1, 'episode_number': 1, 'watched': True},
+            {'season_number': 1, 'episode_number': 1, 'watched': False},
+        ])
+
+        self.assertEqual(resp.data['watched_episodes'], 0)
+        self.assertFalse(Episode.objects.get(season__season_number=1, episode_number=1).watched)
+
+    def test_invalid_operations_are_rejected(self):
+        self.assertEqual(self._post([]).status_code, 400)
+        self.assertEqual(self._post([{'season_number': 0, 'episode_number': 1}]).status_code, 400)
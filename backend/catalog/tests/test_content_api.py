@@ -0,0 +1,103 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from catalog.models import Content, Season, Episode
+
+User = get_user_model()
+
+
+def make_show(owner, title, seasons=2, episodes=4, watched=1):
+    content = Content.objects.create(owner=owner, title=title, type='tv')
+    for n in range(1, seasons + 1):
+        season = Season.objects.create(content=content, season_number=n, episodes_count=episodes)
+        for e in range(1, episodes + 1):
+            Episode.objects.create(season=season, episode_number=e, watched=e <= watched)
+    content.recalculate_progress()
+    return content
+
+
+class ContentListQueryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _list_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get('/api/catalog/contents/')
+        self.assertEqual(resp.status_code, 200)
+        return resp, len(ctx)
+
+    def test_list_query_count_is_constant(self):
+        make_show(self.user, 'Show 1')
+        _, few = self._list_queries()
+
+        for i in range(2, 12):
+            make_show(self.user, f'Show {i}', seasons=3, episodes=10, watched=5)
+        resp, many = self._list_queries()
+
+        self.assertEqual(len(resp.data['results']), 11)
+        self.assertEqual(few, many)
+        # library version + page + seasons prefetch + episodes prefetch
+        # (no COUNT with cursors)
+        self.assertEqual(many, 4)
+
+    def test_list_progress_matches_model(self):
+        content = make_show(self.user, 'Show', seasons=2, episodes=4, watched=1)
+        Content.objects.create(owner=self.user, title='Movie', type='movie')
+
+        resp, _ = self._list_queries()
+        by_id = {row['id']: row for row in resp.data['results']}
+
+        self.assertEqual(by_id[content.id]['progress_percent'], content.progress_percent())
+        self.assertEqual(by_id[content.id]['progress_percent'], 25)
+
+    def test_list_progress_unknown_when_any_season_count_missing(self):
+        content = make_show(self.user, 'Show', seasons=1, episodes=2, watched=1)
+        Season.objects.create(content=content, season_number=2)
+        content.recalculate_progress()
+
+        resp, _ = self._list_queries()
+
+        self.assertIsNone(resp.data['results'][0]['progress_percent'])
+
+
+class ContentSummaryViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        for i in range(5):
+            make_show(self.user, f'Show {i}', seasons=5, episodes=10, watched=5)
+
+    def test_summary_has_card_fields_and_progress_only(self):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get('/api/catalog/contents/', {'view': 'summary'})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(ctx), 2)  # library version + page
+        row = resp.data['results'][0]
+        self.assertNotIn('seasons', row)
+        self.assertNotIn('overview', row)
+        self.assertEqual((row['watched_episodes'], row['total_episodes'], row['progress_percent']), (25, 50, 50))
+
+    def test_summary_payload_is_much_smaller(self):
+        full = self.client.get('/api/catalog/contents/').content
+        summary = self.client.get('/api/catalog/contents/', {'view': 'summary'}).content
+
+        self.assertGreaterEqual(len(full), 10 * len(summary))
+
+    def test_detail_and_seasons_stay_nested(self):
+        content_id = Content.objects.filter(owner=self.user).first().pk
+
+        resp = self.client.get(f'/api/catalog/contents/{content_id}/', {'view': 'summary'})
+        self.assertEqual(len(resp.data['seasons']), 5)
+
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(f'/api/catalog/contents/{content_id}/seasons/')
+        self.assertEqual(len(resp.data[0]['episodes']), 10)
+        # content + owner check + seasons + episodes prefetch
+        self.assertEqual(len(ctx), 4)
@@ -0,0 +1,147 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APIClient
+
+from catalog.models import Content
+from catalog.services.library_search import search_contents
+from catalog.services.tmdb import bulk_import, fetch_tmdb_show_and_create
+
+User = get_user_model()
+
+SHOW = {"name": "Dark", "seasons": [{"season_number": 1, "episode_count": 10}]}
+
+
+class ContentUniquenessTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+
+    def test_one_row_per_owner_and_tmdb_id(self):
+        Content.objects.create(owner=self.user, tmdb_id='70523', title='Dark')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Content.objects.create(owner=self.user, tmdb_id='70523', title='Dark (2017)')
+
+        other = User.objects.create_user(username='other', password='pass1234')
+        Content.objects.create(owner=other, tmdb_id='70523', title='Dark')
+
+    def test_manual_entries_are_not_constrained(self):
+        for tmdb_id in (None, None, '', ''):
+            Content.objects.create(owner=self.user, tmdb_id=tmdb_id, title='Home video')
+        self.assertEqual(Content.objects.filter(owner=self.user).count(), 4)
+
+    @patch('catalog.services.tmdb._load_details')
+    def test_import_racing_another_import_returns_its_row(self, mock_load):
+        def load(tmdb_id, media_type=None):
+            # the other tab wins while this import waits for TMDB
+            Content.objects.create(owner=self.user, tmdb_id='70523', title='Dark', type='tv')
+            return "tv", SHOW
+        mock_load.side_effect = load
+
+        content = fetch_tmdb_show_and_create(owner=self.user, tmdb_id=70523)
+
+        self.assertEqual(Content.objects.filter(owner=self.user).count(), 1)
+        self.assertEqual(content.pk, Content.objects.get(owner=self.user).pk)
+        self.assertEqual(list(content.seasons.values_list('season_number', flat=True)), [1])
+
+    @patch('catalog.services.tmdb.tmdb_store.save_many')
+    @patch('catalog.services.tmdb._fetch_details', return_value=("tv", SHOW))
+    def test_bulk_import_racing_another_import(self, mock_fetch, mock_save_many):
+        # the other tab wins between the duplicate check and the insert
+        mock_save_many.side_effect = lambda details: Content.objects.create(
+            owner=self.user, tmdb_id='70523', title='Dark', type='tv',
+        )
+
+        results = bulk_import(self.user, tmdb_ids=[70523, 1399])
+
+        rows = dict(Content.objects.filter(owner=self.user).values_list('tmdb_id', 'id'))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual([r["content_id"] for r in results], [rows['70523'], rows['1399']])
+
+
+class MergeDuplicatesMigrationTests(TransactionTestCase):
+    migrate_from = [('catalog', '0007_hot_query_indexes')]
+    migrate_to = [('catalog', '0009_content_unique_owner_tmdb')]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        apps = executor.loader.project_state(self.migrate_from).apps
+
+        User_ = apps.get_model('auth', 'User')
+        Content_ = apps.get_model('catalog', 'Content')
+        Season_ = apps.get_model('catalog', 'Season')
+        Episode_ = apps.get_model('catalog', 'Episode')
+
+        user = User_.objects.create(username='dup')
+        self.keeper = Content_.objects.create(owner=user, tmdb_id='70523', title='Dark', type='tv')
+        dup = Content_.objects.create(
+            owner=user, tmdb_id='70523', title='Dark (2017)', type='tv',
+            status='watching', rating=9,
+        )
+        s1 = Season_.objects.create(content=self.keeper, season_number=1, episodes_count=2)
+        Episode_.objects.create(season=s1, episode_number=1)
+        dup_s1 = Season_.objects.create(content=dup, season_number=1, episodes_count=2)
+        Episode_.objects.create(season=dup_s1, episode_number=1, watched=True)
+        Episode_.objects.create(season=dup_s1, episode_number=2, watched=True)
+        dup_s2 = Season_.objects.create(content=dup, season_number=2, episodes_count=3)
+        Episode_.objects.create(season=dup_s2, episode_number=1, watched=True)
+        Content_.objects.create(owner=user, tmdb_id=None, title='Manual')
+        Content_.objects.create(owner=user, tmdb_id=None, title='Manual')
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_duplicates_are_merged_into_the_oldest_row(self):
+        keeper = Content.objects.get(tmdb_id='70523')
+        self.assertEqual(keeper.pk, self.keeper.pk)
+        self.assertEqual((keeper.status, keeper.rating), ('watching', 9))
+        self.assertEqual(
+            sorted(keeper.seasons.values_list('season_number', 'episodes__episode_number', 'episodes__watched')),
+            [(1, 1, True), (1, 2, True), (2, 1, True)],
+        )
+        self.assertEqual((keeper.watched_episodes, keeper.total_episodes), (3, 5))
+        self.assertEqual(Content.objects.filter(tmdb_id__isnull=True).count(), 2)
+
+        # the table rebuild kept full-text search working
+        self.assertEqual(list(search_contents(Content.objects.all(), 'dark')), [keeper])
+
+
+class ContentApiUniquenessTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.dark = Content.objects.create(owner=self.user, tmdb_id='70523', title='Dark', type='tv')
+
+    def test_create_with_a_tmdb_id_already_in_the_library(self):
+        resp = self.client.post('/api/catalog/contents/', {'title': 'Dark again', 'tmdb_id': '70523'})
+
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn('tmdb_id', resp.data)
+        self.assertEqual(Content.objects.filter(owner=self.user).count(), 1)
+
+    def test_update_to_a_tmdb_id_already_in_the_library(self):
+        other = Content.objects.create(owner=self.user, tmdb_id='1399', title='GoT', type='tv')
+
+        resp = self.client.patch(f'/api/catalog/contents/{other.pk}/', {'tmdb_id': '70523'}, format='json')
+        self.assertEqual(resp.status_code, 400)
+
+        resp = self.client.patch(
+            f'/api/catalog/contents/{self.dark.pk}/', {'tmdb_id': '70523', 'rating': 9}, format='json'
+        )
+        self.assertEqual(resp.status_code, 200)
+
+    def test_race_past_validation_is_a_400(self):
+        with patch('catalog.serializers.ContentSerializer.validate', side_effect=lambda attrs: attrs):
+            resp = self.client.post('/api/catalog/contents/', {'title': 'Dark again', 'tmdb_id': '70523'})
+
+        self.assertEqual(resp.status_code, 400)
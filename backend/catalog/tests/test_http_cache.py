@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from catalog.models import Content, Wishlist
+from catalog.services.tmdb_cache import ttl_for
+
+User = get_user_model()
+
+
+class ProxyCacheHeaderTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch('catalog.services.tmdb_proxy._fetch')
+    def test_public_list_is_shared_cacheable_for_its_ttl(self, mock_fetch):
+        mock_fetch.return_value = {"results": [{"id": 1}]}
+
+        resp = APIClient().get('/api/catalog/tmdb/trending/movies/')
+
+        self.assertIn("public", resp["Cache-Control"])
+        self.assertIn(f"max-age={ttl_for('/trending/movie/week')}", resp["Cache-Control"])
+
+    @patch('catalog.services.tmdb_proxy._fetch')
+    def test_error_payload_is_not_cacheable(self, mock_fetch):
+        mock_fetch.return_value = {"results": [], "error": "TMDB service unavailable"}
+
+        resp = APIClient().get('/api/catalog/tmdb/popular/movies/')
+
+        self.assertIn("no-store", resp["Cache-Control"])
+
+
+class LibraryETagTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        Content.objects.create(owner=self.user, title='Dark', type='tv')
+
+    def test_unchanged_library_answers_304_with_only_the_version_query(self):
+        first = self.client.get('/api/catalog/contents/')
+        etag = first["ETag"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get('/api/catalog/contents/', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(len(ctx), 1)
+        self.assertIn("private", first["Cache-Control"])
+
+    def test_write_invalidates_etag(self):
+        etag = self.client.get('/api/catalog/contents/')["ETag"]
+
+        self.client.post('/api/catalog/contents/', {"title": "Lost", "type": "tv"}, format='json')
+
+        resp = self.client.get('/api/catalog/contents/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp["ETag"], etag)
+
+    def test_wishlist_conditional_get(self):
+        etag = self.client.get('/api/catalog/wishlist/')["ETag"]
+        self.assertEqual(
+            self.client.get('/api/catalog/wishlist/', HTTP_IF_NONE_MATCH=etag).status_code, 304
+        )
+
+        Wishlist.objects.create(user=self.user, tmdb_id=1, media_type='tv', title='Dark')
+
+        self.assertEqual(
+            self.client.get('/api/catalog/wishlist/', HTTP_IF_NONE_MATCH=etag).status_code, 200
+        )
+
+    def test_episode_progress_invalidates_etag(self):
+        show = Content.objects.get(owner=self.user)
+        etag = self.client.get('/api/catalog/contents/')["ETag"]
+
+        self.client.post(
+            f'/api/catalog/contents/{show.pk}/toggle_episode/',
+            {"season_number": 1, "episode_number": 1},
+            format='json',
+        )
+
+        resp = self.client.get('/api/catalog/contents/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+
+    def test_version_does_not_depend_on_the_cache(self):
+        etag = self.client.get('/api/catalog/contents/')["ETag"]
+        cache.clear()  # e.g. another worker with its own local-memory cache
+
+        resp = self.client.get('/api/catalog/contents/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)
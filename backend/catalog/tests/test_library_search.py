@@ -0,0 +1,55 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from catalog.models import Content
+
+User = get_user_model()
+
+
+class LibrarySearchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+        self.other = User.objects.create_user(username='other', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+        Content.objects.create(owner=self.user, title='Breaking Bad', type='tv', status='completed',
+                               overview='A chemistry teacher turns to crime.', tmdb_id='1396')
+        Content.objects.create(owner=self.user, title='Better Call Saul', type='tv', status='watching',
+                               overview='The lawyer from Breaking Bad.', tmdb_id='60059')
+        Content.objects.create(owner=self.user, title='The Dark Knight', type='movie',
+                               overview='Batman faces the Joker.', tmdb_id='155')
+        Content.objects.create(owner=self.other, title='Breaking Bad', type='tv', tmdb_id='1396')
+
+    def _titles(self, **params):
+        resp = self.client.get('/api/catalog/contents/', params)
+        self.assertEqual(resp.status_code, 200)
+        return [c['title'] for c in resp.json()['results']]
+
+    def test_prefix_match_ranks_title_above_overview(self):
+        self.assertEqual(self._titles(search='break'), ['Breaking Bad', 'Better Call Saul'])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self._titles(search='dark kni'), ['The Dark Knight'])
+        self.assertEqual(self._titles(search='dark saul'), [])
+
+    def test_search_combines_with_filters(self):
+        self.assertEqual(self._titles(search='bad', status='watching'), ['Better Call Saul'])
+        self.assertEqual(self._titles(search='bat', type='movie'), ['The Dark Knight'])
+
+    def test_index_follows_updates_and_deletes(self):
+        show = Content.objects.get(owner=self.user, tmdb_id='155')
+        show.title = 'Batman Begins'
+        show.save()
+        self.assertEqual(self._titles(search='begins'), ['Batman Begins'])
+
+        show.delete()
+        self.assertEqual(self._titles(search='begins'), [])
+
+    def test_query_syntax_is_neutralized(self):
+        self.assertEqual(self._titles(search='"bad* OR'), [])
+        self.assertEqual(self._titles(search='bad"'), ['Breaking Bad', 'Better Call Saul'])
+
+    def test_tmdb_id_filter(self):
+        self.assertEqual(self._titles(tmdb_id='155'), ['The Dark Knight'])
@@ -0,0 +1,68 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from catalog.models import Content
+from catalog.services.library import compute_library_stats
+
+User = get_user_model()
+
+
+class LibraryStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='stats', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+        Content.objects.create(
+            owner=self.user, title='A', type='movie', status='completed', platform='Netflix', rating=8
+        )
+        Content.objects.create(owner=self.user, title='B', type='movie', status='wishlist', platform='Netflix')
+        Content.objects.create(
+            owner=self.user, title='C', type='tv', status='watching', platform='Prime', rating=5,
+            watched_episodes=4, total_episodes=10,
+        )
+        Content.objects.create(owner=self.user, title='D', type='tv', status='watching', watched_episodes=2)
+        other = User.objects.create_user(username='other', password='pass1234')
+        Content.objects.create(owner=other, title='X', type='tv', status='completed', rating=1)
+
+    def test_aggregates(self):
+        with CaptureQueriesContext(connection) as ctx:
+            stats = compute_library_stats(self.user.pk)
+
+        self.assertEqual(len(ctx), 2)
+        self.assertEqual(stats, {
+            "total": 4,
+            "by_status": {"watching": 2, "completed": 1, "wishlist": 1},
+            "by_type": {"movie": 2, "tv": 2},
+            "by_platform": {"Netflix": 2, "Prime": 1},
+            "episodes": {"watched": 6, "total": 10},
+            "rated": 2,
+            "average_rating": 6.5,
+        })
+
+    def test_empty_library(self):
+        stats = compute_library_stats(User.objects.create_user(username='new', password='x').pk)
+        self.assertEqual(stats["total"], 0)
+        self.assertEqual(stats["episodes"], {"watched": 0, "total": 0})
+        self.assertIsNone(stats["average_rating"])
+
+    def test_endpoint_is_cached_until_the_library_changes(self):
+        self.assertEqual(self.client.get('/api/catalog/contents/stats/').data["total"], 4)
+
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get('/api/catalog/contents/stats/')
+        self.assertEqual(resp.data["total"], 4)
+        self.assertEqual(len(ctx), 1)  # the library version only
+
+        self.client.post('/api/catalog/contents/', {'title': 'E', 'type': 'movie'})
+        self.assertEqual(self.client.get('/api/catalog/contents/stats/').data["total"], 5)
+
+    def test_endpoint_not_modified(self):
+        etag = self.client.get('/api/catalog/contents/stats/')["ETag"]
+        resp = self.client.get('/api/catalog/contents/stats/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)
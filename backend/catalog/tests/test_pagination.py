@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from catalog.models import Content, Wishlist
+
+User = get_user_model()
+
+
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='pager', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _walk(self, url, params=None):
+        seen = []
+        resp = self.client.get(url, params or {})
+        while True:
+            self.assertEqual(resp.status_code, 200)
+            seen += [row['id'] for row in resp.data['results']]
+            if not resp.data['next']:
+                return seen, resp
+            resp = self.client.get(resp.data['next'])
+
+    def test_contents_pages_cover_library_newest_first(self):
+        now = timezone.now()
+        for i in range(7):
+            c = Content.objects.create(owner=self.user, title=f'Title {i}', type='movie')
+            # two rows share each timestamp: ties are broken by id
+            Content.objects.filter(pk=c.pk).update(created_at=now - timedelta(minutes=i // 2))
+
+        seen, last = self._walk('/api/catalog/contents/', {'limit': 3})
+
+        expected = list(
+            Content.objects.filter(owner=self.user).order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+        self.assertNotIn('count', last.data)
+
+    def test_count_is_optional(self):
+        Content.objects.create(owner=self.user, title='A', type='movie')
+        Content.objects.create(owner=self.user, title='B', type='tv')
+
+        with CaptureQueriesContext(connection) as without:
+            self.client.get('/api/catalog/contents/', {'type': 'tv'})
+        with CaptureQueriesContext(connection) as with_count:
+            resp = self.client.get('/api/catalog/contents/', {'type': 'tv', 'count': 'true'})
+
+        self.assertEqual(resp.data['count'], 1)
+        self.assertEqual(len(with_count), len(without) + 1)
+
+    def test_search_keeps_rank_order(self):
+        Content.objects.create(owner=self.user, title='Dark', type='tv')
+
+        resp = self.client.get('/api/catalog/contents/', {'search': 'dark'})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data['count'], 1)
+
+    def test_wishlist_is_paginated(self):
+        for i in range(5):
+            Wishlist.objects.create(user=self.user, tmdb_id=i, media_type='movie', title=f'W{i}')
+
+        seen, _ = self._walk('/api/catalog/wishlist/', {'limit': 2})
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(seen, sorted(seen, reverse=True))
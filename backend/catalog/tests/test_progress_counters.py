@@ -0,0 +1,78 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from catalog.models import Content, Season, Episode
+
+User = get_user_model()
+
+
+class ProgressCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+        self.content = Content.objects.create(owner=self.user, title='Show', type='tv')
+        self.season = Season.objects.create(content=self.content, season_number=1, episodes_count=4)
+        self.episodes = [
+            Episode.objects.create(season=self.season, episode_number=n) for n in range(1, 3)
+        ]
+        self.content.recalculate_progress()
+
+    def test_toggle_updates_counters_and_status(self):
+        self.episodes[0].toggle_watched()
+
+        self.content.refresh_from_db()
+        self.season.refresh_from_db()
+        self.assertEqual(self.content.watched_episodes, 1)
+        self.assertEqual(self.content.total_episodes, 4)
+        self.assertEqual(self.season.watched_episodes, 1)
+        self.assertEqual(self.content.progress_percent(), 25)
+        self.assertEqual(self.content.status, 'watching')
+
+        self.episodes[0].toggle_watched()
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.watched_episodes, 0)
+
+    def test_mark_all_watched_completes_show(self):
+        self.episodes[0].toggle_watched()
+        self.season.mark_all_watched()
+
+        self.content.refresh_from_db()
+        self.season.refresh_from_db()
+        self.assertEqual(self.season.watched_episodes, 4)
+        self.assertEqual(self.content.watched_episodes, 4)
+        self.assertEqual(self.content.progress_percent(), 100)
+        self.assertEqual(self.content.status, 'completed')
+
+    def test_rebuild_command_fixes_drift(self):
+        Episode.objects.filter(pk=self.episodes[1].pk).update(watched=True)
+        Season.objects.create(content=self.content, season_number=2, episodes_count=6)
+
+        call_command('rebuild_progress_counters', stdout=StringIO())
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.watched_episodes, 1)
+        self.assertEqual(self.content.total_episodes, 10)
+        self.assertEqual(self.content.seasons.get(season_number=1).watched_episodes, 1)
+
+    def test_dry_run_reports_season_and_total_drift(self):
+        Season.objects.filter(pk=self.season.pk).update(watched_episodes=3)
+        Content.objects.filter(pk=self.content.pk).update(total_episodes=2)
+
+        out = StringIO()
+        call_command('rebuild_progress_counters', '--dry-run', stdout=out)
+
+        self.assertIn(f"{self.content.pk}: total 2 -> 4, season 1 watched 3 -> 0", out.getvalue())
+        self.assertIn("1 had drifted counters", out.getvalue())
+        self.season.refresh_from_db()
+        self.assertEqual(self.season.watched_episodes, 3)
+
+        out = StringIO()
+        call_command('rebuild_progress_counters', stdout=out)
+
+        self.assertIn("1 had drifted counters", out.getvalue())
+        self.season.refresh_from_db()
+        self.content.refresh_from_db()
+        self.assertEqual((self.season.watched_episodes, self.content.total_episodes), (0, 4))
+        self.assertEqual(self.content.progress_drift(), {})
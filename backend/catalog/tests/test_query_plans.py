@@ -0,0 +1,89 @@
+"""
+EXPLAIN harness for the hot library queries: each one must be answered
+through one of its expected indexes, so a dropped or renamed index (or a
+query that stops matching one) fails here instead of in production.
+"""
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+
+from catalog.models import Content, Episode, Season, Wishlist
+
+User = get_user_model()
+
+
+def explain(queryset) -> str:
+    """
+    The query plan of queryset. On PostgreSQL sequential scans are disabled
+    for the (small) test tables, which otherwise never pay for an index.
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+class HotQueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # a library shaped like a real one (many titles per user, few
+        # episodes watched), with planner statistics gathered for it
+        cls.user = User.objects.create_user(username='planner', password='pass1234')
+        other = User.objects.create_user(username='other', password='pass1234')
+        for owner in (cls.user, other):
+            contents = Content.objects.bulk_create([
+                Content(owner=owner, title=f'Show {i}', type='tv', tmdb_id=str(1000 + i))
+                for i in range(50)
+            ])
+            seasons = Season.objects.bulk_create([
+                Season(content=c, season_number=1, episodes_count=20) for c in contents
+            ])
+            Episode.objects.bulk_create([
+                Episode(season=s, episode_number=e, watched=e <= 2)
+                for s in seasons for e in range(1, 21)
+            ])
+            Wishlist.objects.bulk_create([
+                Wishlist(user=owner, tmdb_id=i, media_type='movie', title=f'W{i}') for i in range(50)
+            ])
+        cls.season = seasons[0]
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def hot_queries(self):
+        """name -> (queryset, indexes that may serve it)"""
+        return {
+            "library page": (
+                Content.objects.filter(owner=self.user).order_by('-created_at', '-id')[:20],
+                ["content_owner_created_idx"],
+            ),
+            "import duplicate check": (
+                Content.objects.filter(owner=self.user, tmdb_id='1010').order_by('-created_at')[:1],
+                ["content_owner_tmdb_idx"],
+            ),
+            "bulk import duplicate check": (
+                Content.objects.filter(owner=self.user, tmdb_id__in=['1010', '1020']).values_list('tmdb_id', 'id'),
+                ["content_owner_tmdb_idx"],
+            ),
+            "watched episodes of a season": (
+                Episode.objects.filter(season=self.season, watched=True),
+                ["episode_watched_partial_idx", "episode_season_watched_idx"],
+            ),
+            # most episodes are unwatched: any per-season index will do
+            "unwatched episodes of a season": (
+                Episode.objects.filter(season=self.season, watched=False),
+                ["episode_season_watched_idx", "catalog_episode_season_id_episode_number"],
+            ),
+            "wishlist page": (
+                Wishlist.objects.filter(user=self.user).order_by('-created_at', '-id')[:20],
+                ["wishlist_user_created_idx"],
+            ),
+        }
+
+    def test_hot_queries_use_their_indexes(self):
+        for name, (queryset, indexes) in self.hot_queries().items():
+            with self.subTest(name):
+                plan = explain(queryset)
+                self.assertTrue(
+                    any(index in plan for index in indexes),
+                    f"{name}: expected one of {indexes}, got plan:\n{plan}",
+                )
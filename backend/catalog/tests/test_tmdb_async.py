@@ -0,0 +1,74 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+from django.core.cache import cache
+from django.test import AsyncRequestFactory, TestCase
+
+from catalog import views_tmdb_async
+from catalog.services import tmdb_async, tmdb_proxy
+
+
+class AsyncTMDBProxyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = AsyncRequestFactory()
+
+    def _get(self, view, path, *args, **params):
+        request = self.factory.get(path, params)
+        return asyncio.run(view(request, *args))
+
+    @patch('catalog.services.tmdb_async._fetch', new_callable=AsyncMock)
+    def test_list_view_fetches_once_then_serves_cache(self, mock_fetch):
+        mock_fetch.return_value = {"results": [{"id": 1}]}
+
+        first = self._get(views_tmdb_async.trending_movies, '/tmdb/trending/movies/')
+        second = self._get(views_tmdb_async.trending_movies, '/tmdb/trending/movies/')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(json.loads(second.content), {"results": [{"id": 1}]})
+        self.assertEqual(mock_fetch.await_count, 1)
+
+    @patch('catalog.services.tmdb_proxy._fetch')
+    @patch('catalog.services.tmdb_async._fetch', new_callable=AsyncMock)
+    def test_sync_and_async_share_cache_entries(self, mock_afetch, mock_fetch):
+        mock_afetch.return_value = {"results": [{"id": 2}]}
+
+        self._get(views_tmdb_async.popular_tv, '/tmdb/popular/tv/')
+
+        self.assertEqual(tmdb_proxy.popular_tv(), {"results": [{"id": 2}]})
+        mock_fetch.assert_not_called()
+
+    @patch('catalog.services.tmdb_async._fetch', new_callable=AsyncMock)
+    def test_concurrent_misses_share_one_fetch(self, mock_fetch):
+        async def slow(*args):
+            await asyncio.sleep(0.05)
+            return {"results": [{"id": 3}]}
+        mock_fetch.side_effect = slow
+
+        async def burst():
+            return await asyncio.gather(*(
+                tmdb_async.tmdb_aget("/trending/tv/week") for _ in range(20)
+            ))
+
+        results = asyncio.run(burst())
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual(mock_fetch.await_count, 1)
+
+    @patch('catalog.services.tmdb_async._fetch', new_callable=AsyncMock)
+    def test_search_without_query_skips_tmdb(self, mock_fetch):
+        resp = self._get(views_tmdb_async.search_tmdb, '/tmdb/search/')
+
+        self.assertEqual(json.loads(resp.content), {"results": []})
+        mock_fetch.assert_not_awaited()
+
+    @patch('catalog.services.tmdb_async._fetch', new_callable=AsyncMock)
+    def test_home_view_returns_compact_sections(self, mock_fetch):
+        mock_fetch.return_value = {"results": [{"id": 3, "title": "Y", "overview": "long"}]}
+
+        response = self._get(views_tmdb_async.home, '/tmdb/home/')
+
+        sections = json.loads(response.content)["sections"]
+        self.assertEqual(sections["now_playing"]["results"][0]["media_type"], "movie")
+        self.assertNotIn("overview", sections["now_playing"]["results"][0])
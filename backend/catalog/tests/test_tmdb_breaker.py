@@ -0,0 +1,141 @@
+from unittest.mock import MagicMock, patch
+
+import requests
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from catalog.services import tmdb_proxy
+from catalog.services.tmdb_http import CircuitBreaker, TMDBUnavailable, breaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTests(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(error_rate=0.5, min_requests=4, window=30, reset_timeout=10, clock=self.clock)
+
+    def test_opens_at_error_rate_then_half_opens_for_one_probe(self):
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "closed")  # below min_requests
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "open")
+        self.assertFalse(self.breaker.allow())
+
+        self.clock.now += 10
+        self.assertTrue(self.breaker.allow())   # the probe
+        self.assertFalse(self.breaker.allow())  # everyone else waits for it
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, "closed")
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_reopens(self):
+        for _ in range(4):
+            self.breaker.record_failure()
+        self.clock.now += 10
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, "open")
+        self.assertEqual(self.breaker.retry_after(), 10)
+
+    def test_old_outcomes_leave_the_window(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now += 31
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, "closed")
+
+
+class TMDBOutageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        breaker.reset()
+        self.addCleanup(breaker.reset)
+        self.client = APIClient()
+
+    def _open(self):
+        for _ in range(breaker.min_requests):
+            breaker.record_failure()
+
+    @patch('catalog.services.tmdb_proxy.SESSION')
+    def test_open_breaker_fails_fast_with_503(self, mock_session):
+        self._open()
+
+        resp = self.client.get('/api/catalog/tmdb/popular/movies/')
+
+        self.assertEqual(resp.status_code, 503)
+        self.assertIn("Retry-After", resp)
+        mock_session.get.assert_not_called()
+
+    @patch('catalog.services.tmdb_cache._spawn')
+    def test_open_breaker_serves_last_good_value(self, mock_spawn):
+        with patch('catalog.services.tmdb_proxy._fetch', return_value={"results": [{"id": 1}]}):
+            tmdb_proxy.popular_movies()
+        self._open()
+
+        with patch('catalog.services.tmdb_cache.is_fresh', return_value=False):
+            # past the TTL: stale entry served, refresh short-circuited
+            self.assertEqual(tmdb_proxy.popular_movies(), {"results": [{"id": 1}]})
+
+    @patch('catalog.services.tmdb_proxy.SESSION')
+    def test_404_is_negative_cached(self, mock_session):
+        mock_session.get.return_value = MagicMock(status_code=404)
+
+        first = self.client.get('/api/catalog/tmdb/movie/999999999/')
+        second = self.client.get('/api/catalog/tmdb/movie/999999999/')
+
+        self.assertEqual((first.status_code, second.status_code), (404, 404))
+        self.assertEqual(mock_session.get.call_count, 1)
+        self.assertEqual(breaker.state, "closed")
+
+    @patch('catalog.services.tmdb_proxy.SESSION')
+    def test_connection_errors_open_the_breaker(self, mock_session):
+        mock_session.get.side_effect = requests.ConnectionError("down")
+
+        for page in range(breaker.min_requests):
+            tmdb_proxy.tmdb_get("/movie/popular", {"page": page})
+
+        with self.assertRaises(TMDBUnavailable):
+            tmdb_proxy.tmdb_get("/movie/popular", {"page": 99})
+
+        self.assertEqual(breaker.state, "open")
+        self.assertEqual(mock_session.get.call_count, breaker.min_requests)
+
+    def test_health_endpoint_reports_state(self):
+        self.assertEqual(self.client.get('/api/catalog/tmdb/health/').json()["status"], "ok")
+        self._open()
+        body = self.client.get('/api/catalog/tmdb/health/').json()
+        self.assertEqual((body["status"], body["breaker"]["state"]), ("degraded", "open"))
+
+    @override_settings(TMDB_API_KEY="test-key")
+    def test_library_tmdb_actions_fail_fast_with_503(self):
+        user = get_user_model().objects.create_user(username='tester', password='pass1234')
+        self.client.force_authenticate(user)
+        self._open()
+
+        with patch('catalog.services.tmdb.get_session') as mock_session:
+            responses = [
+                self.client.post(
+                    '/api/catalog/contents/import_tmdb/', {"tmdb_id": 1399, "media_type": "tv"}, format='json'
+                ),
+                self.client.post('/api/catalog/contents/import_tmdb_bulk/', {"tmdb_ids": [1399]}, format='json'),
+                self.client.get('/api/catalog/contents/tmdb_search/', {"q": "dark"}),
+            ]
+
+        self.assertEqual([r.status_code for r in responses], [503, 503, 503])
+        self.assertTrue(all(int(r["Retry-After"]) >= 1 for r in responses))
+        mock_session.assert_not_called()
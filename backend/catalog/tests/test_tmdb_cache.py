@@ -0,0 +1,177 @@
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import requests
+from django.core.cache import cache
+from django.test import TestCase
+
+from catalog.services import tmdb_cache, tmdb_proxy, tmdb_http
+from catalog.services.tmdb_cache import cached_fetch, make_key, ttl_for
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = payload
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+class TMDBProxyCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch('catalog.services.tmdb_proxy.SESSION')
+    def test_second_call_is_served_from_cache(self, mock_session):
+        mock_session.get.return_value = _response({"results": [{"id": 1}]})
+
+        first = tmdb_proxy.trending_movies()
+        second = tmdb_proxy.trending_movies()
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_session.get.call_count, 1)
+
+    @patch('catalog.services.tmdb_proxy.SESSION')
+    def test_error_payload_is_not_cached(self, mock_session):
+        mock_session.get.side_effect = [
+            requests.ConnectionError("down"),
+            _response({"results": [{"id": 1}]}),
+        ]
+
+        self.assertIn("error", tmdb_proxy.popular_tv())
+        self.assertEqual(tmdb_proxy.popular_tv(), {"results": [{"id": 1}]})
+        self.assertEqual(mock_session.get.call_count, 2)
+
+    def test_key_ignores_api_key_order_and_query_case(self):
+        a = make_key("/search/multi", {"query": " Dark ", "api_key": "x", "page": 1})
+        b = make_key("/search/multi", {"page": "1", "query": "dark"})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, make_key("/search/multi", {"query": "dark", "page": 2}))
+
+    def test_ttl_tiers(self):
+        self.assertGreater(ttl_for("/genre/movie/list"), ttl_for("/trending/movie/week"))
+        self.assertGreater(ttl_for("/trending/movie/week"), ttl_for("/movie/550"))
+
+
+class TMDBCoalescingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_concurrent_misses_share_one_fetch(self):
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            release.wait(2)
+            return {"results": [{"id": 7}]}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                cached_fetch("/trending/movie/week", {}, slow_fetch)
+            ))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        release.set()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"results": [{"id": 7}]}] * 5)
+
+    @patch('catalog.services.tmdb_cache._spawn', side_effect=lambda fn: fn())
+    def test_stale_entry_is_served_then_refreshed(self, mock_spawn):
+        cached_fetch("/movie/popular", {}, lambda: {"results": ["old"]})
+
+        with patch('catalog.services.tmdb_cache.time.time', return_value=time.time() + 60 * 60 + 1):
+            stale = cached_fetch("/movie/popular", {}, lambda: {"results": ["new"]})
+
+        self.assertEqual(stale, {"results": ["old"]})
+        mock_spawn.assert_called_once()
+        self.assertEqual(
+            cached_fetch("/movie/popular", {}, lambda: {"results": ["newer"]}),
+            {"results": ["new"]},
+        )
+
+
+class TMDBSessionTests(TestCase):
+    def test_both_clients_share_one_pooled_session(self):
+        self.assertIs(tmdb_proxy.SESSION, tmdb_http.get_session())
+
+        adapter = tmdb_http.get_session().get_adapter("https://api.themoviedb.org")
+        self.assertEqual(adapter.max_retries.status_forcelist, (429, 500, 502, 503, 504))
+
+    def test_connection_stats_shape(self):
+        stats = tmdb_http.connection_stats()
+        self.assertEqual(
+            set(stats), {"requests", "connections_opened", "connections_reused"}
+        )
+
+
+class TMDBHomeFeedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch('catalog.services.tmdb_proxy._fetch')
+    def test_failed_section_degrades_alone(self, mock_fetch):
+        def fetch(path, params):
+            if path == "/movie/popular":
+                return {"results": [], "error": "TMDB service unavailable"}
+            return {"results": [{"id": 1, "name": "X", "poster_path": "/x.jpg",
+                                 "vote_average": 8.1, "popularity": 99, "genre_ids": [1]}]}
+        mock_fetch.side_effect = fetch
+
+        sections = tmdb_proxy.home_feed()["sections"]
+
+        self.assertEqual(set(sections), {
+            "trending_movies", "trending_tv", "popular_movies", "top_rated_movies", "now_playing",
+        })
+        self.assertEqual(sections["popular_movies"]["results"], [])
+        self.assertIn("error", sections["popular_movies"])
+        self.assertEqual(sections["trending_tv"]["results"], [{
+            "id": 1, "media_type": "tv", "title": "X", "poster_path": "/x.jpg",
+            "vote_average": 8.1, "release_date": None,
+        }])
+
+    @patch('catalog.services.tmdb_proxy._fetch')
+    def test_home_feed_reuses_section_cache(self, mock_fetch):
+        mock_fetch.return_value = {"results": []}
+
+        tmdb_proxy.home_feed()
+        tmdb_proxy.home_feed()
+
+        self.assertEqual(mock_fetch.call_count, len(tmdb_proxy.HOME_SECTIONS))
+
+
+class CacheConfigTests(TestCase):
+    def test_cache_url_schemes(self):
+        from moviemate_project.caches import cache_from_url
+
+        redis = cache_from_url("redis://cache:6379/1", key_prefix="mm", version=2)
+        self.assertTrue(redis["BACKEND"].endswith("RedisCache"))
+        self.assertEqual(
+            (redis["LOCATION"], redis["KEY_PREFIX"], redis["VERSION"]),
+            ("redis://cache:6379/1", "mm", 2),
+        )
+        self.assertEqual(cache_from_url("memcached://mc:11211")["LOCATION"], "mc:11211")
+        self.assertEqual(cache_from_url("file:///tmp/mm-cache")["LOCATION"], "/tmp/mm-cache")
+        self.assertEqual(cache_from_url("db://moviemate_cache")["LOCATION"], "moviemate_cache")
+        with self.assertRaises(ValueError):
+            cache_from_url("mongo://nope")
+
+    def test_hit_rate_counts_fresh_stale_and_misses(self):
+        cache.clear()
+        before = tmdb_cache.cache_stats()
+
+        cached_fetch("/movie/popular", {"page": 9}, lambda: {"results": []})
+        cached_fetch("/movie/popular", {"page": 9}, lambda: {"results": []})
+
+        after = tmdb_cache.cache_stats()
+        self.assertEqual(after["misses"] - before["misses"], 1)
+        self.assertEqual(after["hits"] - before["hits"], 1)
+        self.assertIsNotNone(after["hit_rate"])
@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from catalog.services import tmdb_proxy
+from catalog.services.tmdb_fields import parse_fields, project, trim
+
+
+TV_DETAILS = {
+    "id": 1399,
+    "name": "Game of Thrones",
+    "overview": "...",
+    "poster_path": "/got.jpg",
+    "credits": {"cast": [{"id": i} for i in range(50)]},
+    "networks": [{"id": 49, "name": "HBO"}],
+    "production_companies": [{"id": 1}],
+    "seasons": [
+        {"season_number": 1, "episode_count": 10, "name": "S1", "overview": "long text"},
+    ],
+}
+
+
+class TMDBFieldProjectionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_details_trimmed_to_default_schema(self):
+        slim = trim("/tv/1399", TV_DETAILS)
+
+        self.assertNotIn("credits", slim)
+        self.assertNotIn("networks", slim)
+        self.assertEqual(slim["seasons"], [{"season_number": 1, "episode_count": 10, "name": "S1"}])
+
+    def test_list_items_trimmed_and_pagination_kept(self):
+        slim = trim("/movie/popular", {
+            "page": 1, "total_pages": 5,
+            "results": [{"id": 1, "title": "A", "adult": False, "popularity": 3.2}],
+        })
+        self.assertEqual(slim, {"page": 1, "total_pages": 5, "results": [{"id": 1, "title": "A"}]})
+
+    def test_error_and_unknown_payloads_untouched(self):
+        error = {"results": [], "error": "TMDB service unavailable", "x": 1}
+        self.assertEqual(trim("/movie/popular", error), error)
+        genres = {"genres": [{"id": 1, "name": "Drama"}]}
+        self.assertEqual(trim("/genre/movie/list", genres), genres)
+
+    def test_fields_param_projection(self):
+        self.assertIsNone(parse_fields(""))
+        data = {"page": 1, "results": [{"id": 1, "title": "A", "overview": "o"}]}
+        self.assertEqual(
+            project(data, parse_fields("title, poster_path")),
+            {"page": 1, "results": [{"id": 1, "title": "A"}]},
+        )
+
+    @patch('catalog.services.tmdb_proxy.SESSION')
+    def test_cached_details_are_already_slim(self, mock_session):
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = TV_DETAILS
+        mock_session.get.return_value = resp
+
+        response = APIClient().get('/api/catalog/tmdb/tv/1399/', {"fields": "name"})
+
+        self.assertEqual(response.json(), {"id": 1399, "name": "Game of Thrones"})
+        self.assertNotIn("credits", tmdb_proxy.tv_details(1399))
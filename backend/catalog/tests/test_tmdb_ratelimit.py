@@ -0,0 +1,157 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from urllib3.exceptions import MaxRetryError
+
+from catalog.services import tmdb_http
+from catalog.services.tmdb import _fetch as tmdb_fetch
+from catalog.services.tmdb_http import (
+    BACKGROUND,
+    INTERACTIVE,
+    RateLimiter,
+    TMDBUnavailable,
+    background_priority,
+    submit_in_context,
+    tmdb_priority,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimiterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(rate=10, burst=5, reserve=2, clock=self.clock)
+
+    def test_background_leaves_reserve_for_interactive(self):
+        taken = 0
+        while self.limiter.try_acquire(BACKGROUND) == 0:
+            taken += 1
+        self.assertEqual(taken, 3)
+
+        self.assertEqual(self.limiter.try_acquire(INTERACTIVE), 0)
+        self.assertEqual(self.limiter.try_acquire(INTERACTIVE), 0)
+        self.assertGreater(self.limiter.try_acquire(INTERACTIVE), 0)
+
+        self.clock.now += 0.1  # one token refilled
+        self.assertEqual(self.limiter.try_acquire(INTERACTIVE), 0)
+
+    def test_interactive_gives_up_past_max_wait(self):
+        self.limiter.pause(60)
+        with self.assertRaises(TMDBUnavailable):
+            self.limiter.acquire(INTERACTIVE, timeout=1)
+
+    def test_shared_mode_counts_in_cache(self):
+        shared = RateLimiter(rate=3, burst=3, reserve=1, shared=True, clock=self.clock)
+        waits = [shared.try_acquire(BACKGROUND) for _ in range(3)]
+        self.assertEqual(waits[:2], [0, 0])
+        self.assertGreater(waits[2], 0)
+
+        other_process = RateLimiter(rate=3, burst=3, reserve=1, shared=True, clock=self.clock)
+        self.assertEqual(other_process.try_acquire(INTERACTIVE), 0)  # the reserved token
+        self.assertGreater(other_process.try_acquire(INTERACTIVE), 0)
+
+    def test_429_retry_after_pauses_limiter(self):
+        response = MagicMock(status=429, headers={"Retry-After": "7"})
+        retry = tmdb_http.get_session().get_adapter("https://").max_retries
+
+        with patch.object(tmdb_http.limiter, "pause") as mock_pause, \
+                patch.object(tmdb_http.limiter, "acquire"):
+            retry = retry.increment("GET", "/movie/popular", response=response)
+
+        mock_pause.assert_called_once_with(7.0)
+        self.assertFalse(retry.respect_retry_after_header)  # waited out in the limiter
+
+    def test_every_retry_takes_a_token(self):
+        response = MagicMock(status=503, headers={})
+        retry = tmdb_http.get_session().get_adapter("https://").max_retries
+
+        with patch.object(tmdb_http.limiter, "acquire") as mock_acquire:
+            for _ in range(retry.total):
+                retry = retry.increment("GET", "/movie/popular", response=response)
+            self.assertEqual(mock_acquire.call_count, 3)
+
+            with self.assertRaises(MaxRetryError):
+                retry.increment("GET", "/movie/popular", response=response)
+        self.assertEqual(mock_acquire.call_count, 3)
+
+    @override_settings(TMDB_API_KEY="test-key")
+    def test_retry_giving_up_on_the_limiter_is_unavailable(self):
+        cache.clear()
+        with patch.object(tmdb_http.limiter, "acquire"), \
+                patch("catalog.services.tmdb.get_session") as mock_session, \
+                patch("catalog.services.tmdb.breaker.record_failure") as mock_failure:
+            mock_session.return_value.get.side_effect = TMDBUnavailable("rate limited")
+            with self.assertRaises(TMDBUnavailable):
+                tmdb_fetch("/movie/550", {})
+        mock_failure.assert_not_called()
+
+
+@override_settings(CACHES={
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "test_ratelimit_cache",
+    }
+})
+class SharedLimiterDatabaseCacheTests(TestCase):
+    """
+    CACHE_URL=db://: the async path must not touch the ORM-backed cache
+    synchronously from the event loop.
+    """
+
+    def setUp(self):
+        call_command("createcachetable", verbosity=0)
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(rate=2, burst=2, reserve=0, shared=True, clock=self.clock)
+
+    def test_async_acquire_counts_in_shared_cache(self):
+        self.assertEqual(async_to_sync(self.limiter.atry_acquire)(INTERACTIVE), 0)
+        self.assertEqual(self.limiter.try_acquire(INTERACTIVE), 0)
+        self.assertGreater(async_to_sync(self.limiter.atry_acquire)(INTERACTIVE), 0)
+
+        self.clock.now += 1
+        async_to_sync(self.limiter.aacquire)(INTERACTIVE, 1)
+
+    def test_async_pause_is_shared(self):
+        async_to_sync(self.limiter.apause)(30)
+
+        other_process = RateLimiter(rate=2, burst=2, reserve=0, shared=True, clock=self.clock)
+        self.assertGreater(other_process.try_acquire(INTERACTIVE), 29)
+        with self.assertRaises(TMDBUnavailable):
+            async_to_sync(other_process.aacquire)(INTERACTIVE, 1)
+
+
+class PriorityContextTests(TestCase):
+    def test_priority_follows_work_into_thread_pools(self):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            with background_priority():
+                inherited = submit_in_context(pool, tmdb_priority.get).result()
+                plain = pool.submit(tmdb_priority.get).result()
+
+        self.assertEqual(inherited, BACKGROUND)
+        self.assertEqual(plain, INTERACTIVE)
+        self.assertEqual(tmdb_priority.get(), INTERACTIVE)
+
+    def test_workers_close_their_db_connections(self):
+        with patch("catalog.services.tmdb_http.connections") as mock_connections:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                submit_in_context(pool, lambda: 1).result()
+                with self.assertRaises(RuntimeError):
+                    submit_in_context(pool, self._boom).result()
+
+        self.assertEqual(mock_connections.close_all.call_count, 2)
+
+    @staticmethod
+    def _boom():
+        raise RuntimeError("boom")
@@ -1,28 +1,40 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from unittest.mock import patch
-import requests
-from catalog.services.tmdb import fetch_tmdb_show_and_create
+from django.core.cache import cache
+from django.core.cache.backends.base import InvalidCacheKey, memcache_key_warnings
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import override_settings
+from rest_framework.test import APIClient
+from catalog.models import Content, TmdbTitle
+from catalog.services.tmdb import (
+    TMDBNotFound, bulk_import, fetch_tmdb_show_and_create, known_media_type, remember_media_types, search_tmdb_by_query,
+)
 
 User = get_user_model()
 
+
 class TMDBServiceTests(TestCase):
     def setUp(self):
         # Create a dummy user for testing
         self.user = User.objects.create_user(username='tester', password='pass1234')
+        cache.clear()
 
     @patch('catalog.services.tmdb._get')
     def test_fetch_tv_creates_content_and_seasons(self, mock__get):
-        # 1. Simulate a TV details response from TMDB
-        mock__get.return_value = {
-            "name": "Fake Show",
-            "poster_path": "/poster.jpg",
-            "overview": "A fake show overview.",
-            "seasons": [
-                {"season_number": 1, "episode_count": 2},
-                {"season_number": 2, "episode_count": 3}
-            ]
-        }
+        # 1. Simulate a TV details response from TMDB (and no movie with that id)
+        mock__get.side_effect = [
+            {
+                "name": "Fake Show",
+                "poster_path": "/poster.jpg",
+                "overview": "A fake show overview.",
+                "seasons": [
+                    {"season_number": 1, "episode_count": 2},
+                    {"season_number": 2, "episode_count": 3}
+                ]
+            },
+            TMDBNotFound("not a movie"),
+        ]
 
         # 2. Call the function
         content = fetch_tmdb_show_and_create(owner=self.user, tmdb_id=99999)
@@ -38,9 +50,9 @@ class TMDBServiceTests(TestCase):
 
     @patch('catalog.services.tmdb._get')
     def test_fetch_movie_creates_movie_content(self, mock__get):
-        # Simulate fetch_tv_details raising HTTPError so code falls back to movie
+        # Simulate fetch_tv_details answering 404 so code falls back to movie
         mock__get.side_effect = [
-            requests.HTTPError("not a tv"),  # First call (TV) fails
+            TMDBNotFound("not a tv"),  # First call (TV) fails
             {   # Second call (Movie) succeeds
                 "title": "Fake Movie",
                 "poster_path": "/movieposter.jpg",
@@ -52,4 +64,136 @@ class TMDBServiceTests(TestCase):
 
         self.assertEqual(content.title, "Fake Movie")
         self.assertEqual(content.type, 'movie')
-        self.assertEqual(content.seasons.count(), 0)
\ No newline at end of file
+        self.assertEqual(content.seasons.count(), 0)
+
+    @patch('catalog.services.tmdb._get')
+    def test_other_errors_do_not_fall_back_to_movie(self, mock__get):
+        mock__get.side_effect = RuntimeError("TMDB request failed: 503")
+
+        with self.assertRaises(RuntimeError):
+            fetch_tmdb_show_and_create(owner=self.user, tmdb_id=11111)
+        self.assertEqual(mock__get.call_count, 1)
+
+    @patch('catalog.services.tmdb._get')
+    def test_explicit_media_type_makes_one_call(self, mock__get):
+        mock__get.return_value = {"title": "Fake Movie"}
+
+        content = fetch_tmdb_show_and_create(owner=self.user, tmdb_id=22222, media_type="movie")
+
+        self.assertEqual(content.type, 'movie')
+        mock__get.assert_called_once_with("/movie/22222")
+
+    @patch('catalog.services.tmdb._get')
+    def test_known_media_type_is_used_for_untyped_import(self, mock__get):
+        remember_media_types([(33333, "movie")])
+        mock__get.return_value = {"title": "Seen In Search"}
+
+        content = fetch_tmdb_show_and_create(owner=self.user, tmdb_id=33333)
+
+        self.assertEqual(content.type, 'movie')
+        mock__get.assert_called_once_with("/movie/33333")
+
+    @patch('catalog.services.tmdb._get')
+    def test_id_shared_by_a_movie_and_a_show_is_not_remembered(self, mock__get):
+        mock__get.return_value = {"results": [
+            {"id": 44444, "media_type": "movie", "title": "Same Id Movie"},
+            {"id": 44444, "media_type": "tv", "name": "Same Id Show"},
+            {"id": 55555, "media_type": "tv", "name": "Only Show"},
+        ]}
+        search_tmdb_by_query("same id")
+        remember_media_types([(66666, "movie")])
+        remember_media_types([(66666, "tv")])
+
+        self.assertIsNone(known_media_type(44444))
+        self.assertIsNone(known_media_type(66666))
+        self.assertEqual(known_media_type(55555), "tv")
+
+    @patch('catalog.services.tmdb._get')
+    def test_untyped_import_of_an_ambiguous_id_is_refused(self, mock__get):
+        mock__get.side_effect = lambda path: {"title": "Movie"} if path.startswith("/movie/") else {"name": "Show"}
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        resp = client.post('/api/catalog/contents/import_tmdb/', {"tmdb_id": 44444}, format='json')
+
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("media_type", resp.data["detail"])
+        self.assertFalse(Content.objects.exists())
+        self.assertFalse(TmdbTitle.objects.exists())
+
+    @patch('catalog.services.tmdb._get')
+    def test_untyped_import_is_not_remembered_as_a_hint(self, mock__get):
+        mock__get.side_effect = [{"name": "Only Show"}, TMDBNotFound("not a movie")]
+
+        content = fetch_tmdb_show_and_create(owner=self.user, tmdb_id=77777)
+
+        self.assertEqual(content.type, 'tv')
+        self.assertIsNone(known_media_type(77777))
+
+
+class MemcachedKeysCache(LocMemCache):
+    """LocMemCache that validates keys the way the memcached backends do."""
+
+    def validate_key(self, key):
+        for warning in memcache_key_warnings(key):
+            raise InvalidCacheKey(warning)
+
+
+@override_settings(CACHES={
+    "default": {"BACKEND": "catalog.tests.test_tmdb_service.MemcachedKeysCache"},
+})
+class MemcachedCacheKeyTests(TestCase):
+    @patch('catalog.services.tmdb._get')
+    def test_search_cache_key_is_memcached_safe(self, mock__get):
+        mock__get.return_value = {"results": [{"id": 1396, "media_type": "tv", "name": "Breaking Bad"}]}
+        query = "breaking bad " + "x" * 300
+
+        self.assertEqual(search_tmdb_by_query(query)[0]["id"], 1396)
+        self.assertEqual(search_tmdb_by_query(query.upper())[0]["id"], 1396)
+        mock__get.assert_called_once()
+
+
+class BulkImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pass1234')
+
+    @patch('catalog.services.tmdb.search_tmdb_by_query')
+    @patch('catalog.services.tmdb._fetch_details')
+    def test_bulk_import_dedupes_and_creates(self, mock_fetch, mock_search):
+        Content.objects.create(owner=self.user, tmdb_id='1', title='Already here')
+        mock_search.return_value = [{"id": 3, "media_type": "tv"}]
+
+        def fetch(tmdb_id, media_type=None):
+            if str(tmdb_id) == '2':
+                return "movie", {"title": "Movie Two"}
+            if str(tmdb_id) == '3':
+                return "tv", {"name": "Show Three", "seasons": [
+                    {"season_number": 0, "episode_count": 1},
+                    {"season_number": 1, "episode_count": 10},
+                ]}
+            raise RuntimeError("TMDB request failed: 404")
+        mock_fetch.side_effect = fetch
+
+        results = bulk_import(self.user, tmdb_ids=[1, 2, 2, 404], queries=["show three"])
+
+        self.assertEqual(
+            [r["status"] for r in results],
+            ["exists", "created", "duplicate", "error", "created"],
+        )
+        show = Content.objects.get(owner=self.user, tmdb_id='3')
+        self.assertEqual(show.type, 'tv')
+        self.assertEqual(show.total_episodes, 10)
+        self.assertEqual(list(show.seasons.values_list('season_number', flat=True)), [1])
+        self.assertEqual(results[4]["content_id"], show.id)
+        self.assertEqual(mock_fetch.call_count, 3)
+
+    @patch('catalog.views.bulk_import', side_effect=RuntimeError("secret internals"))
+    def test_bulk_import_failure_is_a_generic_500(self, mock_bulk):
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        with self.assertLogs('catalog.views', level='ERROR'):
+            resp = client.post('/api/catalog/contents/import_tmdb_bulk/', {"tmdb_ids": [1]}, format='json')
+
+        self.assertEqual(resp.status_code, 500)
+        self.assertNotIn("secret", str(resp.data))
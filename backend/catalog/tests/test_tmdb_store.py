@@ -0,0 +1,66 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from catalog.models import TmdbTitle
+from catalog.services import tmdb_proxy
+from catalog.services.tmdb import fetch_tmdb_show_and_create
+
+User = get_user_model()
+
+SHOW = {
+    "name": "Popular Show",
+    "overview": "Everyone imports this.",
+    "poster_path": "/show.jpg",
+    "seasons": [
+        {"season_number": 0, "episode_count": 2, "name": "Specials"},
+        {"season_number": 1, "episode_count": 8, "name": "Season 1"},
+    ],
+}
+
+
+class TMDBMetadataStoreTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.alice = User.objects.create_user(username='alice', password='pass1234')
+        self.bob = User.objects.create_user(username='bob', password='pass1234')
+
+    @patch('catalog.services.tmdb._get', return_value=SHOW)
+    def test_second_import_needs_no_outbound_call(self, mock__get):
+        fetch_tmdb_show_and_create(owner=self.alice, tmdb_id=1396, media_type="tv")
+        cache.clear()  # the store alone must be enough
+        content = fetch_tmdb_show_and_create(owner=self.bob, tmdb_id=1396, media_type="tv")
+
+        self.assertEqual(mock__get.call_count, 1)
+        self.assertEqual(content.title, "Popular Show")
+        self.assertEqual(content.total_episodes, 8)
+        stored = TmdbTitle.objects.get(media_type="tv", tmdb_id=1396)
+        self.assertEqual(stored.seasons.count(), 2)
+
+    @patch('catalog.services.tmdb_proxy._fetch')
+    def test_details_proxy_is_served_from_store(self, mock_fetch):
+        TmdbTitle.objects.create(
+            media_type="movie", tmdb_id=550, title="Fight Club",
+            data={"id": 550, "title": "Fight Club"}, fetched_at=timezone.now(),
+        )
+
+        self.assertEqual(tmdb_proxy.movie_details(550)["title"], "Fight Club")
+        mock_fetch.assert_not_called()
+
+    @patch('catalog.services.tmdb_proxy._fetch')
+    def test_stale_entry_is_refreshed_and_kept_on_error(self, mock_fetch):
+        TmdbTitle.objects.create(
+            media_type="movie", tmdb_id=550, title="Old",
+            data={"title": "Old"}, fetched_at=timezone.now() - timedelta(days=365),
+        )
+
+        mock_fetch.return_value = {"results": [], "error": "TMDB service unavailable"}
+        self.assertEqual(tmdb_proxy.movie_details(550), {"title": "Old"})
+
+        mock_fetch.return_value = {"title": "New"}
+        self.assertEqual(tmdb_proxy.movie_details(550), {"title": "New"})
+        self.assertEqual(TmdbTitle.objects.get(tmdb_id=550).title, "New")
@@ -0,0 +1,58 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from catalog.models import TmdbTitle
+from catalog.services import tmdb_proxy
+from catalog.services.tmdb_warm import top_titles, warm
+
+
+def fake_fetch(path, params):
+    if path.startswith("/genre/"):
+        return {"genres": [{"id": 1, "name": "Drama"}]}
+    if path.endswith(("/movie/week", "/movie/popular", "/movie/top_rated", "/movie/now_playing")):
+        return {"results": [{"id": 10, "title": "M"}, {"id": 11, "title": "N"}]}
+    if path.startswith(("/trending/tv", "/tv/popular", "/tv/top_rated")):
+        return {"results": [{"id": 20, "name": "T"}]}
+    return {"id": int(path.rsplit("/", 1)[1]), "title": "x"}
+
+
+class WarmTMDBCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_top_titles_round_robin_and_dedupe(self):
+        lists = {
+            "trending_movies": {"results": [{"id": 1}, {"id": 2}]},
+            "trending_tv": {"results": [{"id": 1}]},
+            "popular_movies": {"results": [{"id": 1}, {"id": 3}]},
+        }
+        self.assertEqual(top_titles(lists, 3), [("movie", 1), ("tv", 1), ("movie", 2)])
+
+    @patch('catalog.services.tmdb_proxy._fetch', side_effect=fake_fetch)
+    def test_warm_fills_lists_details_and_store(self, mock_fetch):
+        reports = warm(top_n=5, workers=4)
+
+        self.assertEqual([r for r in reports if not r["ok"]], [])
+        self.assertEqual(len(reports), len(tmdb_proxy.LIST_PATHS) + 3)
+        self.assertEqual(TmdbTitle.objects.count(), 3)
+
+        calls = mock_fetch.call_count
+        tmdb_proxy.popular_movies()
+        tmdb_proxy.movie_details(10)
+        self.assertEqual(mock_fetch.call_count, calls)
+
+    @patch('catalog.services.tmdb_proxy._fetch', side_effect=fake_fetch)
+    def test_force_refetches_fresh_entries(self, mock_fetch):
+        warm(top_n=0)
+        warm(top_n=0, force=True)
+        self.assertEqual(mock_fetch.call_count, 2 * len(tmdb_proxy.LIST_PATHS))
+
+    @patch('catalog.services.tmdb_proxy._fetch', side_effect=fake_fetch)
+    def test_command_reports_summary(self, mock_fetch):
+        out = StringIO()
+        call_command("warm_tmdb_cache", "--top", "2", stdout=out)
+        self.assertIn(f"Warmed {len(tmdb_proxy.LIST_PATHS) + 2}/{len(tmdb_proxy.LIST_PATHS) + 2}", out.getvalue())
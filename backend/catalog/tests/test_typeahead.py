@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from catalog.models import TmdbTitle
+from catalog.services import typeahead
+from catalog.services.typeahead import PrefixIndex, normalize
+
+
+def make_card(tmdb_id, title, media_type="movie"):
+    return {"id": tmdb_id, "media_type": media_type, "title": title}
+
+
+class PrefixIndexTests(TestCase):
+    def test_normalize(self):
+        self.assertEqual(normalize("  Amélie!  "), "amelie")
+        self.assertEqual(normalize("Spider-Man: No Way"), "spider man no way")
+
+    def test_matches_word_prefixes_title_start_first(self):
+        index = PrefixIndex.build([
+            (make_card(1, "The Dark Knight"), 100),
+            (make_card(2, "Knight and Day"), 10),
+            (make_card(3, "Knives Out"), 500),
+            (make_card(4, "Darkest Hour"), 50),
+        ])
+
+        self.assertEqual([c["id"] for c in index.search("kni")], [3, 2, 1])
+        self.assertEqual([c["id"] for c in index.search("dark")], [4, 1])
+        self.assertEqual([c["id"] for c in index.search("dark kn")], [1])
+        self.assertEqual(index.search("zzz"), [])
+
+    def test_add_keeps_index_sorted_and_unique(self):
+        index = PrefixIndex.build([(make_card(1, "Alien"), 1)])
+        index.add(make_card(2, "Aliens"), 5)
+        index.add(make_card(2, "Aliens"), 5)
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index._keys, sorted(index._keys))
+        self.assertEqual([c["id"] for c in index.search("ali")], [2, 1])
+
+    def test_add_swaps_in_a_new_key_list(self):
+        index = PrefixIndex.build([(make_card(1, "Alien"), 1)])
+        snapshot = index._keys
+        index.add_many([(make_card(2, "Aliens"), 5), (make_card(3, "Avatar"), 3)])
+
+        self.assertIsNot(index._keys, snapshot)
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual([c["id"] for c in index.search("a")], [2, 3, 1])
+
+
+@override_settings(TMDB_TYPEAHEAD_MIN_LOCAL=2)
+class SuggestTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        typeahead.reset_index()
+        for tmdb_id, title in [(1, "Breaking Bad"), (2, "Better Call Saul"), (3, "Bread")]:
+            TmdbTitle.objects.create(
+                media_type="tv", tmdb_id=tmdb_id, title=title,
+                data={"vote_count": tmdb_id}, fetched_at=timezone.now(),
+            )
+
+    def tearDown(self):
+        typeahead.reset_index()
+
+    @patch("catalog.services.tmdb_proxy.search_multi")
+    def test_local_hits_skip_tmdb(self, mock_search):
+        data = typeahead.suggest("bre")
+
+        self.assertEqual(data["source"], "local")
+        self.assertEqual([c["title"] for c in data["results"]], ["Bread", "Breaking Bad"])
+        mock_search.assert_not_called()
+
+        self.assertEqual(typeahead.suggest("BRE")["source"], "cache")
+
+    @patch("catalog.services.tmdb_proxy.search_multi")
+    def test_few_local_hits_ask_tmdb_once_and_learn(self, mock_search):
+        mock_search.return_value = {"results": [
+            {"id": 9, "media_type": "movie", "title": "Saw", "vote_count": 7},
+            {"id": 5, "media_type": "person", "name": "Sawyer"},
+        ]}
+
+        data = typeahead.suggest("sa")
+        self.assertEqual(data["source"], "tmdb")
+        self.assertEqual([c["title"] for c in data["results"]], ["Better Call Saul", "Saw"])
+
+        self.assertEqual(typeahead.suggest("sa")["source"], "cache")
+        mock_search.assert_called_once_with("sa")
+
+        # learned from the search: found locally from now on
+        self.assertEqual(typeahead.get_index().search("saw")[0]["id"], 9)
+
+    @patch("catalog.services.tmdb_proxy.search_multi", return_value={"error": "TMDB unavailable"})
+    def test_tmdb_failure_returns_local_hits_uncached(self, mock_search):
+        data = typeahead.suggest("sau")
+
+        self.assertEqual([c["title"] for c in data["results"]], ["Better Call Saul"])
+        typeahead.suggest("sau")
+        self.assertEqual(mock_search.call_count, 2)
+
+    def test_index_reads_card_fields_from_the_store(self):
+        TmdbTitle.objects.create(
+            media_type="movie", tmdb_id=7, title="Brazil", poster_path="",
+            data={"poster_path": "/b.jpg", "vote_average": 7.8, "release_date": "1985-02-20"},
+            fetched_at=timezone.now(),
+        )
+
+        card = typeahead.get_index().search("braz")[0]
+        self.assertEqual(card, {
+            "id": 7, "media_type": "movie", "title": "Brazil",
+            "poster_path": "/b.jpg", "vote_average": 7.8, "release_date": "1985-02-20",
+        })
+
+    @override_settings(TMDB_TYPEAHEAD_REBUILD=0)
+    @patch("catalog.services.typeahead.threading.Thread")
+    def test_expired_index_keeps_serving_while_rebuilding(self, mock_thread):
+        old = typeahead.get_index()
+        TmdbTitle.objects.create(media_type="movie", tmdb_id=8, title="Brick", fetched_at=timezone.now())
+
+        self.assertIs(typeahead.get_index(), old)
+        self.assertIs(typeahead.get_index(), old)
+        mock_thread.assert_called_once()
+
+        with patch("catalog.services.typeahead.connections.close_all"):
+            mock_thread.call_args.kwargs["target"]()
+        self.assertIsNot(typeahead.get_index(), old)
+        self.assertEqual([c["title"] for c in typeahead.get_index().search("bri")], ["Brick"])
+
+    def test_short_query(self):
+        self.assertEqual(typeahead.suggest("b")["results"], [])
+
+    def test_endpoint(self):
+        response = APIClient().get("/api/catalog/tmdb/typeahead/", {"q": "bre", "limit": 1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c["title"] for c in response.data["results"]], ["Bread"])
+        self.assertIn("public", response["Cache-Control"])
@@ -1,24 +1,32 @@
 # backend/catalog/urls.py
+from django.conf import settings
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 from .views import ContentViewSet
-from catalog import views_tmdb, views_wishlist
+from catalog import views_tmdb, views_tmdb_async, views_wishlist
 
 router = DefaultRouter()
 router.register(r"contents", ContentViewSet, basename="content")
 
+# TMDB proxy views: async variants when running under ASGI
+proxy = views_tmdb_async if settings.TMDB_ASYNC_VIEWS else views_tmdb
+
 urlpatterns = router.urls + [
     # TMDB proxy (public)
-    path("tmdb/trending/movies/", views_tmdb.trending_movies),
-    path("tmdb/trending/tv/", views_tmdb.trending_tv),
-    path("tmdb/popular/movies/", views_tmdb.popular_movies),
-    path("tmdb/popular/tv/", views_tmdb.popular_tv),
-    path("tmdb/top-rated/movies/", views_tmdb.top_rated_movies),
-    path("tmdb/top-rated/tv/", views_tmdb.top_rated_tv),
-    path("tmdb/now-playing/", views_tmdb.now_playing_movies),
-    path("tmdb/movie/<int:movie_id>/", views_tmdb.movie_details),
-    path("tmdb/tv/<int:tv_id>/", views_tmdb.tv_details),
-    path("tmdb/search/", views_tmdb.search_tmdb),
+    path("tmdb/trending/movies/", proxy.trending_movies),
+    path("tmdb/trending/tv/", proxy.trending_tv),
+    path("tmdb/popular/movies/", proxy.popular_movies),
+    path("tmdb/popular/tv/", proxy.popular_tv),
+    path("tmdb/top-rated/movies/", proxy.top_rated_movies),
+    path("tmdb/top-rated/tv/", proxy.top_rated_tv),
+    path("tmdb/now-playing/", proxy.now_playing_movies),
+    path("tmdb/movie/<int:movie_id>/", proxy.movie_details),
+    path("tmdb/tv/<int:tv_id>/", proxy.tv_details),
+    path("tmdb/search/", proxy.search_tmdb),
+    path("tmdb/typeahead/", views_tmdb.search_typeahead),
+    path("tmdb/home/", proxy.home),
+    path("tmdb/health/", views_tmdb.tmdb_health),
+    path("tmdb/stats/", views_tmdb.tmdb_stats),
 
     # Wishlist
     path("wishlist/", views_wishlist.wishlist_list),
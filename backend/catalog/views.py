@@ -1,10 +1,46 @@
+import logging
+
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 
+from .filters import LibrarySearchFilter
+from .http_cache import conditional_library_response
 from .models import Content, Season, Episode
-from .serializers import ContentSerializer, SeasonSerializer, EpisodeSerializer
-from .services.tmdb import fetch_tmdb_show_and_create, search_tmdb_by_query
+from .pagination import LibraryCursorPagination
+from .serializers import (
+    BulkImportSerializer,
+    DUPLICATE_TMDB_ID,
+    ContentSerializer,
+    ContentSummarySerializer,
+    EpisodeOperationsSerializer,
+    EpisodeSerializer,
+    SeasonSerializer,
+)
+from .services.library import library_stats, library_version
+from .services.progress import apply_episode_operations
+from .services import tmdb_http
+from .services.tmdb import bulk_import, fetch_tmdb_show_and_create, search_tmdb_by_query
+
+
+logger = logging.getLogger(__name__)
+
+
+def tmdb_unavailable_response():
+    """
+    Fast 503 while the TMDB breaker is open or the rate limit is exhausted,
+    as the proxy views answer (see views_tmdb.safe_tmdb_response).
+    """
+    return Response(
+        {"detail": "TMDB service unavailable"},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(max(1, tmdb_http.breaker.retry_after()))},
+    )
 
 
 class IsOwner(permissions.BasePermission):
@@ -12,18 +48,91 @@ class IsOwner(permissions.BasePermission):
         return getattr(obj, "owner", None) == request.user
 
 
+def with_nested(qs):
+    """
+    Prefetch seasons/episodes for the nested ContentSerializer so a page is
+    serialized with a constant number of queries. Progress is read from the
+    denormalized counters on Content.
+    """
+    return qs.select_related("owner").prefetch_related(
+        Prefetch("seasons", queryset=Season.objects.prefetch_related("episodes"))
+    )
+
+
 class ContentViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Content. All endpoints require authentication.
     """
     serializer_class = ContentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, LibrarySearchFilter]
+    filterset_fields = ["type", "status", "tmdb_id", "platform"]
+    pagination_class = LibraryCursorPagination
 
     def get_queryset(self):
-        return Content.objects.filter(owner=self.request.user).order_by("-created_at")
+        qs = Content.objects.filter(owner=self.request.user).order_by("-created_at", "-id")
+        if self.is_summary():
+            qs = qs.only(*ContentSummarySerializer.load_fields)
+        elif self.action in ("list", "retrieve"):
+            qs = with_nested(qs)
+        return qs
+
+    def is_summary(self) -> bool:
+        """
+        ?view=summary on list: poster cards without nested seasons; load
+        those via retrieve or the seasons action.
+        """
+        return self.action == "list" and self.request.query_params.get("view") == "summary"
+
+    def get_serializer_class(self):
+        if self.is_summary():
+            return ContentSummarySerializer
+        return super().get_serializer_class()
+
+    @property
+    def paginator(self):
+        # search results are ordered by rank, which a (created_at, id)
+        # cursor would discard; they are short, so offsets are fine there
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get(LibrarySearchFilter.search_param, "").strip():
+                self._paginator = LimitOffsetPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def perform_create(self, serializer):
-        serializer.save(owner=self.request.user)
+        self._save_unique(serializer, owner=self.request.user)
+
+    def perform_update(self, serializer):
+        self._save_unique(serializer)
+
+    def _save_unique(self, serializer, **kwargs):
+        # ContentSerializer.validate catches duplicates up front; this covers
+        # a concurrent write of the same tmdb_id between check and save
+        try:
+            with transaction.atomic():
+                serializer.save(**kwargs)
+        except IntegrityError:
+            raise ValidationError({"tmdb_id": [DUPLICATE_TMDB_ID]})
+
+    # Reads are validated against the user's library version (ETag / 304).
+    def list(self, request, *args, **kwargs):
+        parent = super().list
+        return conditional_library_response(request, lambda: parent(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        parent = super().retrieve
+        return conditional_library_response(request, lambda: parent(request, *args, **kwargs))
+
+    # ---------------------------------------------------
+    # GET /api/catalog/contents/stats/
+    # ---------------------------------------------------
+    @action(detail=False, methods=["get"])
+    def stats(self, request):
+        version = library_version(request.user.pk)
+        return conditional_library_response(
+            request, lambda: Response(library_stats(request.user.pk, version)), version
+        )
 
     # ---------------------------------------------------
     # GET /api/catalog/contents/{id}/seasons/
@@ -38,7 +147,11 @@ class ContentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        seasons = Season.objects.filter(content=content).order_by("season_number")
+        seasons = (
+            Season.objects.filter(content=content)
+            .prefetch_related("episodes")
+            .order_by("season_number")
+        )
         serializer = SeasonSerializer(seasons, many=True)
         return Response(serializer.data)
 
@@ -65,9 +178,11 @@ class ContentViewSet(viewsets.ModelViewSet):
         season_number = int(season_number)
         episode_number = int(episode_number)
 
-        season, _ = Season.objects.get_or_create(
+        season, season_created = Season.objects.get_or_create(
             content=content, season_number=season_number
         )
+        if season_created:
+            content.recalculate_progress()
 
         episode, _ = Episode.objects.get_or_create(
             season=season,
@@ -102,22 +217,42 @@ class ContentViewSet(viewsets.ModelViewSet):
 
         season_number = int(season_number)
 
-        season, _ = Season.objects.get_or_create(
+        season, season_created = Season.objects.get_or_create(
             content=content,
             season_number=season_number,
         )
-
-        if season.episodes_count:
-            existing = season.episodes.count()
-            for i in range(existing + 1, season.episodes_count + 1):
-                Episode.objects.get_or_create(
-                    season=season,
-                    episode_number=i,
-                )
+        if season_created:
+            content.recalculate_progress()
 
         season.mark_all_watched()
         return Response({"detail": f"Season {season_number} marked watched"})
 
+    # ---------------------------------------------------
+    # POST /api/catalog/contents/{id}/progress/
+    # body: {"operations": [{"season_number", "episode_number", "watched"}, ...]}
+    # ---------------------------------------------------
+    @action(detail=True, methods=["post"], url_path="progress")
+    def update_progress(self, request, pk=None):
+        content = self.get_object()
+
+        if content.owner != request.user:
+            return Response({"detail": "Not owner"}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = EpisodeOperationsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        operations = serializer.validated_data["operations"]
+
+        apply_episode_operations(content, operations)
+        return Response(
+            {
+                "applied": len(operations),
+                "status": content.status,
+                "watched_episodes": content.watched_episodes,
+                "total_episodes": content.total_episodes,
+                "progress_percent": content.progress_percent(),
+            }
+        )
+
     # ---------------------------------------------------
     # POST /api/catalog/contents/import_tmdb/
     # ---------------------------------------------------
@@ -130,6 +265,7 @@ class ContentViewSet(viewsets.ModelViewSet):
     def import_tmdb(self, request):
         tmdb_id = request.data.get("tmdb_id")
         query = request.data.get("query")
+        media_type = request.data.get("media_type") or None
 
         if not tmdb_id and not query:
             return Response(
@@ -137,6 +273,12 @@ class ContentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        if media_type not in (None, "movie", "tv"):
+            return Response(
+                {"detail": "media_type must be 'movie' or 'tv'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         # ✅ prevent duplicate imports
         if tmdb_id:
             existing = Content.objects.filter(
@@ -155,11 +297,14 @@ class ContentViewSet(viewsets.ModelViewSet):
                 owner=request.user,
                 tmdb_id=tmdb_id,
                 query=query,
+                media_type=media_type,
             )
+        except tmdb_http.TMDBUnavailable:
+            return tmdb_unavailable_response()
         except ValueError as e:
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            print("IMPORT TMDB ERROR:", e)
+            logger.exception("TMDB import failed")
             return Response(
                 {"detail": "Failed to import title", "error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -170,6 +315,41 @@ class ContentViewSet(viewsets.ModelViewSet):
             status=status.HTTP_201_CREATED,
         )
 
+    # ---------------------------------------------------
+    # POST /api/catalog/contents/import_tmdb_bulk/
+    # body: {"items": [{"tmdb_id", "media_type"}], "tmdb_ids": [...], "queries": [...]}
+    # ---------------------------------------------------
+    @action(detail=False, methods=["post"], url_path="import_tmdb_bulk")
+    def import_tmdb_bulk(self, request):
+        serializer = BulkImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # per-title TMDB failures are reported per item; an open breaker
+        # would fail them all, so answer that up front
+        if tmdb_http.breaker.state == tmdb_http.CircuitBreaker.OPEN:
+            return tmdb_unavailable_response()
+
+        try:
+            results = bulk_import(
+                owner=request.user,
+                items=serializer.validated_data["items"],
+                tmdb_ids=serializer.validated_data["tmdb_ids"],
+                queries=serializer.validated_data["queries"],
+            )
+        except tmdb_http.TMDBUnavailable:
+            return tmdb_unavailable_response()
+        except Exception:
+            logger.exception("Bulk TMDB import failed")
+            return Response(
+                {"detail": "Failed to import titles"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        summary = {}
+        for r in results:
+            summary[r["status"]] = summary.get(r["status"], 0) + 1
+        return Response({"summary": summary, "results": results})
+
     # ---------------------------------------------------
     # GET /api/catalog/contents/tmdb_search/?q=...
     # ---------------------------------------------------
@@ -184,6 +364,8 @@ class ContentViewSet(viewsets.ModelViewSet):
 
         try:
             results = search_tmdb_by_query(q)
+        except tmdb_http.TMDBUnavailable:
+            return tmdb_unavailable_response()
         except Exception as e:
             return Response(
                 {"detail": "TMDB search failed", "error": str(e)},
@@ -1,14 +1,29 @@
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 from rest_framework import status
 
-from catalog.services import tmdb_proxy
+from catalog.http_cache import shared_cache
+from catalog.services import tmdb_cache, tmdb_proxy, tmdb_http, typeahead
+from catalog.services.tmdb_fields import parse_fields, project
 
 
-def safe_tmdb_response(func, *args):
+def safe_tmdb_response(request, endpoint, func, *args):
+    """
+    Run a tmdb_proxy helper, apply ?fields= and the shared cache headers of
+    its TTL class (see tmdb_cache.DEFAULT_TTLS).
+    """
     try:
-        return Response(func(*args))
+        data = project(func(*args), parse_fields(request.query_params.get("fields")))
+        return shared_cache(Response(data), data, endpoint)
+    except tmdb_http.TMDBNotFound:
+        return Response({"error": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+    except tmdb_http.TMDBUnavailable as e:
+        return Response(
+            {"error": "TMDB service unavailable", "details": str(e)},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(max(1, tmdb_http.breaker.retry_after()))},
+        )
     except Exception as e:
         return Response(
             {
@@ -22,67 +37,68 @@ def safe_tmdb_response(func, *args):
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def trending_movies(request):
-    return safe_tmdb_response(tmdb_proxy.trending_movies)
+    return safe_tmdb_response(request, "trending", tmdb_proxy.trending_movies)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def trending_tv(request):
-    return safe_tmdb_response(tmdb_proxy.trending_tv)
+    return safe_tmdb_response(request, "trending", tmdb_proxy.trending_tv)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def popular_movies(request):
-    return safe_tmdb_response(tmdb_proxy.popular_movies)
+    return safe_tmdb_response(request, "lists", tmdb_proxy.popular_movies)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def popular_tv(request):
-    return safe_tmdb_response(tmdb_proxy.popular_tv)
+    return safe_tmdb_response(request, "lists", tmdb_proxy.popular_tv)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def top_rated_movies(request):
-    return safe_tmdb_response(tmdb_proxy.top_rated_movies)
+    return safe_tmdb_response(request, "lists", tmdb_proxy.top_rated_movies)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def top_rated_tv(request):
-    return safe_tmdb_response(tmdb_proxy.top_rated_tv)
+    return safe_tmdb_response(request, "lists", tmdb_proxy.top_rated_tv)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def now_playing_movies(request):
-    return safe_tmdb_response(tmdb_proxy.now_playing_movies)
+    return safe_tmdb_response(request, "lists", tmdb_proxy.now_playing_movies)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def movie_genres(request):
-    return safe_tmdb_response(tmdb_proxy.movie_genres)
+    return safe_tmdb_response(request, "genres", tmdb_proxy.movie_genres)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def tv_genres(request):
-    return safe_tmdb_response(tmdb_proxy.tv_genres)
+    return safe_tmdb_response(request, "genres", tmdb_proxy.tv_genres)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def movie_details(request, movie_id):
-    return safe_tmdb_response(tmdb_proxy.movie_details, movie_id)
+    return safe_tmdb_response(request, "details", tmdb_proxy.movie_details, movie_id)
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def tv_details(request, tv_id):
-    return safe_tmdb_response(tmdb_proxy.tv_details, tv_id)
+    return safe_tmdb_response(request, "details", tmdb_proxy.tv_details, tv_id)
+
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
@@ -90,4 +106,50 @@ def search_tmdb(request):
     q = request.query_params.get("q")
     if not q:
         return Response({"results": []})
-    return Response(tmdb_proxy.search_multi(q))
+    return safe_tmdb_response(request, "search", tmdb_proxy.search_multi, q)
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def search_typeahead(request):
+    """
+    Title suggestions while typing; see services.typeahead.
+    """
+    try:
+        limit = min(max(int(request.query_params.get("limit", 10)), 1), 20)
+    except ValueError:
+        limit = 10
+    data = typeahead.suggest(request.query_params.get("q", ""), limit)
+    return shared_cache(Response(data), data, "search")
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def home(request):
+    return safe_tmdb_response(request, "lists", tmdb_proxy.home_feed)
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def tmdb_health(request):
+    """
+    TMDB circuit breaker state. Always 200 so load balancers don't pull
+    instances out of rotation because of an upstream outage.
+    """
+    breaker = tmdb_http.breaker.snapshot()
+    return Response({
+        "status": "degraded" if breaker["state"] == "open" else "ok",
+        "breaker": breaker,
+    })
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def tmdb_stats(request):
+    return Response({
+        "http": tmdb_http.connection_stats(),
+        "cache": tmdb_cache.cache_stats(),
+        "breaker": tmdb_http.breaker.snapshot(),
+        "rate_limit": tmdb_http.limiter.snapshot(),
+        "typeahead": typeahead.typeahead_stats(),
+    })
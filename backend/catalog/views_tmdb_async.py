@@ -0,0 +1,82 @@
+"""
+Async versions of the public TMDB proxy views (see views_tmdb).
+
+Used instead of the sync views when settings.TMDB_ASYNC_VIEWS is on and the
+project is served by an ASGI server, e.g.
+    gunicorn moviemate_project.asgi:application -k uvicorn.workers.UvicornWorker
+so one worker can keep hundreds of TMDB calls in flight.
+"""
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from catalog.http_cache import shared_cache
+from catalog.services import tmdb_async, tmdb_http
+from catalog.services.tmdb_cache import endpoint_class
+from catalog.services.tmdb_fields import parse_fields, project
+
+
+async def safe_tmdb_response(request, endpoint, coro):
+    try:
+        data = project(await coro, parse_fields(request.GET.get("fields")))
+        return shared_cache(JsonResponse(data, safe=False), data, endpoint)
+    except tmdb_http.TMDBNotFound:
+        return JsonResponse({"error": "Not found"}, status=404)
+    except tmdb_http.TMDBUnavailable as e:
+        return JsonResponse(
+            {"error": "TMDB service unavailable", "details": str(e)},
+            status=503,
+            headers={"Retry-After": str(max(1, tmdb_http.breaker.retry_after()))},
+        )
+    except Exception as e:
+        return JsonResponse(
+            {
+                "error": "TMDB service unavailable",
+                "details": str(e),
+            },
+            status=503,
+        )
+
+
+def _list_view(name):
+    path = tmdb_async.LIST_PATHS[name]
+
+    @require_GET
+    async def view(request):
+        return await safe_tmdb_response(request, endpoint_class(path), tmdb_async.tmdb_aget(path))
+
+    view.__name__ = name
+    return view
+
+
+trending_movies = _list_view("trending_movies")
+trending_tv = _list_view("trending_tv")
+popular_movies = _list_view("popular_movies")
+popular_tv = _list_view("popular_tv")
+top_rated_movies = _list_view("top_rated_movies")
+top_rated_tv = _list_view("top_rated_tv")
+now_playing_movies = _list_view("now_playing_movies")
+movie_genres = _list_view("movie_genres")
+tv_genres = _list_view("tv_genres")
+
+
+@require_GET
+async def movie_details(request, movie_id):
+    return await safe_tmdb_response(request, "details", tmdb_async.details("movie", movie_id))
+
+
+@require_GET
+async def tv_details(request, tv_id):
+    return await safe_tmdb_response(request, "details", tmdb_async.details("tv", tv_id))
+
+
+@require_GET
+async def search_tmdb(request):
+    q = request.GET.get("q")
+    if not q:
+        return JsonResponse({"results": []})
+    return await safe_tmdb_response(request, "search", tmdb_async.search_multi(q))
+
+
+@require_GET
+async def home(request):
+    return await safe_tmdb_response(request, "lists", tmdb_async.home_feed())
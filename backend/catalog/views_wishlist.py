@@ -3,15 +3,22 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 
+from .http_cache import conditional_library_response
 from .models import Wishlist
+from .pagination import LibraryCursorPagination
 from .serializers import WishlistSerializer
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def wishlist_list(request):
-    qs = Wishlist.objects.filter(user=request.user)
-    return Response(WishlistSerializer(qs, many=True).data)
+    def respond():
+        qs = Wishlist.objects.filter(user=request.user)
+        paginator = LibraryCursorPagination()
+        page = paginator.paginate_queryset(qs, request)
+        return paginator.get_paginated_response(WishlistSerializer(page, many=True).data)
+
+    return conditional_library_response(request, respond)
 
 
 @api_view(["POST"])
@@ -0,0 +1,140 @@
+"""
+Load test for the TMDB proxy: sync (WSGI) vs async (ASGI) deployments.
+
+1) Start a fake TMDB with a fixed upstream latency:
+
+    python loadtest/tmdb_proxy.py fake-tmdb --port 9000 --latency 0.25
+
+2) Start the app twice against it (two shells):
+
+    # sync: 2 workers x 4 threads
+    TMDB_API_BASE=http://127.0.0.1:9000 TMDB_API_KEY=x \\
+        gunicorn moviemate_project.wsgi:application -w 2 --threads 4 -b 127.0.0.1:8001
+
+    # async: 2 uvicorn workers
+    TMDB_API_BASE=http://127.0.0.1:9000 TMDB_API_KEY=x TMDB_ASYNC_VIEWS=True \\
+        gunicorn moviemate_project.asgi:application -w 2 -k uvicorn.workers.UvicornWorker -b 127.0.0.1:8002
+
+3) Fire the same load at both and compare:
+
+    python loadtest/tmdb_proxy.py run --base http://127.0.0.1:8001 -c 200 -n 2000
+    python loadtest/tmdb_proxy.py run --base http://127.0.0.1:8002 -c 200 -n 2000
+
+Each request searches a unique query, so every one misses the cache and
+really waits on the (fake) upstream.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+
+# -------------------------------------------------------------------
+# FAKE TMDB
+# -------------------------------------------------------------------
+
+async def fake_tmdb(port: int, latency: float):
+    """
+    Minimal keep-alive HTTP/1.1 server that answers every GET with the same
+    search payload after `latency` seconds. asyncio-based so the fake
+    upstream itself is never the bottleneck.
+    """
+    body = json.dumps({
+        "page": 1,
+        "results": [
+            {"id": i, "media_type": "movie", "title": f"Movie {i}", "poster_path": "/p.jpg"}
+            for i in range(20)
+        ],
+    }).encode()
+    head = (
+        "HTTP/1.1 200 OK\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "\r\n"
+    ).encode()
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                if not request:
+                    break
+                await asyncio.sleep(latency)
+                writer.write(head + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", port, backlog=4096)
+    print(f"fake TMDB on http://127.0.0.1:{port} (latency {latency}s)")
+    async with server:
+        await server.serve_forever()
+
+
+# -------------------------------------------------------------------
+# LOAD GENERATOR
+# -------------------------------------------------------------------
+
+async def run(base: str, concurrency: int, total: int):
+    url = f"{base.rstrip('/')}/api/catalog/tmdb/search/"
+    latencies, errors = [], 0
+    sem = asyncio.Semaphore(concurrency)
+    run_id = int(time.time())
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+        async def one(i):
+            nonlocal errors
+            async with sem:
+                start = time.perf_counter()
+                try:
+                    resp = await client.get(url, params={"q": f"load-{run_id}-{i}"})
+                    if resp.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    print(f"{url}")
+    print(f"  requests {total}  concurrency {concurrency}  errors {errors}")
+    print(f"  throughput {total / elapsed:.1f} req/s  wall {elapsed:.2f}s")
+    print(f"  latency ms  p50 {pct(0.50):.0f}  p95 {pct(0.95):.0f}  p99 {pct(0.99):.0f}"
+          f"  mean {statistics.mean(latencies) * 1000:.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    fake = sub.add_parser("fake-tmdb", help="serve a fake TMDB API")
+    fake.add_argument("--port", type=int, default=9000)
+    fake.add_argument("--latency", type=float, default=0.25)
+
+    load = sub.add_parser("run", help="load the proxy search endpoint")
+    load.add_argument("--base", required=True, help="app base URL, e.g. http://127.0.0.1:8001")
+    load.add_argument("-c", "--concurrency", type=int, default=100)
+    load.add_argument("-n", "--requests", type=int, default=1000)
+
+    args = parser.parse_args()
+    if args.cmd == "fake-tmdb":
+        asyncio.run(fake_tmdb(args.port, args.latency))
+    else:
+        asyncio.run(run(args.base, args.concurrency, args.requests))
+
+
+if __name__ == "__main__":
+    main()
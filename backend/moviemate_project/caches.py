@@ -0,0 +1,51 @@
+"""
+CACHES["default"] from a single CACHE_URL, in the spirit of DATABASE_URL:
+
+    locmem://                       per-process memory (default, dev only)
+    redis://host:6379/1             shared, recommended in production
+    rediss://:password@host:6380/0  (the redis package is required)
+    memcached://host:11211          shared (pip install pymemcache)
+    file:///var/tmp/moviemate-cache files on local disk, no services
+    db://moviemate_cache            table in the default database, e.g. SQLite
+                                    locally (run `manage.py createcachetable`)
+
+Multi-worker deployments need a shared backend (redis / memcached / db):
+per-user library versions and single TMDB cache entries rely on it.
+"""
+from urllib.parse import urlsplit
+
+SCHEMES = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "rediss": "django.core.cache.backends.redis.RedisCache",
+    "memcached": "django.core.cache.backends.memcached.PyMemcacheCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "db": "django.core.cache.backends.db.DatabaseCache",
+}
+
+
+def cache_from_url(url: str, key_prefix: str = "", version: int = 1) -> dict:
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in SCHEMES:
+        raise ValueError(f"Unsupported CACHE_URL scheme: {scheme!r}")
+
+    if scheme in ("redis", "rediss"):
+        location = url
+    elif scheme == "memcached":
+        location = parts.netloc
+    elif scheme == "file":
+        location = parts.path
+    elif scheme == "db":
+        location = parts.netloc or parts.path.strip("/") or "moviemate_cache"
+    else:
+        location = parts.netloc or "moviemate"
+
+    return {
+        "BACKEND": SCHEMES[scheme],
+        "LOCATION": location,
+        # namespaced + versioned keys: bump CACHE_VERSION to drop every
+        # entry at once (e.g. after changing a cached payload's shape)
+        "KEY_PREFIX": key_prefix,
+        "VERSION": version,
+    }
@@ -1,10 +1,11 @@
 # moviemate_project/settings.py
-import os
 from pathlib import Path
 from decouple import config, Csv
 import dj_database_url
 from datetime import timedelta
 
+from moviemate_project.caches import cache_from_url
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # SECURITY
@@ -42,6 +43,7 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',  # ETag / 304 for public responses
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -78,10 +80,10 @@ DATABASES = {
 
 # Password validation (keep defaults)
 AUTH_PASSWORD_VALIDATORS = [
-    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',},
-    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',},
-    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',},
-    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',},
+    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
 # Internationalization
@@ -144,15 +146,58 @@ SIMPLE_JWT = {
 
 # TMDB key
 TMDB_API_KEY = config('TMDB_API_KEY', default='')
+TMDB_API_BASE = config('TMDB_API_BASE', default='https://api.themoviedb.org/3')
+
+# Serve the TMDB proxy with async views + httpx (deploy with an ASGI server)
+TMDB_ASYNC_VIEWS = config('TMDB_ASYNC_VIEWS', default=False, cast=bool)
+
+# TMDB HTTP connection pool (shared by all outbound TMDB calls)
+TMDB_HTTP_POOL_SIZE = config('TMDB_HTTP_POOL_SIZE', default=10, cast=int)
+TMDB_HTTP_KEEPALIVE = config('TMDB_HTTP_KEEPALIVE', default=True, cast=bool)
+
+# Shared TMDB metadata store: refresh titles older than this (seconds)
+TMDB_METADATA_MAX_AGE = {
+    'movie': config('TMDB_METADATA_MAX_AGE_MOVIE', default=60 * 60 * 24 * 14, cast=int),
+    'tv': config('TMDB_METADATA_MAX_AGE_TV', default=60 * 60 * 24, cast=int),
+}
+
+# TMDB circuit breaker: open when >= ERROR_RATE of the calls in the last
+# WINDOW seconds failed (at least MIN_REQUESTS calls), probe after RESET_TIMEOUT
+TMDB_BREAKER_ERROR_RATE = config('TMDB_BREAKER_ERROR_RATE', default=0.5, cast=float)
+TMDB_BREAKER_MIN_REQUESTS = config('TMDB_BREAKER_MIN_REQUESTS', default=10, cast=int)
+TMDB_BREAKER_WINDOW = config('TMDB_BREAKER_WINDOW', default=30, cast=int)
+TMDB_BREAKER_RESET_TIMEOUT = config('TMDB_BREAKER_RESET_TIMEOUT', default=30, cast=int)
+# Outbound TMDB rate limit (requests/second). Background work (bulk import,
+# cache warming) leaves RESERVE tokens for interactive requests. SHARED
+# counts the budget in the cache backend, across all worker processes.
+TMDB_RATE_LIMIT = config('TMDB_RATE_LIMIT', default=40, cast=int)
+TMDB_RATE_LIMIT_BURST = config('TMDB_RATE_LIMIT_BURST', default=40, cast=int)
+TMDB_RATE_LIMIT_RESERVE = config('TMDB_RATE_LIMIT_RESERVE', default=10, cast=int)
+TMDB_RATE_LIMIT_SHARED = config('TMDB_RATE_LIMIT_SHARED', default=False, cast=bool)
+# Longest an interactive request waits for a token before answering 503
+TMDB_RATE_LIMIT_MAX_WAIT = config('TMDB_RATE_LIMIT_MAX_WAIT', default=5, cast=float)
+# How long TMDB 404s are remembered
+TMDB_NOT_FOUND_TTL = config('TMDB_NOT_FOUND_TTL', default=600, cast=int)
+
+# Typeahead: TMDB is searched only below MIN_LOCAL local prefix hits; the
+# local index is rebuilt from the metadata store every REBUILD seconds
+TMDB_TYPEAHEAD_MIN_LOCAL = config('TMDB_TYPEAHEAD_MIN_LOCAL', default=5, cast=int)
+TMDB_TYPEAHEAD_REBUILD = config('TMDB_TYPEAHEAD_REBUILD', default=600, cast=int)
+TMDB_TYPEAHEAD_MAX_TITLES = config('TMDB_TYPEAHEAD_MAX_TITLES', default=100000, cast=int)
+
+# Max concurrent TMDB fetches per bulk import request
+TMDB_IMPORT_WORKERS = config('TMDB_IMPORT_WORKERS', default=8, cast=int)
 
 # Useful dev settings
 if DEBUG:
     INTERNAL_IPS = ['127.0.0.1']
 
-# Simple in-memory cache for development
+# Cache backend from CACHE_URL (see moviemate_project/caches.py).
+# Defaults to per-process memory; use redis:// or memcached:// in production.
 CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "moviemate-dev-cache",
-    }
-}
\ No newline at end of file
+    "default": cache_from_url(
+        config('CACHE_URL', default='locmem://moviemate-dev-cache'),
+        key_prefix=config('CACHE_KEY_PREFIX', default='moviemate'),
+        version=config('CACHE_VERSION', default=1, cast=int),
+    )
+}
@@ -26,11 +26,23 @@ export const toggleEpisode = (contentId, seasonNumber, episodeNumber) =>
 
 export const getContentByTMDB = (tmdbId) =>
   api
-    .get(`/catalog/contents/?tmdb_id=${tmdbId}`)
+    .get(`/catalog/contents/?tmdb_id=${tmdbId}&view=summary`)
     .then(res => res.data.results?.[0]);
 
-export const importFromTMDB = (tmdbId) =>
+// Full-text search in the user's own library, best match first.
+// filters: { type, status }
+export const searchLibrary = (query, filters = {}) =>
+  api
+    .get("/catalog/contents/", { params: { search: query, view: "summary", ...filters } })
+    .then(res => res.data.results ?? res.data);
+
+// { total, by_status, by_type, by_platform, episodes, rated, average_rating }
+export const getLibraryStats = () =>
+  api.get("/catalog/contents/stats/").then(res => res.data);
+
+export const importFromTMDB = (tmdbId, mediaType) =>
   api.post("/catalog/contents/import_tmdb/", {
     tmdb_id: tmdbId,
+    media_type: mediaType,
   }).then(res => res.data);
 
@@ -20,6 +20,10 @@ const safeGet = async (url) => {
   }
 };
 
+// All Home sections in one round trip: { sections: { name: { results } } }
+export const getHomeFeed = () =>
+  safeGet("/catalog/tmdb/home/");
+
 export const getTrendingMovies = () =>
   safeGet("/catalog/tmdb/trending/movies/");
 
@@ -53,6 +57,10 @@ export const getMovieDetails = (id) =>
 export const getTVDetails = (id) =>
   safeGet(`/catalog/tmdb/tv/${id}/`);
 
+// Title suggestions while typing: { results: [cards], source }
+export const getTypeahead = (query) =>
+  safeGet(`/catalog/tmdb/typeahead/?q=${encodeURIComponent(query)}`);
+
 export const searchTMDB = (query) =>
   api
     .get(`/catalog/tmdb/search/?q=${encodeURIComponent(query)}`)
@@ -1,7 +1,9 @@
 import api from "./axios";
 
-export const getWishlist = () =>
-  api.get("/catalog/wishlist/").then(res => res.data);
+// One page, newest first: { results, next }. Pass the previous page's
+// `next` URL to continue.
+export const getWishlist = (next = null) =>
+  api.get(next || "/catalog/wishlist/").then(res => res.data);
 
 export const addToWishlist = (item) =>
   api.post("/catalog/wishlist/add/", {
@@ -95,7 +95,7 @@ export default function DetailsModal({ item, open, onClose }) {
   onClick={async () => {
     try {
       // 🔥 AUTO IMPORT
-      await importFromTMDB(item.id);
+      await importFromTMDB(item.id, item.media_type);
 
       // ➜ Go to watch page
       navigate(`/watch/${item.media_type}/${item.id}`);
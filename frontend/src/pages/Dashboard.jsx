@@ -1,13 +1,49 @@
-import React from "react";
+import React, { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
+import { getLibraryStats } from "../api/catalog";
 
 export default function Dashboard() {
+  const [stats, setStats] = useState(null);
+
+  useEffect(() => {
+    getLibraryStats().then(setStats).catch(() => {});
+  }, []);
+
   return (
     <div className="max-w-4xl mx-auto p-6">
       <h1 className="text-3xl font-bold mb-6">
         Dashboard
       </h1>
 
+      {stats && (
+        <div className="grid grid-cols-2 md:grid-cols-4 gap-4 mb-6">
+          <div className="bg-gray-800 p-4 rounded">
+            <p className="text-2xl font-bold">{stats.total}</p>
+            <p className="text-xs text-gray-400">
+              {stats.by_type.movie} movies · {stats.by_type.tv} shows
+            </p>
+          </div>
+          <div className="bg-gray-800 p-4 rounded">
+            <p className="text-2xl font-bold">{stats.by_status.watching}</p>
+            <p className="text-xs text-gray-400">
+              watching · {stats.by_status.completed} completed
+            </p>
+          </div>
+          <div className="bg-gray-800 p-4 rounded">
+            <p className="text-2xl font-bold">{stats.episodes.watched}</p>
+            <p className="text-xs text-gray-400">episodes watched</p>
+          </div>
+          <div className="bg-gray-800 p-4 rounded">
+            <p className="text-2xl font-bold">
+              {stats.average_rating ?? "–"}
+            </p>
+            <p className="text-xs text-gray-400">
+              average rating ({stats.rated} rated)
+            </p>
+          </div>
+        </div>
+      )}
+
       <div className="grid md:grid-cols-2 gap-6">
         <Link
           to="/wishlist"
@@ -2,17 +2,11 @@
 import React, { useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import api from "../api/axios";
-import { getTrendingMovies } from "../api/tmdbProxy";
+import { getHomeFeed } from "../api/tmdbProxy";
 import Carousel from "../components/Carousel";
 import ContentCard from "../components/ContentCard";
-import { searchTMDB } from "../api/tmdbProxy";
-
-import {
-  getPopularMovies,
-  getTopRatedMovies,
-  getTrendingTV,
-  getNowPlayingMovies
-} from "../api/tmdbProxy";
+import { getTypeahead, searchTMDB } from "../api/tmdbProxy";
+
 import DetailsModal from "../components/DetailsModal";
 
 
@@ -28,25 +22,51 @@ export default function Home() {
   const [searching, setSearching] = useState(false);
 
   const [query, setQuery] = useState("");
+  const [suggestions, setSuggestions] = useState([]);
 
   const navigate = useNavigate();
   const isAuthenticated = !!localStorage.getItem("access_token");
 
   // 🔓 Public TMDB proxy data
 useEffect(() => {
-  getTrendingMovies().then(d => setTrendingMovies(d?.results || []));
-  getPopularMovies().then(d => setPopularMovies(d?.results || []));
-  getTopRatedMovies().then(d => setTopRatedMovies(d?.results || []));
-  getTrendingTV().then(d => setTrendingTV(d?.results || []));
-  getNowPlayingMovies().then(d => setNowPlaying(d?.results || []));
+  getHomeFeed().then(d => {
+    const sections = d?.sections || {};
+    setTrendingMovies(sections.trending_movies?.results || []);
+    setPopularMovies(sections.popular_movies?.results || []);
+    setTopRatedMovies(sections.top_rated_movies?.results || []);
+    setTrendingTV(sections.trending_tv?.results || []);
+    setNowPlaying(sections.now_playing?.results || []);
+  });
 }, []);
 
 
+  // Typeahead: wait for a pause in typing, ignore out-of-order answers
+  useEffect(() => {
+    const q = query.trim();
+    if (q.length < 2) {
+      setSuggestions([]);
+      return;
+    }
+
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      getTypeahead(q).then(d => {
+        if (!cancelled) setSuggestions(d?.results || []);
+      });
+    }, 250);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [query]);
+
+
   // 🔐 User collection
   useEffect(() => {
     if (!isAuthenticated) return;
 
-    api.get("/catalog/contents/")
+    api.get("/catalog/contents/", { params: { view: "summary" } })
       .then(res => setCollection(res.data.results || res.data))
       .catch(() => {});
   }, [isAuthenticated]);
@@ -65,6 +85,7 @@ useEffect(() => {
   onChange={(e) => setQuery(e.target.value)}
   onKeyDown={async (e) => {
     if (e.key === "Enter" && query.trim()) {
+      setSuggestions([]);
       setSearching(true);
       const data = await searchTMDB(query);
       setSearchResults(data.results || []);
@@ -74,6 +95,26 @@ useEffect(() => {
   placeholder="Search movies or TV shows..."
   className="w-full max-w-xl px-4 py-3 rounded bg-gray-800 text-white outline-none"
 />
+{suggestions.length > 0 && (
+  <ul className="w-full max-w-xl mx-auto mt-1 rounded bg-gray-800 text-left">
+    {suggestions.map(item => (
+      <li
+        key={`${item.media_type}-${item.id}`}
+        onClick={() => {
+          setSuggestions([]);
+          setSelectedItem(item);
+        }}
+        className="px-4 py-2 cursor-pointer hover:bg-gray-700"
+      >
+        {item.title}
+        <span className="ml-2 text-xs text-gray-400">
+          {item.media_type === "tv" ? "TV" : "Movie"}
+          {item.release_date ? ` · ${item.release_date.slice(0, 4)}` : ""}
+        </span>
+      </li>
+    ))}
+  </ul>
+)}
 {searching && (
   <p className="text-gray-400 text-center mt-6">
     Searching...
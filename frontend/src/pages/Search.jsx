@@ -13,8 +13,8 @@ setResults(res.data.results)
 }
 
 
-const importItem = async (tmdb_id) => {
-await api.post('/catalog/contents/import_tmdb/', { tmdb_id })
+const importItem = async (tmdb_id, media_type) => {
+await api.post('/catalog/contents/import_tmdb/', { tmdb_id, media_type })
 alert('Imported — refresh home to see it')
 }
 
@@ -34,7 +34,7 @@ return (
 <h3 className="font-semibold">{r.title} <span className="text-xs text-gray-400">({r.media_type})</span></h3>
 <p className="text-sm text-gray-500">{r.overview}</p>
 <div className="mt-2 flex gap-2">
-<button onClick={()=>importItem(r.id)} className="px-2 py-1 bg-green-600 text-white rounded">Import</button>
+<button onClick={()=>importItem(r.id, r.media_type)} className="px-2 py-1 bg-green-600 text-white rounded">Import</button>
 </div>
 </div>
 ))}
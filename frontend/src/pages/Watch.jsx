@@ -60,7 +60,7 @@ export default function Watch() {
         // 2️⃣ auto-import if missing
         if (!content) {
           if (!contentId) {
-          await importFromTMDB(tmdbId);
+          await importFromTMDB(tmdbId, type);
            }
           content = await getContentByTMDB(tmdbId);
         }
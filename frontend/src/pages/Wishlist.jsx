@@ -4,12 +4,22 @@ import DetailsModal from "../components/DetailsModal";
 
 export default function Wishlist() {
   const [items, setItems] = useState([]);
+  const [next, setNext] = useState(null);
   const [selectedItem, setSelectedItem] = useState(null);
 
   useEffect(() => {
-    getWishlist().then(setItems);
+    getWishlist().then(data => {
+      setItems(data.results ?? data);
+      setNext(data.next ?? null);
+    });
   }, []);
 
+  const loadMore = async () => {
+    const data = await getWishlist(next);
+    setItems(prev => [...prev, ...data.results]);
+    setNext(data.next);
+  };
+
   const removeItem = async (tmdb_id) => {
     await removeFromWishlist(tmdb_id);
     setItems(items.filter(i => i.tmdb_id !== tmdb_id));
@@ -65,6 +75,15 @@ export default function Wishlist() {
         ))}
       </div>
 
+      {next && (
+        <button
+          onClick={loadMore}
+          className="mt-6 px-4 py-2 rounded bg-gray-800 hover:bg-gray-700"
+        >
+          Load more
+        </button>
+      )}
+
       <DetailsModal
         item={selectedItem}
         open={!!selectedItem}